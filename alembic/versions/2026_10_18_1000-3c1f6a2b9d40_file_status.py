@@ -0,0 +1,33 @@
+"""file validation status
+
+Revision ID: 3c1f6a2b9d40
+Revises: 9eeff939ad5a
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f6a2b9d40"
+down_revision: Union[str, None] = "9eeff939ad5a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("files") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "status", sa.String(length=16), nullable=False, server_default="done"
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("files") as batch_op:
+        batch_op.drop_column("status")
@@ -0,0 +1,45 @@
+"""validation result cache
+
+Revision ID: 8a4e2d7c5b13
+Revises: 3c1f6a2b9d40
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e2d7c5b13"
+down_revision: Union[str, None] = "3c1f6a2b9d40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "validation_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("file_type", sa.String(length=16), nullable=False),
+        sa.Column("target_word", sa.String(length=255), nullable=False),
+        sa.Column("company_name_col", sa.String(length=255), nullable=False),
+        sa.Column("valid", sa.Boolean(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_validation_cache_key",
+        "validation_cache",
+        ["content_hash", "file_type", "target_word", "company_name_col"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_validation_cache_key", table_name="validation_cache")
+    op.drop_table("validation_cache")
@@ -0,0 +1,42 @@
+"""files listing indexes
+
+Revision ID: b7d91e3f0a6c
+Revises: 8a4e2d7c5b13
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d91e3f0a6c"
+down_revision: Union[str, None] = "8a4e2d7c5b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_files_created_at_id", "files", ["created_at", "id"])
+    op.create_index(
+        "ix_files_valid_created_at_id", "files", ["valid", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_files_file_type_created_at_id", "files", ["file_type", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_files_uploader_id_created_at_id",
+        "files",
+        ["uploader_id", "created_at", "id"],
+    )
+    # Covered by the (uploader_id, created_at, id) prefix.
+    op.drop_index("ix_files_uploader_id", table_name="files")
+
+
+def downgrade() -> None:
+    op.create_index("ix_files_uploader_id", "files", ["uploader_id"])
+    op.drop_index("ix_files_uploader_id_created_at_id", table_name="files")
+    op.drop_index("ix_files_file_type_created_at_id", table_name="files")
+    op.drop_index("ix_files_valid_created_at_id", table_name="files")
+    op.drop_index("ix_files_created_at_id", table_name="files")
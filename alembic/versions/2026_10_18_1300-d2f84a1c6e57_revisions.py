@@ -0,0 +1,35 @@
+"""change revisions for listing etags
+
+Revision ID: d2f84a1c6e57
+Revises: b7d91e3f0a6c
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f84a1c6e57"
+down_revision: Union[str, None] = "b7d91e3f0a6c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    revisions = op.create_table(
+        "revisions",
+        sa.Column("name", sa.String(length=32), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(
+        revisions, [{"name": "files", "value": 0}, {"name": "comments", "value": 0}]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("revisions")
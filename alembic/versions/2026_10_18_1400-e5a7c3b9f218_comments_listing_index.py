@@ -0,0 +1,32 @@
+"""comments listing index
+
+Revision ID: e5a7c3b9f218
+Revises: d2f84a1c6e57
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c3b9f218"
+down_revision: Union[str, None] = "d2f84a1c6e57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_comments_file_id_created_at_id",
+        "comments",
+        ["file_id", "created_at", "id"],
+    )
+    # Covered by the (file_id, created_at, id) prefix.
+    op.drop_index("ix_comments_file_id", table_name="comments")
+
+
+def downgrade() -> None:
+    op.create_index("ix_comments_file_id", "comments", ["file_id"])
+    op.drop_index("ix_comments_file_id_created_at_id", table_name="comments")
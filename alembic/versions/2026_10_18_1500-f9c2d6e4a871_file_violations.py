@@ -0,0 +1,44 @@
+"""file violations report
+
+Revision ID: f9c2d6e4a871
+Revises: e5a7c3b9f218
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f9c2d6e4a871"
+down_revision: Union[str, None] = "e5a7c3b9f218"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("files") as batch_op:
+        batch_op.add_column(sa.Column("violation_count", sa.Integer(), nullable=True))
+    op.create_table(
+        "file_violations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("file_id", sa.Integer(), nullable=False),
+        sa.Column("row_number", sa.Integer(), nullable=False),
+        sa.Column("column_name", sa.String(length=255), nullable=True),
+        sa.Column("snippet", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["file_id"], ["files.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_file_violations_file_id_id", "file_violations", ["file_id", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_violations_file_id_id", table_name="file_violations")
+    op.drop_table("file_violations")
+    with op.batch_alter_table("files") as batch_op:
+        batch_op.drop_column("violation_count")
@@ -0,0 +1,29 @@
+"""validation cache matches
+
+Revision ID: a6d3e8f1c247
+Revises: f9c2d6e4a871
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d3e8f1c247"
+down_revision: Union[str, None] = "f9c2d6e4a871"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("validation_cache") as batch_op:
+        batch_op.add_column(sa.Column("matches", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("validation_cache") as batch_op:
+        batch_op.drop_column("matches")
@@ -3,29 +3,38 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.security import (
     create_access_token,
-    get_db,
+    get_db_runner,
     verify_password,
 )
 from app.db.models import User
+from app.db.runner import DbRunner
 from app.schemas.auth import AuthToken, LoginRequest
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=AuthToken)
-def login(
+async def login(
     payload: LoginRequest,
-    db: Annotated[Session, Depends(get_db)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
 ):
-    stmt = select(User).where(User.email == payload.email)
-    user = db.execute(stmt).scalar_one_or_none()
-    if not user or not verify_password(payload.password, user.password_hash):
+    def find(db: Session) -> User | None:
+        stmt = select(User).where(User.email == payload.email)
+        return db.execute(stmt).scalar_one_or_none()
+
+    user = await runner.run(find)
+    # bcrypt is slow on purpose; it must not run on the event loop.
+    if not user or not await run_in_threadpool(
+        verify_password, payload.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
     return AuthToken(
-        access_token=create_access_token(sub=user.email), token_type="bearer"
+        access_token=create_access_token(sub=user.email, user_id=user.id),
+        token_type="bearer",
     )
@@ -1,99 +1,338 @@
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import Row, and_, func, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from app.core.security import get_current_user, get_db
-from app.db.models import Comment, FileUpload, User
+from app.core.conditional import not_modified
+from app.core.events import event_broker
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.responses import fast_json
+from app.core.security import get_current_user, get_db_runner
+from app.db import revisions
+from app.db.models import Comment, FileUpload, User, utcnow
+from app.db.runner import DbRunner
 from app.schemas.comment import (
     CommentCreateRequest,
+    CommentPage,
     CommentResponse,
+    CommentsByFile,
     CommentUpdateRequest,
 )
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
+MAX_BULK_FILES = 500
+
+
+# Listings read these columns plus the author's email as plain rows and
+# build the response dicts from them directly.
+LISTED_COLUMNS = (
+    Comment.id,
+    Comment.text,
+    Comment.user_id,
+    Comment.file_id,
+    Comment.created_at,
+    Comment.updated_at,
+    User.email,
+)
+
+
+def _item(row: Row) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "text": row.text,
+        "user_id": row.user_id,
+        "file_id": row.file_id,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _authors(rows: list[Row]) -> list[dict[str, Any]]:
+    authors = {row.user_id: row.email for row in rows}
+    return [{"id": user_id, "email": email} for user_id, email in authors.items()]
+
+
+def _file_cursor(row: Row) -> str:
+    return f"{row.file_id}:{encode_cursor(row.created_at, row.id)}"
+
+
+def _parse_file_cursor(cursor: str) -> tuple[int, datetime, int]:
+    file_id, _, rest = cursor.partition(":")
+    if not file_id.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return int(file_id), *decode_cursor(rest)
+
+
+def _missing_file(error: IntegrityError) -> bool:
+    message = str(error.orig).lower()
+    if "foreign key" not in message:
+        return False
+    # SQLite does not name the failing key, but the author is the current
+    # user, so only file_id can be missing. Other databases name it.
+    return "file_id" in message or type(error.orig).__module__ == "sqlite3"
+
 
 @router.post(
     "/file/{file_id}",
     response_model=CommentResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_comment(
+async def create_comment(
     file_id: int,
     payload: CommentCreateRequest,
-    db: Annotated[Session, Depends(get_db)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
     user: Annotated[User, Depends(get_current_user)],
 ):
-    file = db.get(FileUpload, file_id)
-    if not file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
-        )
+    def create(db: Session) -> CommentResponse:
+        # No lookup first: the foreign key rejects comments on missing files.
+        # author is left to resolve from the identity map (the current user is
+        # in this session); assigning it would mark the user dirty.
+        comment = Comment(text=payload.text, user_id=user.id, file_id=file_id)
+        db.add(comment)
+        try:
+            db.flush()
+        except IntegrityError as e:
+            db.rollback()
+            if not _missing_file(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+            ) from e
+
+        response = CommentResponse.model_validate(comment)
+        db.commit()
+        return response
+
+    response = await runner.run(create)
+    event_broker.publish("comment.created", response)
+    return response
 
-    comment = Comment(text=payload.text, user_id=user.id, file_id=file.id)
-    db.add(comment)
-    db.flush()
-    stmt = (
-        select(Comment)
-        .options(joinedload(Comment.author))
-        .where(Comment.id == comment.id)
-    )
-    result = db.execute(stmt).scalar_one()
-    db.commit()
-    return result
-
-
-@router.get("/file/{file_id}", response_model=list[CommentResponse])
-def get_comments(
+
+@router.get("/file/{file_id}", response_model=CommentPage)
+async def get_comments(
     file_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
 ):
-    file = db.get(FileUpload, file_id)
-    if not file:
+    def query(db: Session) -> Any:
+        # The tag also covers the files table, so a deleted file is not
+        # answered with 304.
+        unchanged = not_modified(request, response, revisions.etag(db))
+        if unchanged is not None:
+            return unchanged
+
+        # Served from the (file_id, created_at, id) index, oldest first.
+        statement = (
+            select(*LISTED_COLUMNS)
+            .join(User, User.id == Comment.user_id)
+            .where(Comment.file_id == file_id)
+            .order_by(Comment.created_at, Comment.id)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            created_at, comment_id = decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(Comment.created_at, Comment.id) > (created_at, comment_id)
+            )
+        comments = db.execute(statement).all()
+
+        # Any comment proves the file exists; only an empty page looks it up.
+        if not comments:
+            exists = db.execute(select(FileUpload.id).where(FileUpload.id == file_id))
+            if exists.first() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+                )
+
+        next_cursor = None
+        if len(comments) > limit:
+            last = comments[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        page = comments[:limit]
+        content = {
+            "items": [_item(row) for row in page],
+            "authors": _authors(page),
+            "next_cursor": next_cursor,
+        }
+        return fast_json(content, response)
+
+    return await runner.run(query)
+
+
+@router.get("", response_model=CommentsByFile)
+async def get_comments_by_file(
+    request: Request,
+    response: Response,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    file_id: Annotated[list[int] | None, Query(max_length=MAX_BULK_FILES)] = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: Annotated[list[str] | None, Query(max_length=MAX_BULK_FILES)] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    # Comments of many files in one query: the files listed in file_id
+    # and/or the files commented on in [since, until). Each file gets up to
+    # `limit` comments, oldest first, and its own next_cursor; pass that
+    # back in cursor (repeatable) to continue that file only. Unknown file
+    # ids are left out. Like file_id, a window may hold at most
+    # MAX_BULK_FILES files; a wider one is refused rather than cut short.
+    file_id = file_id or []
+    cursor = cursor or []
+    if not file_id and since is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass file_id or since",
         )
 
-    stmt = (
-        select(Comment)
-        .options(joinedload(Comment.author))
-        .where(Comment.file_id == file_id)
-        .order_by(Comment.created_at.asc())
-    )
-    comments = db.execute(stmt).scalars().all()
-    return comments
+    def query(db: Session) -> Any:
+        unchanged = not_modified(request, response, revisions.etag(db))
+        if unchanged is not None:
+            return unchanged
+
+        # Files to list: the given ids, or every file commented on in the window.
+        if file_id:
+            keys = select(FileUpload.id.label("file_id")).where(
+                FileUpload.id.in_(file_id)
+            )
+        else:
+            keys = select(Comment.file_id).where(Comment.created_at >= since).distinct()
+            if until is not None:
+                keys = keys.where(Comment.created_at < until)
+            # One file past the cap is enough to tell the window is too wide.
+            keys = keys.limit(MAX_BULK_FILES + 1)
+            counted = select(func.count()).select_from(keys.subquery())
+            if db.scalar(counted) > MAX_BULK_FILES:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"More than {MAX_BULK_FILES} files have comments in "
+                    "this window; narrow since/until",
+                )
+        keys = keys.subquery()
+
+        # Each file's page is a correlated LIMIT walking the
+        # (file_id, created_at, id) index, so a file with many comments costs
+        # no more than the page; one row past the page tells whether it has more.
+        page = select(Comment.id).where(Comment.file_id == keys.c.file_id)
+        if since is not None:
+            page = page.where(Comment.created_at >= since)
+        if until is not None:
+            page = page.where(Comment.created_at < until)
+        after = {f: (c, i) for f, c, i in map(_parse_file_cursor, cursor)}
+        if after:
+            page = page.where(
+                or_(
+                    Comment.file_id.not_in(list(after)),
+                    *(
+                        and_(
+                            Comment.file_id == f,
+                            tuple_(Comment.created_at, Comment.id)
+                            > (created_at, row_id),
+                        )
+                        for f, (created_at, row_id) in after.items()
+                    ),
+                )
+            )
+        page = page.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+
+        # Outer joins from the listed files keep those that have no comments.
+        outer = bool(file_id)
+        statement = (
+            select(keys.c.file_id.label("key"), *LISTED_COLUMNS)
+            .select_from(keys)
+            .join(
+                Comment,
+                Comment.id.in_(page.correlate(keys).scalar_subquery()),
+                isouter=outer,
+            )
+            .join(User, User.id == Comment.user_id, isouter=outer)
+            .order_by(keys.c.file_id)
+        )
+        statement = statement.order_by(Comment.created_at, Comment.id)
+
+        grouped: dict[int, list[Row]] = {}
+        for row in db.execute(statement):
+            rows = grouped.setdefault(row.key, [])
+            if row.id is not None:
+                rows.append(row)
+
+        files = []
+        shown: list[Row] = []
+        for key, rows in grouped.items():
+            next_cursor = _file_cursor(rows[limit - 1]) if len(rows) > limit else None
+            shown.extend(rows[:limit])
+            files.append(
+                {
+                    "file_id": key,
+                    "comments": [_item(row) for row in rows[:limit]],
+                    "next_cursor": next_cursor,
+                }
+            )
+        return fast_json({"files": files, "authors": _authors(shown)}, response)
+
+    return await runner.run(query)
 
 
 @router.patch("/{comment_id}", response_model=CommentResponse)
-def update_comment(
+async def update_comment(
     comment_id: int,
     payload: CommentUpdateRequest,
-    db: Annotated[Session, Depends(get_db)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
     user: Annotated[User, Depends(get_current_user)],
 ):
-    comment = db.get(Comment, comment_id)
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
-        )
-    if comment.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can edit only your comments",
+    def apply(db: Session) -> CommentResponse:
+        # The ownership check is part of the UPDATE; the row is only looked up
+        # again to tell "missing" from "not yours" when nothing was updated.
+        stmt = (
+            update(Comment)
+            .where(Comment.id == comment_id, Comment.user_id == user.id)
+            .values(text=payload.text, updated_at=utcnow())
         )
+        if db.get_bind().dialect.update_returning:
+            comment = db.execute(stmt.returning(Comment)).scalar_one_or_none()
+        else:
+            comment = db.get(Comment, comment_id) if db.execute(stmt).rowcount else None
+
+        if comment is None:
+            owner_id = db.execute(
+                select(Comment.user_id).where(Comment.id == comment_id)
+            ).scalar_one_or_none()
+            if owner_id is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can edit only your comments",
+            )
+
+        # The author is the current user, already in this session, so this
+        # does not query.
+        response = CommentResponse.model_validate(comment)
+        db.commit()
+        return response
 
-    comment.text = payload.text
-    comment.updated_at = datetime.utcnow()
-    db.flush()
-
-    stmt = (
-        select(Comment)
-        .options(joinedload(Comment.author))
-        .where(Comment.id == comment.id)
-    )
-    updated = db.execute(stmt).scalar_one()
-    db.commit()
-    return updated
+    response = await runner.run(apply)
+    event_broker.publish("comment.updated", response)
+    return response
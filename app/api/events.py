@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import (
+    Subscription,
+    TooManySubscribersError,
+    event_broker,
+    parse_event_id,
+)
+
+router = APIRouter(tags=["events"])
+
+HEARTBEAT_SECONDS = settings.events_heartbeat_seconds
+RETRY_MS = 3000
+
+
+async def _stream(subscription: Subscription) -> AsyncIterator[str]:
+    # An idle client costs one task and an empty queue. The heartbeat
+    # comment keeps proxies from closing the connection and surfaces dead
+    # peers; starlette cancels the stream when the client disconnects.
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                return
+            yield event.encode()
+    finally:
+        event_broker.unsubscribe(subscription)
+
+
+@router.get("/events")
+async def stream_events(
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    # Server-sent events: file.created, file.validated, comment.created,
+    # comment.updated and resync (re-fetch, events were missed). Like the
+    # listings they describe, the stream needs no token.
+    try:
+        subscription = event_broker.subscribe(parse_event_id(last_event_id))
+    except TooManySubscribersError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many event subscribers",
+            headers={"Retry-After": "5"},
+        ) from e
+    return StreamingResponse(
+        _stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
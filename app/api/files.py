@@ -1,89 +1,861 @@
+import asyncio
+import hashlib
 import logging
-import shutil
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import Future
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload, selectinload
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
-from app.core.security import get_current_user, get_db
-from app.db.models import Comment, FileUpload, User
-from app.schemas.file import FileResponse
+from app.core import metrics
+from app.core.batch import BatchEntry, BatchLimitError, spool_batch
+from app.core.conditional import not_modified
+from app.core.config import settings
+from app.core.events import event_broker
+from app.core.jobs import validation_jobs
+from app.core.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    decode_id_cursor,
+    encode_cursor,
+    encode_id_cursor,
+)
+from app.core.responses import fast_json
+from app.core.security import get_current_user, get_db_runner, get_session_factory
+from app.core.streaming import StreamFeed
+from app.core.upload import (
+    ReceivedUpload,
+    UploadFormatError,
+    UploadTooLargeError,
+    receive_upload,
+)
+from app.core.workers import PoolSaturatedError, stream_pool, validation_pool
+from app.db import revisions
+from app.db.models import FileStatus, FileUpload, FileViolation, User, utcnow
+from app.db.runner import DbRunner
+from app.schemas.file import (
+    BatchFileResult,
+    BatchSummary,
+    FilePage,
+    FileResponse,
+    FileStatusResponse,
+    ViolationPage,
+)
+from app.validators.base import BaseFileHandler
+from app.validators.cache import CacheKey, cache_key, validation_cache
+from app.validators.constants import VIOLATION_REPORT_MAX, ValidationResult
 from app.validators.file_validator import FileValidator
 
 router = APIRouter(prefix="/files", tags=["files"])
 
 logger = logging.getLogger(__name__)
 
+BATCH_MEDIA_TYPE = "application/x-ndjson"
+MAX_STATUS_WAIT_SECONDS = 30.0
+MAX_UPLOAD_BYTES = settings.max_upload_bytes
+STATUS_POLL_INTERVAL = 0.5
+INTERRUPTED_REASON = "File validation was interrupted"
+# A job settles its row within the validation timeout; a PENDING row older
+# than this lost its job to a restart or a crash.
+STALE_JOB_SECONDS = settings.validation_timeout_seconds + 60
+
+
+def _create_upload(db: Session, uploader: User, **values: object) -> FileResponse:
+    # The response is built from the in-session objects before commit: a new
+    # file has no comments and its uploader is the current user, so reloading
+    # the graph afterwards would only fetch what is already here. uploader
+    # resolves from the identity map; assigning it would mark the user dirty.
+    rec = FileUpload(uploader_id=uploader.id, comments=[], **values)
+    db.add(rec)
+    db.flush()
+    return FileResponse.model_validate(rec)
+
+
+def _add_violations(db: Session, file_id: int, result: ValidationResult) -> None:
+    # A full report is stored with one executemany, not one flush per row.
+    if result.violations:
+        db.execute(
+            insert(FileViolation),
+            [
+                {
+                    "file_id": file_id,
+                    "row_number": v.row,
+                    "column_name": v.column,
+                    "snippet": v.snippet,
+                }
+                for v in result.violations
+            ],
+        )
+
+
+def _store_result(
+    session_factory: sessionmaker,
+    file_id: int,
+    file_status: FileStatus,
+    valid: bool,
+    reason: str,
+    key: CacheKey | None = None,
+    result: ValidationResult | None = None,
+) -> None:
+    with session_factory() as db:
+        rec = db.get(FileUpload, file_id)
+        if rec is None:
+            return
+        rec.status = file_status.value
+        rec.valid = valid
+        rec.reason = reason
+        if result is not None:
+            rec.violation_count = result.violation_count
+            _add_violations(db, file_id, result)
+        if key is not None and file_status is FileStatus.DONE and result is not None:
+            validation_cache.put(db, key, result)
+        validated = FileStatusResponse.model_validate(rec)
+        db.commit()
+    event_broker.publish("file.validated", validated)
+
+
+async def run_validation_job(
+    file_id: int,
+    filename: str,
+    tmp_path: str,
+    future: Future,
+    session_factory: sessionmaker,
+    key: CacheKey,
+) -> None:
+    file_status, valid, reason = FileStatus.FAILED, False, "Failed to validate file"
+    result = None
+    label = metrics.file_type_label(Path(filename).suffix)
+    try:
+        with metrics.stage("pool", label):
+            result = await validation_pool.wait(future)
+        file_status, valid, reason = FileStatus.DONE, result.valid, result.reason
+        metrics.observe_validation(label, result.stats, result.valid)
+    except TimeoutError:
+        logger.error("Validation timed out for file %s", filename)
+        reason = "File validation timed out"
+    except asyncio.CancelledError:
+        # Shielded: the row is still marked while the task is torn down.
+        await asyncio.shield(
+            run_in_threadpool(
+                _store_result,
+                session_factory,
+                file_id,
+                file_status,
+                valid,
+                INTERRUPTED_REASON,
+            )
+        )
+        raise
+    except Exception as e:
+        logger.error("Validation error for file %s: %s", filename, str(e))
+    finally:
+        _discard_when_done(future, tmp_path)
+
+    await run_in_threadpool(
+        _store_result, session_factory, file_id, file_status, valid, reason, key, result
+    )
+
+
+def _stale_before() -> datetime:
+    return utcnow() - timedelta(seconds=STALE_JOB_SECONDS)
+
 
-def get_file_with_comments(db: Session, file_id: int) -> FileUpload | None:
-    statement = (
-        select(FileUpload)
-        .options(
-            joinedload(FileUpload.uploader),
-            selectinload(FileUpload.comments).joinedload(Comment.author),
+def fail_stale_jobs(db: Session) -> int:
+    # Run at startup: PENDING rows whose job died with an earlier process.
+    # Jobs of other live workers are younger than the cut-off.
+    stale = db.execute(
+        update(FileUpload)
+        .where(
+            FileUpload.status == FileStatus.PENDING.value,
+            FileUpload.created_at < _stale_before(),
         )
-        .where(FileUpload.id == file_id)
+        .values(status=FileStatus.FAILED.value, valid=False, reason=INTERRUPTED_REASON)
+    ).rowcount
+    db.commit()
+    return stale
+
+
+# Documents the multipart body /upload reads itself.
+UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+def _pool_saturated() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many files are being validated, retry later",
+        headers={"Retry-After": "1"},
     )
-    return db.execute(statement).scalar_one_or_none()
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File is larger than {MAX_UPLOAD_BYTES} bytes",
+    )
+
+
+def _max_violations(report: bool, handler: type[BaseFileHandler]) -> int:
+    # Only tabular formats have rows to report; for the others the flag is
+    # ignored and the upload is validated as usual.
+    return VIOLATION_REPORT_MAX if report and handler.supports_report else 0
+
+
+def _discard_when_done(future: Future, tmp_path: str) -> None:
+    # A job still queued is cancelled. One already running (the caller timed
+    # out) may be reading the file, so it is removed when the job finishes.
+    future.cancel()
+    future.add_done_callback(lambda _: Path(tmp_path).unlink(missing_ok=True))
+
+
+def _submit_validation(tmp_path: str, max_violations: int = 0) -> Future:
+    validate = FileValidator.validate_file
+    if max_violations:
+        validate = partial(validate, max_violations=max_violations)
+    try:
+        return validation_pool.submit(validate, tmp_path)
+    except PoolSaturatedError as e:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise _pool_saturated() from e
+
+
+def _save_upload(
+    db: Session,
+    filename: str,
+    file_type: str,
+    uploader: User,
+    result: ValidationResult,
+    key: CacheKey | None,
+) -> FileResponse:
+    with metrics.stage("db_insert", metrics.file_type_label(file_type)):
+        created = _create_upload(
+            db,
+            uploader,
+            filename=filename,
+            file_type=file_type,
+            valid=result.valid,
+            reason=result.reason,
+            violation_count=result.violation_count,
+        )
+        _add_violations(db, created.id, result)
+        if key is not None:
+            validation_cache.put(db, key, result)
+        db.commit()
+    event_broker.publish("file.created", created)
+    return created
+
+
+def _observe_receive(request: Request, file_type: str, upload: ReceivedUpload) -> None:
+    # The body is received and written out in one pass: the time spent
+    # hashing and writing the file is the "copy" stage, the rest of the time
+    # since the request started is "receive".
+    if not metrics.enabled:
+        return
+    elapsed = metrics.since_request_start(request.state)
+    if elapsed is not None:
+        metrics.STAGE_SECONDS.observe(
+            max(elapsed - upload.copy_seconds, 0.0),
+            stage="receive",
+            file_type=file_type,
+        )
+    metrics.STAGE_SECONDS.observe(
+        upload.copy_seconds, stage="copy", file_type=file_type
+    )
+    metrics.UPLOAD_BYTES.inc(upload.size, file_type=file_type)
 
 
 @router.post(
-    "/upload", response_model=FileResponse, status_code=status.HTTP_201_CREATED
+    "/upload",
+    response_model=FileResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": FileResponse}},
+    openapi_extra=UPLOAD_BODY,
 )
 async def upload_file(
-    file: Annotated[UploadFile, File(...)],
-    db: Annotated[Session, Depends(get_db)],
+    request: Request,
+    response: Response,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    session_factory: Annotated[sessionmaker, Depends(get_session_factory)],
     user: Annotated[User, Depends(get_current_user)],
+    background: Annotated[bool, Query(alias="async")] = False,
+    report: bool = False,
 ):
-    if not file.filename:
+    # report=true asks for every violation of a CSV/XLSX file, listed by
+    # GET /files/{id}/violations, instead of stopping at the first one.
+    # The multipart body is read here rather than by the form parser: the
+    # file goes to its temporary file in one pass and an oversized upload is
+    # refused as soon as it passes the limit.
+    def check(filename: str) -> None:
+        if not filename:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Filename is required"
+            )
+        if Path(filename).suffix.lower() not in FileValidator.file_handlers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type"
+            )
+
+    try:
+        upload = await receive_upload(
+            request.headers.get("content-type", ""),
+            request.stream(),
+            field="file",
+            max_bytes=MAX_UPLOAD_BYTES,
+            check=check,
+        )
+    except UploadTooLargeError as e:
+        raise _too_large() from e
+    except UploadFormatError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Filename is required"
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+
+    filename, tmp_path = upload.filename, upload.path
+    extension = Path(filename).suffix.lower()
+    max_violations = _max_violations(report, FileValidator.file_handlers[extension])
+    label = metrics.file_type_label(extension)
+    _observe_receive(request, label, upload)
+
+    key = cache_key(upload.content_hash, extension)
+
+    def save(
+        db: Session, result: ValidationResult, key: CacheKey | None = key
+    ) -> FileResponse:
+        return _save_upload(db, filename, extension, user, result, key)
+
+    with metrics.stage("cache", label):
+        cached = await runner.run(validation_cache.get, key)
+    if cached is not None and max_violations:
+        # The cache keeps verdicts, not violation lists; only a valid file
+        # is known to have nothing to list.
+        cached = replace(cached, violation_count=0) if cached.valid else None
+    if cached is not None:
+        Path(tmp_path).unlink(missing_ok=True)
+        # Already stored; putting it again would only hit the unique index.
+        return await runner.run(save, cached, None)
+
+    if background:
+
+        def save_pending(db: Session) -> FileResponse:
+            created = _create_upload(
+                db,
+                user,
+                filename=filename,
+                file_type=extension,
+                status=FileStatus.PENDING.value,
+            )
+            db.commit()
+            event_broker.publish("file.created", created)
+            return created
+
+        # The job is submitted once its row exists, so a failed insert
+        # leaves no job behind. A full pool is still refused up front.
+        if validation_pool.full:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise _pool_saturated()
+        try:
+            created = await runner.run(save_pending)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        try:
+            future = _submit_validation(tmp_path, max_violations)
+        except HTTPException:
+            # Another request took the last slot since the check above.
+            await run_in_threadpool(
+                _store_result,
+                session_factory,
+                created.id,
+                FileStatus.FAILED,
+                False,
+                "Too many files are being validated, retry later",
+            )
+            raise
+        validation_jobs.start(
+            created.id,
+            run_validation_job(
+                created.id, filename, tmp_path, future, session_factory, key
+            ),
         )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return created
+
+    future = _submit_validation(tmp_path, max_violations)
+    try:
+        with metrics.stage("pool", label):
+            result = await validation_pool.wait(future)
+    except TimeoutError as e:
+        logger.error("Validation timed out for file %s", filename)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="File validation timed out",
+        ) from e
+    except Exception as e:
+        logger.error("Validation error for file %s: %s", filename, str(e))
+        raise HTTPException(status_code=500, detail="Failed to validate file") from e
+    finally:
+        _discard_when_done(future, tmp_path)
+
+    metrics.observe_validation(label, result.stats, result.valid)
+    return await runner.run(save, result)
 
-    extension = Path(file.filename).suffix.lower()
-    if extension not in FileValidator.file_handlers:
+
+@router.post(
+    "/upload/stream",
+    response_model=FileResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_file_stream(
+    request: Request,
+    filename: Annotated[str, Query(min_length=1)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    user: Annotated[User, Depends(get_current_user)],
+    report: bool = False,
+):
+    # The raw request body is the file. It is validated while it arrives and
+    # never written to disk; an early verdict (e.g. the target word outside
+    # the company column) is returned without reading the rest of the body.
+    extension = Path(filename).suffix.lower()
+    handler = FileValidator.file_handlers.get(extension)
+    if handler is None or not handler.supports_streaming:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported file type"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Streaming upload supports .txt and .csv files only",
         )
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > MAX_UPLOAD_BYTES:
+        raise _too_large()
 
-    with NamedTemporaryFile(delete=False, suffix=extension) as tmp:
-        shutil.copyfileobj(file.file, tmp)
-        tmp_path = tmp.name
+    validate = handler.validate_stream
+    if max_violations := _max_violations(report, handler):
+        validate = partial(validate, max_violations=max_violations)
+    feed = StreamFeed()
+    try:
+        future = stream_pool.submit(validate, feed)
+    except PoolSaturatedError as e:
+        raise _pool_saturated() from e
+    loop = asyncio.get_running_loop()
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(feed.stop))
 
+    label = metrics.file_type_label(extension)
+    digest = hashlib.sha256()
+    received = 0
+    complete = False
     try:
-        result = FileValidator.validate_file(tmp_path)
+        # Receiving and validating overlap here, so they share one stage.
+        with metrics.stage("stream", label):
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > MAX_UPLOAD_BYTES:
+                    raise _too_large()
+                digest.update(chunk)
+                if not await feed.put(chunk):
+                    break
+            else:
+                complete = True
+                await feed.close()
+            result = await stream_pool.wait(future)
+    except HTTPException:
+        raise
+    except TimeoutError as e:
+        logger.error("Validation timed out for file %s", filename)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="File validation timed out",
+        ) from e
     except Exception as e:
-        logger.error("Validation error for file %s: %s", file.filename, str(e))
+        logger.error("Validation error for file %s: %s", filename, str(e))
         raise HTTPException(status_code=500, detail="Failed to validate file") from e
     finally:
-        Path(tmp_path).unlink(missing_ok=True)
+        feed.stop()
 
-    rec = FileUpload(
-        filename=file.filename,
-        file_type=extension,
-        valid=result.valid,
-        reason=result.reason,
-        uploader_id=user.id,
-    )
-    db.add(rec)
-    db.commit()
+    if metrics.enabled:
+        metrics.UPLOAD_BYTES.inc(received, file_type=label)
+    metrics.observe_validation(label, result.stats, result.valid)
+    # Only a fully received body has a content hash worth caching.
+    key = cache_key(digest.hexdigest(), extension) if complete else None
+    return await runner.run(_save_upload, filename, extension, user, result, key)
 
-    created = get_file_with_comments(db, rec.id)
-    return created
+
+def _batch_line(entry: BatchEntry, result: ValidationResult | None) -> bytes:
+    line = BatchFileResult(index=entry.index, filename=entry.filename)
+    if result is None:
+        line.error = entry.error
+    else:
+        line.valid, line.reason = result.valid, result.reason
+    return line.model_dump_json().encode() + b"\n"
+
+
+def _save_batch(
+    session_factory: sessionmaker,
+    uploader: User,
+    entries: list[BatchEntry],
+    results: dict[int, ValidationResult],
+    fresh: dict[CacheKey, ValidationResult],
+) -> list[int | None]:
+    # All rows go in with one flush and one commit. On PostgreSQL the flush
+    # is a single multi-row INSERT .. RETURNING; SQLite does not order
+    # RETURNING rows, so there it is one INSERT per row, in one transaction.
+    ids: list[int | None] = [None] * len(entries)
+    if not results:
+        return ids
+    with metrics.stage("db_insert", "batch"), session_factory() as db:
+        # The user comes from the request's session, which is closed by now;
+        # holding the merged copy lets rec.uploader resolve without a query.
+        uploader = db.merge(uploader, load=False)
+        records = {
+            entry.index: FileUpload(
+                uploader_id=uploader.id,
+                comments=[],
+                filename=entry.filename,
+                file_type=entry.extension,
+                valid=results[entry.index].valid,
+                reason=results[entry.index].reason,
+            )
+            for entry in entries
+            if entry.index in results
+        }
+        db.add_all(records.values())
+        db.flush()
+        for key, result in fresh.items():
+            validation_cache.put(db, key, result)
+        created = {i: FileResponse.model_validate(r) for i, r in records.items()}
+        db.commit()
+    for index, response in created.items():
+        ids[index] = response.id
+        event_broker.publish("file.created", response)
+    return ids
+
+
+async def _validate_group(
+    group: list[BatchEntry], limit: asyncio.Semaphore
+) -> tuple[list[BatchEntry], ValidationResult | None]:
+    # The entries of a group share content and type; the first is validated.
+    entry = group[0]
+    label = metrics.file_type_label(entry.extension)
+    error = None
+    async with limit:
+        future = None
+        try:
+            future = validation_pool.submit(FileValidator.validate_file, entry.path)
+            with metrics.stage("pool", label):
+                result = await validation_pool.wait(future)
+        except PoolSaturatedError:
+            error = "Too many files are being validated, retry later"
+        except TimeoutError:
+            logger.error("Validation timed out for file %s", entry.filename)
+            error = "File validation timed out"
+        except Exception as e:
+            logger.error("Validation error for file %s: %s", entry.filename, str(e))
+            error = "Failed to validate file"
+        finally:
+            if future is not None:
+                # The job owns the validated file until it finishes.
+                path, entry.path = entry.path, None
+                _discard_when_done(future, path)
+            for each in group:
+                each.discard()
+    if error is not None:
+        for each in group:
+            each.error = error
+        return group, None
+    metrics.observe_validation(label, result.stats, result.valid)
+    return group, result
 
 
-@router.get("", response_model=list[FileResponse])
-def list_files(db: Annotated[Session, Depends(get_db)]):
-    statement = (
-        select(FileUpload)
-        .options(
-            joinedload(FileUpload.uploader),
-            selectinload(FileUpload.comments).joinedload(Comment.author),
+async def _run_batch(
+    entries: list[BatchEntry],
+    cached: dict[CacheKey, ValidationResult],
+    uploader: User,
+    session_factory: sessionmaker,
+) -> AsyncIterator[bytes]:
+    results: dict[int, ValidationResult] = {}
+    # Files with the same content and type are validated once.
+    pending: dict[CacheKey, list[BatchEntry]] = {}
+    for entry in entries:
+        result = cached.get(entry.key) if entry.key is not None else None
+        if result is not None:
+            entry.discard()
+            results[entry.index] = result
+            yield _batch_line(entry, result)
+        elif entry.error is not None:
+            yield _batch_line(entry, None)
+        else:
+            pending.setdefault(entry.key, []).append(entry)
+
+    # A batch may use every worker but leaves the queue to other requests.
+    limit = asyncio.Semaphore(validation_pool.max_workers)
+    tasks = [
+        asyncio.ensure_future(_validate_group(group, limit))
+        for group in pending.values()
+    ]
+    fresh: dict[CacheKey, ValidationResult] = {}
+    try:
+        for done in asyncio.as_completed(tasks):
+            group, result = await done
+            if result is not None:
+                fresh[group[0].key] = result
+            for entry in group:
+                if result is not None:
+                    results[entry.index] = result
+                yield _batch_line(entry, result)
+
+        ids = await run_in_threadpool(
+            _save_batch, session_factory, uploader, entries, results, fresh
         )
-        .order_by(FileUpload.created_at.desc())
+        failed = sum(1 for i in ids if i is None)
+        summary = BatchSummary(ids=ids, created=len(ids) - failed, failed=failed)
+        yield summary.model_dump_json().encode() + b"\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+        for entry in entries:
+            entry.discard()
+
+
+@router.post(
+    "/upload/batch",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {BATCH_MEDIA_TYPE: {}},
+            "description": "One BatchFileResult line per file as it is validated, "
+            "then a BatchSummary line once the files are stored.",
+        }
+    },
+)
+async def upload_batch(
+    files: Annotated[list[UploadFile], File(...)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    session_factory: Annotated[sessionmaker, Depends(get_session_factory)],
+    user: Annotated[User, Depends(get_current_user)],
+):
+    # Files are validated concurrently and reported in the order they finish;
+    # ZIP archives count as the TXT/CSV/XLSX files inside them. A file that
+    # cannot be validated fails alone. Every validated file is stored in a
+    # single transaction at the end, so the ids arrive in the last line.
+    try:
+        entries = await run_in_threadpool(
+            spool_batch,
+            files,
+            supported=FileValidator.file_handlers,
+            max_files=settings.batch_max_files,
+            max_bytes=settings.batch_max_bytes,
+            max_file_bytes=MAX_UPLOAD_BYTES,
+        )
+    except BatchLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        ) from e
+
+    try:
+        keys = [entry.key for entry in entries if entry.key is not None]
+        with metrics.stage("cache", "batch"):
+            cached = await runner.run(validation_cache.get_many, keys)
+    except BaseException:
+        for entry in entries:
+            entry.discard()
+        raise
+    if metrics.enabled:
+        for entry in entries:
+            label = metrics.file_type_label(entry.extension)
+            metrics.UPLOAD_BYTES.inc(entry.size, file_type=label)
+
+    return StreamingResponse(
+        _run_batch(entries, cached, user, session_factory),
+        media_type=BATCH_MEDIA_TYPE,
     )
-    files = db.execute(statement).scalars().all()
-    return files
+
+
+@router.get("/{file_id}/status", response_model=FileStatusResponse)
+async def get_file_status(
+    file_id: int,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    wait: Annotated[float, Query(ge=0, le=MAX_STATUS_WAIT_SECONDS)] = 0,
+):
+    deadline = time.monotonic() + wait
+
+    def load(db: Session) -> FileStatusResponse | None:
+        db.expire_all()
+        rec = db.get(FileUpload, file_id)
+        # A job lost to a restart of this or another process since startup.
+        if (
+            rec is not None
+            and rec.status == FileStatus.PENDING.value
+            and rec.created_at < _stale_before()
+            and not validation_jobs.is_running(file_id)
+        ):
+            rec.status = FileStatus.FAILED.value
+            rec.reason = INTERRUPTED_REASON
+            db.commit()
+        return FileStatusResponse.model_validate(rec) if rec is not None else None
+
+    while True:
+        rec = await runner.run(load)
+        if not rec:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+            )
+        remaining = deadline - time.monotonic()
+        if rec.status != FileStatus.PENDING.value or remaining <= 0:
+            return rec
+        # Jobs started by this process wake us up directly; jobs owned by
+        # another worker process are picked up by re-reading the row.
+        await validation_jobs.wait(file_id, min(remaining, STATUS_POLL_INTERVAL))
+
+
+@router.get("/{file_id}/violations", response_model=ViolationPage)
+async def list_violations(
+    file_id: int,
+    request: Request,
+    response: Response,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    def query(db: Session) -> Any:
+        # Violations are written together with their file's row, so the files
+        # revision in the ETag covers them too.
+        unchanged = not_modified(request, response, revisions.etag(db))
+        if unchanged is not None:
+            return unchanged
+
+        statement = (
+            select(
+                FileViolation.id,
+                FileViolation.row_number,
+                FileViolation.column_name,
+                FileViolation.snippet,
+            )
+            .where(FileViolation.file_id == file_id)
+            .order_by(FileViolation.id)
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(FileViolation.id > decode_id_cursor(cursor))
+
+        rows = db.execute(statement).all()
+        # An empty page may be an unknown file.
+        if not rows and db.get(FileUpload, file_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+            )
+        next_cursor = (
+            encode_id_cursor(rows[limit - 1].id) if len(rows) > limit else None
+        )
+        items = [
+            {"row": row.row_number, "column": row.column_name, "snippet": row.snippet}
+            for row in rows[:limit]
+        ]
+        return fast_json({"items": items, "next_cursor": next_cursor}, response)
+
+    return await runner.run(query)
+
+
+@router.get("", response_model=FilePage)
+async def list_files(
+    request: Request,
+    response: Response,
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    valid: bool | None = None,
+    file_type: str | None = None,
+    uploader_id: int | None = None,
+):
+    def query(db: Session) -> Any:
+        # Read before the listing, so the page is never older than its ETag.
+        unchanged = not_modified(request, response, revisions.etag(db))
+        if unchanged is not None:
+            return unchanged
+
+        # Only the listed columns, as tuples: no ORM objects and no pydantic
+        # round trip, the dicts below are the FileListItem JSON.
+        statement = (
+            select(
+                FileUpload.id,
+                FileUpload.filename,
+                FileUpload.file_type,
+                FileUpload.valid,
+                FileUpload.reason,
+                FileUpload.status,
+                FileUpload.created_at,
+                FileUpload.uploader_id,
+                User.email,
+                FileUpload.comment_count,
+                FileUpload.violation_count,
+            )
+            .join(User, User.id == FileUpload.uploader_id)
+            .order_by(FileUpload.created_at.desc(), FileUpload.id.desc())
+            .limit(limit + 1)
+        )
+        if valid is not None:
+            statement = statement.where(FileUpload.valid == valid)
+        if file_type is not None:
+            statement = statement.where(FileUpload.file_type == file_type.lower())
+        if uploader_id is not None:
+            statement = statement.where(FileUpload.uploader_id == uploader_id)
+        if cursor is not None:
+            created_at, file_id = decode_cursor(cursor)
+            # A row-value comparison is an index seek; the equivalent OR makes
+            # SQLite scan from the newest row, so deep pages got slower.
+            statement = statement.where(
+                tuple_(FileUpload.created_at, FileUpload.id) < (created_at, file_id)
+            )
+
+        rows = db.execute(statement).all()
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        items = [
+            {
+                "id": row.id,
+                "filename": row.filename,
+                "file_type": row.file_type,
+                "valid": row.valid,
+                "reason": row.reason,
+                "status": row.status,
+                "created_at": row.created_at,
+                "uploader_id": row.uploader_id,
+                "uploader": {"id": row.uploader_id, "email": row.email},
+                "comment_count": row.comment_count,
+                "violation_count": row.violation_count,
+            }
+            for row in rows[:limit]
+        ]
+        return fast_json({"items": items, "next_cursor": next_cursor}, response)
+
+    return await runner.run(query)
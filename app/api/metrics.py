@@ -0,0 +1,16 @@
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.core import metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    # Prometheus text format. Not behind auth so a scraper can reach it;
+    # restrict access at the proxy if the service is exposed.
+    if not metrics.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Metrics are disabled"
+        )
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,138 @@
+import zipfile
+import zlib
+from collections.abc import Callable, Container, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO, NamedTuple, Protocol
+
+from app.validators.cache import CacheKey, cache_key, copy_and_hash
+
+ARCHIVE_EXTENSION = ".zip"
+
+
+class BatchLimitError(RuntimeError):
+    pass
+
+
+class Upload(Protocol):
+    filename: str | None
+    file: BinaryIO
+    size: int | None
+
+
+@dataclass(slots=True)
+class BatchEntry:
+    # One file of a batch: a part of the request or a member of a ZIP part,
+    # numbered in request order with archive members expanded in place.
+    index: int
+    filename: str
+    extension: str
+    size: int = 0
+    path: str | None = None
+    key: CacheKey | None = None
+    error: str | None = None
+
+    def discard(self) -> None:
+        if self.path is not None:
+            Path(self.path).unlink(missing_ok=True)
+            self.path = None
+
+
+class _Part(NamedTuple):
+    filename: str
+    size: int
+    open: Callable[[], BinaryIO] | None
+    error: str | None = None
+
+
+def _parts(
+    uploads: Sequence[Upload], archives: list[zipfile.ZipFile]
+) -> Iterator[_Part]:
+    for upload in uploads:
+        name = upload.filename or ""
+        if Path(name).suffix.lower() != ARCHIVE_EXTENSION:
+            yield _Part(name, upload.size or 0, lambda f=upload.file: f)
+            continue
+        try:
+            archive = zipfile.ZipFile(upload.file)
+        except zipfile.BadZipFile:
+            yield _Part(name, 0, None, "Not a valid ZIP archive")
+            continue
+        archives.append(archive)
+        # Nested archives are not opened; they fail as an unsupported type.
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            member = f"{name}/{info.filename}"
+            if info.flag_bits & 0x1:
+                yield _Part(
+                    member, 0, None, "Encrypted archive members are not supported"
+                )
+            else:
+                # zipfile stops reading a member at its declared size, so
+                # file_size bounds what extraction can write.
+                yield _Part(member, info.file_size, partial(archive.open, info))
+
+
+def _spool(
+    index: int, part: _Part, supported: Container[str], max_file_bytes: int
+) -> BatchEntry:
+    extension = Path(part.filename).suffix.lower()
+    entry = BatchEntry(index, part.filename, extension, part.size)
+    if part.error is not None:
+        entry.error = part.error
+    elif extension not in supported:
+        entry.error = "Unsupported file type"
+    elif part.size > max_file_bytes:
+        entry.error = f"File is larger than {max_file_bytes} bytes"
+    if entry.error is not None or part.open is None:
+        return entry
+
+    with NamedTemporaryFile(delete=False, suffix=extension) as tmp:
+        entry.path = tmp.name
+        try:
+            with part.open() as src:
+                content_hash = copy_and_hash(src, tmp)
+        except (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError):
+            content_hash = None
+    if content_hash is None:
+        entry.discard()
+        entry.error = "Could not extract file from archive"
+    else:
+        entry.key = cache_key(content_hash, extension)
+    return entry
+
+
+def spool_batch(
+    uploads: Sequence[Upload],
+    *,
+    supported: Container[str],
+    max_files: int,
+    max_bytes: int,
+    max_file_bytes: int,
+) -> list[BatchEntry]:
+    # Copies every file of the batch to a temporary file and hashes it.
+    # Problems with single files are recorded on their entry; only limits
+    # on the batch as a whole raise. The limits are checked against sizes
+    # from the multipart parser and the ZIP central directory, before
+    # anything is extracted.
+    archives: list[zipfile.ZipFile] = []
+    entries: list[BatchEntry] = []
+    try:
+        parts = list(_parts(uploads, archives))
+        if len(parts) > max_files:
+            raise BatchLimitError(f"A batch may hold at most {max_files} files")
+        if sum(part.size for part in parts) > max_bytes:
+            raise BatchLimitError(f"A batch may hold at most {max_bytes} bytes")
+        for index, part in enumerate(parts):
+            entries.append(_spool(index, part, supported, max_file_bytes))
+    except BaseException:
+        for entry in entries:
+            entry.discard()
+        raise
+    finally:
+        for archive in archives:
+            archive.close()
+    return entries
@@ -0,0 +1,25 @@
+from fastapi import Request, Response, status
+
+# Clients may store listings but must revalidate them on every use; with an
+# ETag that is a cheap 304.
+CACHE_CONTROL = "no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # Weak comparison, as If-None-Match requires.
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    # Sets the validators on the response; returns a 304 to send instead when
+    # the client already has this version.
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
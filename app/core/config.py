@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,13 +7,74 @@ class Settings(BaseSettings):
     jwt_secret: str
     access_token_expire_minutes: int
     algorithm: str
+    auth_cache_ttl_seconds: float = 60.0
+    auth_cache_size: int = 10_000
 
     sqlalchemy_database_url: str
     alembic_db_url: str | None = None
+    db_async: bool = False
+    async_database_url: str | None = None
+    threadpool_size: int = 40
+    db_pool_size: int | None = None
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+
+    sqlite_tuning: bool = True
+    sqlite_journal_mode: Literal["DELETE", "TRUNCATE", "PERSIST", "WAL"] = "WAL"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64_000
 
     target_word: str
     company_name_col: str
     default_txt_chunk: int
+    txt_target_words: list[str] = []
+    txt_deny_words: list[str] = []
+    txt_mmap: bool = True
+    txt_mmap_chunk: int = 1024 * 1024
+    parallel_scan_workers: int | None = None
+    parallel_scan_min_bytes: int = 256 * 1024 * 1024
+    parallel_scan_txt: bool = False
+    parallel_scan_csv: bool = False
+    tabular_engine: Literal["rows", "columns"] = "rows"
+    tabular_batch_size: int = 4096
+    violation_report_max: int = 1000
+
+    validation_executor: Literal["process", "thread"] = "process"
+    validation_workers: int | None = None
+    validation_queue_size: int = 32
+    validation_timeout_seconds: float = 120.0
+    max_upload_bytes: int = 1024 * 1024 * 1024
+    stream_upload_workers: int = 8
+    batch_max_files: int = 500
+    batch_max_bytes: int = 2 * 1024 * 1024 * 1024
+
+    validation_cache_enabled: bool = True
+    validation_cache_size: int = 1024
+
+    events_buffer_size: int = 64
+    events_history_size: int = 256
+    events_max_subscribers: int = 10_000
+    events_heartbeat_seconds: float = 15.0
+
+    metrics_enabled: bool = False
+    metrics_buckets: list[float] = [
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+        60.0,
+    ]
 
     model_config = SettingsConfigDict(
         env_file=".env",
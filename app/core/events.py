@@ -0,0 +1,137 @@
+import asyncio
+import secrets
+from collections import deque
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+# Event ids sent to clients are "<epoch>.<n>", so an id handed out before a
+# restart is recognised as foreign instead of matching a new event.
+EPOCH = secrets.token_hex(4)
+
+
+class Event(NamedTuple):
+    id: int
+    type: str
+    data: str  # JSON, serialized once and shared by every subscriber
+
+    def encode(self) -> str:
+        return f"id: {EPOCH}.{self.id}\nevent: {self.type}\ndata: {self.data}\n\n"
+
+
+def resync(after: int) -> Event:
+    # Sent in place of the events a subscriber missed (its buffer overflowed,
+    # or its last id is no longer in the history): the client should
+    # re-fetch what it shows, then continue after this id.
+    return Event(after, "resync", "{}")
+
+
+def parse_event_id(value: str | None) -> int | None:
+    # -1 for ids from another epoch or garbage: the client missed something.
+    if not value:
+        return None
+    epoch, _, number = value.partition(".")
+    if epoch != EPOCH or not number.isdigit():
+        return -1
+    return int(number)
+
+
+class TooManySubscribersError(RuntimeError):
+    pass
+
+
+class Subscription:
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[Event | None] = asyncio.Queue(maxsize)
+
+    def push(self, event: Event | None) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow reader loses its backlog rather than holding memory
+            # for it; one resync marker tells it to catch up by re-fetching.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(resync(event.id) if event is not None else None)
+
+    async def get(self) -> Event | None:
+        # None means the broker is shutting down.
+        return await self.queue.get()
+
+
+class EventBroker:
+    # In-process fan-out. Writers publish from any thread after their commit;
+    # delivery happens on the event loop. Subscribers in other worker
+    # processes do not see these events.
+    def __init__(
+        self, *, buffer_size: int, history_size: int, max_subscribers: int
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: set[Subscription] = set()
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._last_id = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def subscribe(self, last_event_id: int | None = None) -> Subscription:
+        # Called on the event loop. A reconnecting client passes the id of
+        # the last event it saw and gets what it missed from the history.
+        if len(self._subscribers) >= self.max_subscribers:
+            raise TooManySubscribersError("Too many event subscribers")
+        subscription = Subscription(self.buffer_size)
+        if last_event_id is not None and last_event_id != self._last_id:
+            oldest = self._history[0].id if self._history else self._last_id + 1
+            if last_event_id > self._last_id or oldest > last_event_id + 1:
+                subscription.push(resync(self._last_id))
+            else:
+                for event in self._history:
+                    if event.id > last_event_id:
+                        subscription.push(event)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def publish(self, type: str, payload: BaseModel) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        data = payload.model_dump_json()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver(type, data)
+        else:
+            loop.call_soon_threadsafe(self._deliver, type, data)
+
+    def _deliver(self, type: str, data: str) -> None:
+        # Ids are assigned here, on the loop, so they follow delivery order.
+        self._last_id += 1
+        event = Event(self._last_id, type, data)
+        self._history.append(event)
+        for subscription in self._subscribers:
+            subscription.push(event)
+
+    def close(self) -> None:
+        # Ends every open stream so shutdown does not wait on idle clients.
+        for subscription in self._subscribers:
+            subscription.push(None)
+        self._subscribers.clear()
+
+
+event_broker = EventBroker(
+    buffer_size=settings.events_buffer_size,
+    history_size=settings.events_history_size,
+    max_subscribers=settings.events_max_subscribers,
+)
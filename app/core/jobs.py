@@ -0,0 +1,44 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+
+class JobRegistry:
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task] = set()
+        self._finished: dict[int, asyncio.Event] = {}
+
+    def start(self, job_id: int, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        event = self._finished.setdefault(job_id, asyncio.Event())
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            self._tasks.discard(t)
+            self._finished.pop(job_id, None)
+            event.set()
+
+        task.add_done_callback(_done)
+        return task
+
+    def is_running(self, job_id: int) -> bool:
+        return job_id in self._finished
+
+    async def wait(self, job_id: int, timeout: float) -> bool:
+        event = self._finished.get(job_id)
+        if event is None:
+            return True
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+validation_jobs = JobRegistry()
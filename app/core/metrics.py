@@ -0,0 +1,267 @@
+import bisect
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
+from typing import Any, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Checked on every call rather than at import so tests can flip it; when off,
+# stage() hands back a shared no-op context and handlers skip all timing.
+enabled: bool = settings.metrics_enabled
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_labels(zip(self.labelnames, key, strict=True))} {_number(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = tuple(settings.metrics_buckets),
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = (*sorted(map(float, buckets)), float("inf"))
+        # Per label set: a count per bucket (not cumulative), then the sum.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(
+                key, ([0] * len(self.buckets), [0.0])
+            )
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            series = sorted((k, (list(c), t[0])) for k, (c, t) in self._series.items())
+        for key, (counts, total) in series:
+            pairs = list(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                le = _labels([*pairs, ("le", _number(bound))])
+                yield f"{self.name}_bucket{le} {cumulative}"
+            yield f"{self.name}_sum{_labels(pairs)} {_number(total)}"
+            yield f"{self.name}_count{_labels(pairs)} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "".join(f"{m.render()}\n" for m in self._metrics.values())
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS: Histogram = registry.register(
+    Histogram(
+        "file_validator_upload_stage_seconds",
+        "Time spent in each upload stage. 'validate' is the handler's own run "
+        "time and includes 'parse' for tabular files.",
+        ("stage", "file_type"),
+    )
+)
+UPLOAD_BYTES: Counter = registry.register(
+    Counter(
+        "file_validator_upload_bytes_total",
+        "Bytes received by the upload endpoints.",
+        ("file_type",),
+    )
+)
+ROWS: Counter = registry.register(
+    Counter(
+        "file_validator_rows_total",
+        "Rows read by the tabular handlers.",
+        ("file_type",),
+    )
+)
+UPLOADS: Counter = registry.register(
+    Counter(
+        "file_validator_uploads_total",
+        "Validated uploads by outcome.",
+        ("file_type", "valid"),
+    )
+)
+
+AUTH_CACHE_HITS: Counter = registry.register(
+    Counter(
+        "file_validator_auth_cache_hits_total",
+        "Bearer tokens resolved from the token cache.",
+    )
+)
+AUTH_CACHE_MISSES: Counter = registry.register(
+    Counter(
+        "file_validator_auth_cache_misses_total",
+        "Bearer tokens that had to be decoded and loaded from the database.",
+    )
+)
+
+
+class Span:
+    __slots__ = ("stage", "file_type", "started")
+
+    def __init__(self, stage: str, file_type: str) -> None:
+        self.stage = stage
+        self.file_type = file_type
+
+    def __enter__(self) -> "Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        STAGE_SECONDS.observe(
+            time.perf_counter() - self.started,
+            stage=self.stage,
+            file_type=self.file_type,
+        )
+
+
+_NOOP = nullcontext()
+
+
+def file_type_label(extension: str) -> str:
+    return extension.lstrip(".").lower() or "unknown"
+
+
+def stage(name: str, file_type: str) -> AbstractContextManager:
+    if not enabled:
+        return _NOOP
+    return Span(name, file_type)
+
+
+def observe_validation(file_type: str, stats: dict[str, float], valid: bool) -> None:
+    # stats come from ValidationResult.stats, filled in by the handler,
+    # possibly in a worker process.
+    if not enabled:
+        return
+    if "seconds" in stats:
+        STAGE_SECONDS.observe(stats["seconds"], stage="validate", file_type=file_type)
+    if "parse_seconds" in stats:
+        STAGE_SECONDS.observe(
+            stats["parse_seconds"], stage="parse", file_type=file_type
+        )
+    if "rows" in stats:
+        ROWS.inc(stats["rows"], file_type=file_type)
+    UPLOADS.inc(file_type=file_type, valid=str(valid).lower())
+
+
+class TimedIterator(Iterable[T]):
+    # Counts items and the time spent producing them (for a csv.reader:
+    # reading and parsing). Items are pulled in blocks so the clock is read
+    # twice per block rather than per item; up to block - 1 items are read
+    # ahead of the consumer.
+    def __init__(self, items: Iterable[T], block: int = 64) -> None:
+        self._items = iter(items)
+        self._block = block
+        self.count = 0
+        self.seconds = 0.0
+
+    def __iter__(self) -> Iterator[T]:
+        clock = time.perf_counter
+        while True:
+            started = clock()
+            items = list(islice(self._items, self._block))
+            self.seconds += clock() - started
+            if not items:
+                return
+            self.count += len(items)
+            yield from items
+
+
+class RequestTimer:
+    # ASGI middleware that stamps the request start so endpoints can time
+    # body receipt. /upload reads its multipart body itself and reports the
+    # time spent writing it out as "copy", the rest as "receive".
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if enabled and scope["type"] == "http":
+            scope.setdefault("state", {})["started"] = time.perf_counter()
+        await self.app(scope, receive, send)
+
+
+def since_request_start(state: Any) -> float | None:
+    started = getattr(state, "started", None)
+    return None if started is None else time.perf_counter() - started
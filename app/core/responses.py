@@ -0,0 +1,12 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+
+def fast_json(content: Any, response: Response) -> ORJSONResponse:
+    # For list endpoints that build plain dicts shaped like their
+    # response_model: returning a Response skips FastAPI's validate and
+    # serialize pass, and orjson encodes datetimes the way pydantic does.
+    # Headers already set on the injected response (ETag) are kept.
+    return ORJSONResponse(content, headers=dict(response.headers))
@@ -1,3 +1,7 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
@@ -5,12 +9,16 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached, sessionmaker
 
+from app.core import metrics
 from app.core.config import settings
+from app.db import database
 from app.db.database import SessionLocal
 from app.db.models import User
+from app.db.runner import AsyncRunner, DbRunner, SyncRunner
 
 SECRET_KEY = settings.jwt_secret
 ALGORITHM = settings.algorithm
@@ -20,7 +28,91 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
-def get_db():
+class TokenCache:
+    def __init__(self, *, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def _snapshot(user: User) -> User:
+        snapshot = User(
+            id=user.id,
+            email=user.email,
+            password_hash=user.password_hash,
+            created_at=user.created_at,
+        )
+        make_transient_to_detached(snapshot)
+        return snapshot
+
+    def get(self, token: str) -> User | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[token]
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(token)
+                self.hits += 1
+        if metrics.enabled and entry is None:
+            metrics.AUTH_CACHE_MISSES.inc()
+        elif metrics.enabled:
+            metrics.AUTH_CACHE_HITS.inc()
+        return None if entry is None else entry[1]
+
+    def put(self, token: str, user: User, expires_at: float) -> None:
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        # Never keep a token around longer than the JWT itself is valid.
+        lifetime = min(self.ttl, expires_at - time.time())
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._entries[token] = (time.monotonic() + lifetime, self._snapshot(user))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            stale = [t for t, (_, u) in self._entries.items() if u.id == user_id]
+            for token in stale:
+                del self._entries[token]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+token_cache = TokenCache(
+    ttl=settings.auth_cache_ttl_seconds, max_entries=settings.auth_cache_size
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    token_cache.invalidate_user(target.id)
+
+
+# A waiting request is held by the pool's checkout (DB_POOL_TIMEOUT), which
+# happens on the session's first query.
+def get_db() -> Iterator[Session]:
     db = SessionLocal()
     try:
         yield db
@@ -28,27 +120,72 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    if database.AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled, set DB_ASYNC=true")
+    async with database.AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_sync_runner(db: Annotated[Session, Depends(get_db)]) -> DbRunner:
+    return SyncRunner(db)
+
+
+async def get_async_runner(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> DbRunner:
+    return AsyncRunner(db)
+
+
+# Routes take their database access from this; DB_ASYNC picks the engine.
+get_db_runner = get_async_runner if settings.db_async else get_sync_runner
+
+
+def get_session_factory() -> sessionmaker:
+    return SessionLocal
+
+
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
-def create_access_token(sub: str, expires_delta: timedelta | None = None) -> str:
+def create_access_token(
+    sub: str,
+    expires_delta: timedelta | None = None,
+    user_id: int | None = None,
+) -> str:
     expire = datetime.now(UTC) + (
         expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode = {"sub": sub, "exp": expire}
+    if user_id is not None:
+        to_encode["uid"] = user_id
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(
+def _load_user(db: Session, user_id: object, email: str) -> User | None:
+    if isinstance(user_id, int):
+        user = db.get(User, user_id)
+        return user if user is not None and user.email == email else None
+    # Tokens issued before the "uid" claim was added.
+    statement = select(User).where(User.email == email)
+    return db.execute(statement).scalar_one_or_none()
+
+
+async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
+    runner: Annotated[DbRunner, Depends(get_db_runner)],
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cached = token_cache.get(token)
+    if cached is not None:
+        # No query: the cached copy is attached to the request's session.
+        return runner.session.merge(cached, load=False)
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str | None = payload.get("sub")
@@ -57,8 +194,9 @@ def get_current_user(
     except JWTError as e:
         raise credentials_exception from e
 
-    statement = select(User).where(User.email == email)
-    user = db.execute(statement).scalar_one_or_none()
+    user = await runner.run(_load_user, payload.get("uid"), email)
     if not user:
         raise credentials_exception
+
+    token_cache.put(token, user, expires_at=payload["exp"])
     return user
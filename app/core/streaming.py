@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Iterator
+
+
+class StreamFeed:
+    # Hands request body chunks from the event loop to a validator running in
+    # a worker thread. The bounded queue gives backpressure: the body is read
+    # no faster than the validator consumes it.
+    def __init__(self, maxsize: int = 8) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize)
+        self.stopped = False
+
+    async def put(self, chunk: bytes) -> bool:
+        # Returns False once the consumer no longer needs data.
+        if not self.stopped:
+            await self._queue.put(chunk)
+        return not self.stopped
+
+    async def close(self) -> None:
+        if not self.stopped:
+            await self._queue.put(None)
+
+    def stop(self) -> None:
+        # Called on the event loop when the validator has finished or the
+        # upload is abandoned; unblocks both the producer and the consumer.
+        self.stopped = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            future = asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop)
+            chunk = future.result()
+            if chunk is None:
+                return
+            yield chunk
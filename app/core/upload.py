@@ -0,0 +1,164 @@
+import hashlib
+import time
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO
+
+import multipart
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+# Parsed file data is written out in blocks of this size, one worker thread
+# hop per block rather than per network chunk.
+FLUSH_BYTES = 1024 * 1024
+
+
+class UploadTooLargeError(RuntimeError):
+    pass
+
+
+class UploadFormatError(ValueError):
+    pass
+
+
+@dataclass(slots=True)
+class ReceivedUpload:
+    filename: str
+    path: str
+    size: int
+    content_hash: str
+    # Time spent hashing and writing the file, within the time to receive it.
+    copy_seconds: float
+
+
+class _FilePart:
+    # Collects one form field's file from multipart parser callbacks. The
+    # filename is checked once the part's headers are in, before any of its
+    # data is read.
+    def __init__(
+        self, field: str, max_bytes: int, check: Callable[[str], None]
+    ) -> None:
+        self.field = field.encode()
+        self.max_bytes = max_bytes
+        self.check = check
+        self.filename: str | None = None
+        self.size = 0
+        self.pending = bytearray()
+        self.digest = hashlib.sha256()
+        self.tmp: IO[bytes] | None = None
+        self.copy_seconds = 0.0
+        self._reading = False
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+
+    def callbacks(self) -> dict[str, Callable[..., None]]:
+        return {
+            "on_part_begin": self._part_begin,
+            "on_header_field": self._header_field_data,
+            "on_header_value": self._header_value_data,
+            "on_header_end": self._header_end,
+            "on_headers_finished": self._headers_finished,
+            "on_part_data": self._part_data,
+            "on_part_end": self._part_end,
+        }
+
+    def _part_begin(self) -> None:
+        self._headers = {}
+
+    def _header_field_data(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _header_value_data(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def _headers_finished(self) -> None:
+        disposition = self._headers.get(b"content-disposition", b"")
+        _, options = parse_options_header(disposition)
+        # Only the first file sent in the field is kept.
+        if options.get(b"name") != self.field or self.filename is not None:
+            return
+        filename = options.get(b"filename")
+        if filename is None:
+            return
+        self.filename = filename.decode("utf-8", "replace")
+        self.check(self.filename)
+        self._reading = True
+
+    def _part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self._reading:
+            return
+        self.size += end - start
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(f"File is larger than {self.max_bytes} bytes")
+        self.pending += data[start:end]
+
+    def _part_end(self) -> None:
+        self._reading = False
+
+    def flush(self) -> None:
+        started = time.perf_counter()
+        if self.tmp is None:
+            suffix = Path(self.filename or "").suffix.lower()
+            self.tmp = NamedTemporaryFile(delete=False, suffix=suffix)
+        block, self.pending = self.pending, bytearray()
+        self.digest.update(block)
+        self.tmp.write(block)
+        self.copy_seconds += time.perf_counter() - started
+
+    def discard(self) -> None:
+        if self.tmp is not None:
+            self.tmp.close()
+            Path(self.tmp.name).unlink(missing_ok=True)
+
+
+async def receive_upload(
+    content_type: str,
+    body: AsyncIterable[bytes],
+    *,
+    field: str,
+    max_bytes: int,
+    check: Callable[[str], None] = lambda filename: None,
+) -> ReceivedUpload:
+    # Reads a multipart/form-data body and writes the file sent in ``field``
+    # straight to a temporary file, hashing it on the way. Unlike the form
+    # parser, which spools the whole body before the route runs, this stops
+    # as soon as the file is over max_bytes, and the file is written once.
+    # ``check`` sees the filename before the file's data and may raise.
+    kind, options = parse_options_header(content_type)
+    boundary = options.get(b"boundary")
+    if kind != b"multipart/form-data" or not boundary:
+        raise UploadFormatError("Expected a multipart/form-data body")
+
+    part = _FilePart(field, max_bytes, check)
+    parser = multipart.MultipartParser(boundary, part.callbacks())
+    try:
+        async for chunk in body:
+            parser.write(chunk)
+            if len(part.pending) >= FLUSH_BYTES:
+                await run_in_threadpool(part.flush)
+        parser.finalize()
+        if part.filename is None:
+            raise UploadFormatError(f"Form field '{field}' with a file is required")
+        await run_in_threadpool(part.flush)
+        part.tmp.close()
+    except MultipartParseError as e:
+        part.discard()
+        raise UploadFormatError("Malformed multipart body") from e
+    except BaseException:
+        part.discard()
+        raise
+    return ReceivedUpload(
+        part.filename,
+        part.tmp.name,
+        part.size,
+        part.digest.hexdigest(),
+        part.copy_seconds,
+    )
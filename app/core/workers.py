@@ -0,0 +1,112 @@
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.validators.parallel import mark_job_process, mp_context
+
+T = TypeVar("T")
+
+
+class PoolSaturatedError(RuntimeError):
+    pass
+
+
+class ValidationPool:
+    def __init__(
+        self,
+        *,
+        kind: str,
+        max_workers: int | None,
+        queue_size: int,
+        timeout: float,
+    ) -> None:
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_size
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def full(self) -> bool:
+        return self._in_flight >= self.capacity
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # Created on first use, when request threads already run, so
+                # its workers must not be forked from this process.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=mp_context,
+                    initializer=mark_job_process,
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="validation"
+                )
+        return self._executor
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def submit(self, func: Callable[..., T], *args: Any) -> Future:
+        with self._lock:
+            if self.full:
+                raise PoolSaturatedError("Validation queue is full")
+            self._in_flight += 1
+            executor = self._get_executor()
+
+        try:
+            future = executor.submit(func, *args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # The slot is held until the job really finishes, even if the caller
+        # stopped waiting for it, so timed-out jobs still count towards capacity.
+        future.add_done_callback(self._release)
+        return future
+
+    async def wait(self, future: Future) -> Any:
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        return await self.wait(self.submit(func, *args))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+validation_pool = ValidationPool(
+    kind=settings.validation_executor,
+    max_workers=settings.validation_workers,
+    queue_size=settings.validation_queue_size,
+    timeout=settings.validation_timeout_seconds,
+)
+
+# Streaming uploads validate while the body arrives, so a worker is mostly
+# waiting on the network: threads, and no queue beyond the workers.
+stream_pool = ValidationPool(
+    kind="thread",
+    max_workers=settings.stream_upload_workers,
+    queue_size=0,
+    timeout=settings.validation_timeout_seconds,
+)
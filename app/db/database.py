@@ -2,14 +2,32 @@ import logging
 import sqlite3
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 SQLALCHEMY_DATABASE_URL = settings.sqlalchemy_database_url
+POOL_SIZE = settings.db_pool_size or settings.threadpool_size
+
+
+def pool_options(url: str) -> dict:
+    # In-memory SQLite uses a single-connection pool that takes no sizing.
+    parsed = make_url(url)
+    in_memory = parsed.database in (None, "", ":memory:")
+    if parsed.get_backend_name() == "sqlite" and in_memory:
+        return {}
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -18,18 +36,77 @@ engine = create_engine(
     else {},
     pool_pre_ping=True,
     future=True,
+    **pool_options(SQLALCHEMY_DATABASE_URL),
 )
 
 
+def sqlite_tuning_pragmas() -> list[str]:
+    if not settings.sqlite_tuning:
+        return []
+    return [
+        # busy_timeout goes first so switching the journal mode waits
+        # for a lock instead of failing.
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms:d}",
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size:d}",
+        f"PRAGMA cache_size={settings.sqlite_cache_size:d}",
+    ]
+
+
+def _is_sqlite(dbapi_connection) -> bool:
+    # aiosqlite connections arrive wrapped in SQLAlchemy's adapter.
+    driver = getattr(dbapi_connection, "driver_connection", dbapi_connection)
+    if isinstance(driver, sqlite3.Connection):
+        return True
+    return type(driver).__module__.startswith("aiosqlite")
+
+
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
+    pragmas = ["PRAGMA foreign_keys=ON"]
+    if _is_sqlite(dbapi_connection):
+        pragmas += sqlite_tuning_pragmas()
     try:
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
+        for pragma in pragmas:
+            cursor.execute(pragma)
         cursor.close()
     except sqlite3.DatabaseError as e:
-        logger.warning("Failed to enable foreign keys in SQLite: %s", e)
+        logger.warning("Failed to apply SQLite pragmas: %s", e)
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    return f"{ASYNC_DRIVERS.get(dialect, scheme)}{sep}{rest}"
+
+
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker | None = None
+
+if settings.db_async:
+    ASYNC_DATABASE_URL = settings.async_database_url or to_async_url(
+        SQLALCHEMY_DATABASE_URL
+    )
+    async_pool = pool_options(ASYNC_DATABASE_URL)
+    if async_pool:
+        # aiosqlite opens a connection per checkout unless told to pool.
+        async_pool["poolclass"] = AsyncAdaptedQueuePool
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, pool_pre_ping=True, **async_pool
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
 Base = declarative_base()
@@ -1,23 +1,36 @@
 from datetime import UTC, datetime
+from enum import Enum
 
 from sqlalchemy import (
+    JSON,
     Boolean,
     Column,
     DateTime,
     Enum as SqlEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    event,
+    func,
+    select,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
 from app.db.database import Base
-from app.validators.file_validator import FileExtension
 
 
 def utcnow():
-    return datetime.now(UTC)
+    # DateTime columns are naive and hold UTC; responses built before a
+    # reload must show the same value a later read returns.
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class FileStatus(str, Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
 
 
 class User(Base):
@@ -33,12 +46,21 @@ class User(Base):
 
 class FileUpload(Base):
     __tablename__ = "files"
+    __table_args__ = (
+        Index("ix_files_created_at_id", "created_at", "id"),
+        Index("ix_files_valid_created_at_id", "valid", "created_at", "id"),
+        Index("ix_files_file_type_created_at_id", "file_type", "created_at", "id"),
+        Index("ix_files_uploader_id_created_at_id", "uploader_id", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True)
     filename = Column(String(512), nullable=False)
     file_type = Column(String(16), nullable=False)
     valid = Column(Boolean, nullable=False, default=False)
     reason = Column(Text, nullable=False, default="")
+    status = Column(String(16), nullable=False, default=FileStatus.DONE.value)
     created_at = Column(DateTime, default=utcnow, nullable=False)
+    # Violations found by a full report upload; NULL when none was asked for.
+    violation_count = Column(Integer, nullable=True)
 
     uploader_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     uploader = relationship("User", back_populates="files")
@@ -47,12 +69,20 @@ class FileUpload(Base):
         "Comment",
         back_populates="file",
         cascade="all,delete",
-        order_by=lambda: Comment.created_at.asc(),
+        order_by=lambda: (Comment.created_at.asc(), Comment.id.asc()),
+    )
+    violations = relationship(
+        "FileViolation",
+        cascade="all,delete",
+        order_by=lambda: FileViolation.id.asc(),
     )
 
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_file_id_created_at_id", "file_id", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True)
     text = Column(Text, nullable=False)
     created_at = Column(DateTime, default=utcnow, nullable=False)
@@ -63,3 +93,65 @@ class Comment(Base):
 
     author = relationship("User", back_populates="comments")
     file = relationship("FileUpload", back_populates="comments")
+
+
+class FileViolation(Base):
+    # Rows are written in file order, so id order is row order.
+    __tablename__ = "file_violations"
+    __table_args__ = (Index("ix_file_violations_file_id_id", "file_id", "id"),)
+    id = Column(Integer, primary_key=True)
+    file_id = Column(Integer, ForeignKey("files.id"), nullable=False)
+    row_number = Column(Integer, nullable=False)
+    column_name = Column(String(255), nullable=True)
+    snippet = Column(Text, nullable=False)
+
+
+FileUpload.comment_count = column_property(
+    select(func.count(Comment.id))
+    .where(Comment.file_id == FileUpload.id)
+    .correlate_except(Comment)
+    .scalar_subquery(),
+    deferred=True,
+)
+
+
+class ValidationCacheEntry(Base):
+    __tablename__ = "validation_cache"
+    __table_args__ = (
+        Index(
+            "ux_validation_cache_key",
+            "content_hash",
+            "file_type",
+            "target_word",
+            "company_name_col",
+            unique=True,
+        ),
+    )
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    file_type = Column(String(16), nullable=False)
+    target_word = Column(String(255), nullable=False)
+    company_name_col = Column(String(255), nullable=False)
+    valid = Column(Boolean, nullable=False)
+    reason = Column(Text, nullable=False)
+    # First byte offset of each TXT word found; null for other file types.
+    matches = Column(JSON, nullable=True)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+
+
+# Tables whose writes bump a change counter; the counters back the ETags of
+# the file and comment listings (see app.db.revisions).
+REVISIONED_TABLES: tuple[str, ...] = ("files", "comments")
+
+
+class Revision(Base):
+    __tablename__ = "revisions"
+    name = Column(String(32), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(Revision.__table__, "after_create")
+def _seed_revisions(target, connection, **kw) -> None:
+    connection.execute(
+        target.insert(), [{"name": name, "value": 0} for name in REVISIONED_TABLES]
+    )
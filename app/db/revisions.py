@@ -0,0 +1,47 @@
+from itertools import chain
+
+from sqlalchemy import Connection, event, select, update
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.models import REVISIONED_TABLES, Revision
+
+# Every ORM write to a revisioned table bumps its counter in the same
+# transaction, so the counters only move when the data does and readers in
+# other processes see both change together. Raw SQL on the connection
+# bypasses this.
+
+
+def _bump(connection: Connection, tables: set[str]) -> None:
+    connection.execute(
+        update(Revision)
+        .where(Revision.name.in_(sorted(tables)))
+        .values(value=Revision.value + 1)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_after_flush(session: Session, flush_context: object) -> None:
+    tables = {
+        table
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if (table := getattr(obj, "__tablename__", None)) in REVISIONED_TABLES
+    }
+    if tables:
+        _bump(session.connection(), tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_dml(state: ORMExecuteState) -> None:
+    # Statements like update(Comment) skip the flush.
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and mapper.local_table.name in REVISIONED_TABLES:
+        _bump(state.session.connection(), {mapper.local_table.name})
+
+
+def etag(db: Session) -> str:
+    values = dict(db.execute(select(Revision.name, Revision.value)).tuples().all())
+    return (
+        'W/"' + ".".join(str(values.get(name, 0)) for name in REVISIONED_TABLES) + '"'
+    )
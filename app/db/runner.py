@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+# Routes write their database work once, as plain functions of a Session, and
+# run it through the request's runner: on a worker thread with the sync
+# engine, or on the event loop with the async engine (DB_ASYNC=true), where
+# waiting on the database does not hold a thread.
+
+
+class DbRunner(Protocol):
+    # The request's Session; only for calls that do no I/O, like merge with
+    # load=False.
+    session: Session
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T: ...
+
+
+class SyncRunner:
+    def __init__(self, db: Session) -> None:
+        self.session = db
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await run_in_threadpool(fn, self.session, *args)
+
+
+class AsyncRunner:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.session = db.sync_session
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await self.db.run_sync(fn, *args)
@@ -1,16 +1,65 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 
 from app.api import (
     auth as auth_router,
     comments as comments_router,
+    events as events_router,
     files as files_router,
+    metrics as metrics_router,
 )
+from app.core.config import settings
+from app.core.events import event_broker
+from app.core.jobs import validation_jobs
+from app.core.metrics import RequestTimer
+from app.core.security import get_session_factory
+from app.core.workers import stream_pool, validation_pool
+from app.db.database import async_engine
+from app.validators import parallel
 
-app = FastAPI(title="File Validation API")
+logger = logging.getLogger(__name__)
+
+
+def fail_stale_jobs(app: FastAPI) -> None:
+    factory = app.dependency_overrides.get(get_session_factory, get_session_factory)()
+    try:
+        with factory() as db:
+            stale = files_router.fail_stale_jobs(db)
+    except SQLAlchemyError as e:
+        logger.warning("Could not check for interrupted validation jobs: %s", e)
+        return
+    if stale:
+        logger.warning("Marked %d interrupted validation jobs as failed", stale)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Sync endpoints run in anyio's default thread pool, so its size is the
+    # cap on concurrent requests that touch the (sync) database session.
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    event_broker.bind(asyncio.get_running_loop())
+    await run_in_threadpool(fail_stale_jobs, app)
+    yield
+    event_broker.close()
+    await validation_jobs.shutdown()
+    validation_pool.shutdown()
+    stream_pool.shutdown()
+    parallel.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app = FastAPI(title="File Validation API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,10 +68,13 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestTimer)
 
 app.include_router(auth_router.router)
 app.include_router(files_router.router)
 app.include_router(comments_router.router)
+app.include_router(events_router.router)
+app.include_router(metrics_router.router)
 
 
 def init_static_files(app: FastAPI) -> None:
@@ -13,12 +13,34 @@ class CommentUpdateRequest(BaseModel):
     text: str = Field(min_length=1, max_length=10_000)
 
 
-class CommentResponse(BaseModel):
+class CommentItem(BaseModel):
     id: int
     text: str
     user_id: int
     file_id: int
     created_at: datetime
     updated_at: datetime
-    author: UserPublic
     model_config = ConfigDict(from_attributes=True)
+
+
+class CommentResponse(CommentItem):
+    author: UserPublic
+
+
+# Listings name each author once, in "authors"; comments refer to them by
+# user_id.
+class CommentPage(BaseModel):
+    items: list[CommentItem]
+    authors: list[UserPublic]
+    next_cursor: str | None = None
+
+
+class FileComments(BaseModel):
+    file_id: int
+    comments: list[CommentItem]
+    next_cursor: str | None = None
+
+
+class CommentsByFile(BaseModel):
+    files: list[FileComments]
+    authors: list[UserPublic]
@@ -12,9 +12,67 @@ class FileResponse(BaseModel):
     file_type: str
     valid: bool
     reason: str
+    status: str
     created_at: datetime
     uploader_id: int
     uploader: UserPublic
+    violation_count: int | None = None
     comments: list["CommentResponse"] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FileStatusResponse(BaseModel):
+    id: int
+    status: str
+    valid: bool
+    reason: str
+    violation_count: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FileListItem(BaseModel):
+    id: int
+    filename: str
+    file_type: str
+    valid: bool
+    reason: str
+    status: str
+    created_at: datetime
+    uploader_id: int
+    uploader: UserPublic
+    comment_count: int = 0
+    violation_count: int | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class FilePage(BaseModel):
+    items: list[FileListItem]
+    next_cursor: str | None = None
+
+
+class ViolationItem(BaseModel):
+    row: int
+    column: str | None
+    snippet: str
+
+
+class ViolationPage(BaseModel):
+    items: list[ViolationItem]
+    next_cursor: str | None = None
+
+
+class BatchFileResult(BaseModel):
+    index: int
+    filename: str
+    valid: bool | None = None
+    reason: str | None = None
+    error: str | None = None
+
+
+class BatchSummary(BaseModel):
+    ids: list[int | None]
+    created: int
+    failed: int
@@ -1,10 +1,49 @@
+import functools
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar
+
+from app.core import metrics
 
 from .constants import TARGET_WORD, ValidationResult
 
 
+def instrumented(
+    validate: Callable[..., ValidationResult],
+) -> Callable[..., ValidationResult]:
+    # Records the handler's run time in result.stats when metrics are on.
+    # The caller turns stats into metrics, so this works in worker processes.
+    @functools.wraps(validate)
+    def wrapper(cls: type, *args: Any, **kwargs: Any) -> ValidationResult:
+        if not metrics.enabled:
+            return validate(cls, *args, **kwargs)
+        started = time.perf_counter()
+        result = validate(cls, *args, **kwargs)
+        result.stats["seconds"] = time.perf_counter() - started
+        return result
+
+    return wrapper
+
+
 class BaseFileHandler(ABC):
+    supports_streaming: ClassVar[bool] = False
+    # Accepts max_violations > 0 to list every violation (see
+    # handlers.report_tabular_violations) instead of stopping at the first.
+    supports_report: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # A handler that takes streamed uploads must say how; only the ones
+        # without supports_streaming may keep the base validate_stream.
+        if (
+            cls.supports_streaming
+            and cls.validate_stream.__func__ is BaseFileHandler.validate_stream.__func__
+        ):
+            raise TypeError(
+                f"{cls.__name__} sets supports_streaming without validate_stream"
+            )
+
     @classmethod
     def target_word_lower(cls) -> str:
         return TARGET_WORD.casefold()
@@ -13,3 +52,9 @@ class BaseFileHandler(ABC):
     @abstractmethod
     def validate(cls, filepath: str, **kwargs: Any) -> ValidationResult:
         raise NotImplementedError
+
+    @classmethod
+    def validate_stream(
+        cls, chunks: Iterable[bytes], **kwargs: Any
+    ) -> ValidationResult:
+        raise NotImplementedError(f"{cls.__name__} does not support streaming")
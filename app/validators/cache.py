@@ -0,0 +1,184 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import BinaryIO, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import ValidationCacheEntry
+
+from .constants import (
+    COMPANY_NAME_COL,
+    TARGET_WORD,
+    TXT_DENY_WORDS,
+    TXT_TARGET_WORDS,
+    ValidationResult,
+)
+
+COPY_CHUNK = 1024 * 1024
+
+
+class CacheKey(NamedTuple):
+    content_hash: str
+    file_type: str
+    target_word: str
+    company_name_col: str
+
+
+def _target_key() -> str:
+    # Extra TXT target/deny words are folded into the target_word component
+    # as a digest; without them the key is the same as before they existed.
+    if TXT_TARGET_WORDS == (TARGET_WORD,) and not TXT_DENY_WORDS:
+        return TARGET_WORD
+    words = json.dumps([TXT_TARGET_WORDS, TXT_DENY_WORDS]).encode()
+    return f"{TARGET_WORD}|{hashlib.sha256(words).hexdigest()[:16]}"
+
+
+def cache_key(content_hash: str, file_type: str) -> CacheKey:
+    # The validation settings are part of the key, so changing TARGET_WORD or
+    # COMPANY_NAME_COL makes every previously stored result unreachable.
+    return CacheKey(content_hash, file_type, _target_key(), COMPANY_NAME_COL)
+
+
+def copy_and_hash(src: BinaryIO, dst: BinaryIO, chunk_size: int = COPY_CHUNK) -> str:
+    digest = hashlib.sha256()
+    while chunk := src.read(chunk_size):
+        digest.update(chunk)
+        dst.write(chunk)
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    def __init__(self, *, max_entries: int, enabled: bool = True) -> None:
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, ValidationResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: CacheKey, result: ValidationResult) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, *, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _lookup(self, key: CacheKey) -> ValidationResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def get(self, db: Session, key: CacheKey) -> ValidationResult | None:
+        if not self.enabled:
+            return None
+
+        result = self._lookup(key)
+        if result is None:
+            statement = select(
+                ValidationCacheEntry.valid,
+                ValidationCacheEntry.reason,
+                ValidationCacheEntry.matches,
+            ).where(
+                ValidationCacheEntry.content_hash == key.content_hash,
+                ValidationCacheEntry.file_type == key.file_type,
+                ValidationCacheEntry.target_word == key.target_word,
+                ValidationCacheEntry.company_name_col == key.company_name_col,
+            )
+            row = db.execute(statement).one_or_none()
+            if row is not None:
+                result = ValidationResult(row.valid, row.reason, row.matches or {})
+                self._remember(key, result)
+
+        self._count(hits=int(result is not None), misses=int(result is None))
+        return result
+
+    def get_many(
+        self, db: Session, keys: Iterable[CacheKey]
+    ) -> dict[CacheKey, ValidationResult]:
+        # get() for a whole batch: keys missing from memory are looked up in
+        # one query by content hash and matched on the full key here.
+        if not self.enabled:
+            return {}
+
+        unique = set(keys)
+        found: dict[CacheKey, ValidationResult] = {}
+        missing: set[CacheKey] = set()
+        for key in unique:
+            result = self._lookup(key)
+            if result is None:
+                missing.add(key)
+            else:
+                found[key] = result
+        if missing:
+            statement = select(
+                ValidationCacheEntry.content_hash,
+                ValidationCacheEntry.file_type,
+                ValidationCacheEntry.target_word,
+                ValidationCacheEntry.company_name_col,
+                ValidationCacheEntry.valid,
+                ValidationCacheEntry.reason,
+                ValidationCacheEntry.matches,
+            ).where(
+                ValidationCacheEntry.content_hash.in_({k.content_hash for k in missing})
+            )
+            for row in db.execute(statement):
+                key = CacheKey(*row[:4])
+                if key in missing:
+                    found[key] = ValidationResult(
+                        row.valid, row.reason, row.matches or {}
+                    )
+                    self._remember(key, found[key])
+
+        self._count(hits=len(found), misses=len(unique) - len(found))
+        return found
+
+    def put(self, db: Session, key: CacheKey, result: ValidationResult) -> None:
+        if not self.enabled:
+            return
+
+        # The verdict and its matches are kept, as they would be read back
+        # from the table; a violation report is not.
+        matches = dict(result.matches)
+        self._remember(key, ValidationResult(result.valid, result.reason, matches))
+        entry = ValidationCacheEntry(
+            **key._asdict(),
+            valid=result.valid,
+            reason=result.reason,
+            matches=matches or None,
+        )
+        try:
+            with db.begin_nested():
+                db.add(entry)
+        except IntegrityError:
+            # Another request stored the same file first.
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+validation_cache = ValidationCache(
+    max_entries=settings.validation_cache_size,
+    enabled=settings.validation_cache_enabled,
+)
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
 from app.core.config import settings
 
@@ -6,12 +8,39 @@ TARGET_WORD: str = settings.target_word
 TARGET_WORD_DISPLAY: str = f"'{TARGET_WORD}'"
 COMPANY_NAME_COL: str = settings.company_name_col
 DEFAULT_TXT_CHUNK: int = settings.default_txt_chunk
+TXT_TARGET_WORDS: tuple[str, ...] = (TARGET_WORD, *settings.txt_target_words)
+TXT_DENY_WORDS: tuple[str, ...] = tuple(settings.txt_deny_words)
+TXT_MMAP: bool = settings.txt_mmap
+TXT_MMAP_CHUNK: int = settings.txt_mmap_chunk
+PARALLEL_WORKERS: int = settings.parallel_scan_workers or os.cpu_count() or 1
+PARALLEL_MIN_BYTES: int = settings.parallel_scan_min_bytes
+PARALLEL_TXT: bool = settings.parallel_scan_txt
+PARALLEL_CSV: bool = settings.parallel_scan_csv
+TABULAR_ENGINE: str = settings.tabular_engine
+DEFAULT_TABULAR_BATCH: int = settings.tabular_batch_size
+VIOLATION_REPORT_MAX: int = settings.violation_report_max
+
+
+class Violation(NamedTuple):
+    # A cell outside the company column holding the target word. row counts
+    # file rows with the header as 1; column is None for a cell past the
+    # header's last column.
+    row: int
+    column: str | None
+    snippet: str
 
 
 @dataclass(slots=True)
 class ValidationResult:
     valid: bool
     reason: str
+    matches: dict[str, int] = field(default_factory=dict)
+    # Set by the full report mode of tabular handlers only: every violation
+    # found, and the first max_violations of them.
+    violation_count: int | None = None
+    violations: list[Violation] = field(default_factory=list)
+    # Timings and counters for metrics; not part of the verdict.
+    stats: dict[str, float] = field(default_factory=dict, compare=False)
 
 
 def normalize_text(s: str) -> str:
@@ -1,10 +1,9 @@
 from enum import Enum
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from .base import BaseFileHandler
 from .constants import ValidationResult
-from .handlers import CsvFileHandler, TxtFileHandler, XlsxFileHandler
+from .registry import HandlerRegistry
 
 
 class FileExtension(str, Enum):
@@ -14,19 +13,21 @@ class FileExtension(str, Enum):
 
 
 class FileValidator:
-    file_handlers: ClassVar[dict[FileExtension, type[BaseFileHandler]]] = {
-        FileExtension.TXT: TxtFileHandler,
-        FileExtension.CSV: CsvFileHandler,
-        FileExtension.XLSX: XlsxFileHandler,
-    }
+    # Handler modules are imported on first use; more formats can be added
+    # with FileValidator.file_handlers.register() or an entry point.
+    file_handlers: ClassVar[HandlerRegistry] = HandlerRegistry(
+        {
+            FileExtension.TXT: "app.validators.handlers:TxtFileHandler",
+            FileExtension.CSV: "app.validators.handlers:CsvFileHandler",
+            FileExtension.XLSX: "app.validators.handlers:XlsxFileHandler",
+        }
+    )
 
     @classmethod
-    def validate_file(cls, filepath: str) -> ValidationResult:
+    def validate_file(cls, filepath: str, **kwargs: Any) -> ValidationResult:
         ext = Path(filepath).suffix.lower()
-        try:
-            file_ext = FileExtension(ext)
-        except ValueError:
+        if ext not in cls.file_handlers:
             return ValidationResult(valid=False, reason="Unsupported file type")
 
-        handler_class = cls.file_handlers[file_ext]
-        return handler_class.validate(filepath)
+        handler_class = cls.file_handlers[ext]
+        return handler_class.validate(filepath, **kwargs)
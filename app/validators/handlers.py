@@ -1,23 +1,74 @@
+import codecs
 import csv
-from collections.abc import Generator, Iterable, Mapping
-from typing import Any
+import io
+import mmap
+import os
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from contextlib import closing
+from itertools import islice, zip_longest
+from typing import Any, BinaryIO, ClassVar
 
-import pandas as pd
+from app.core import metrics
 
-from .base import BaseFileHandler
+from .base import BaseFileHandler, instrumented
 from .constants import (
     COMPANY_NAME_COL,
+    DEFAULT_TABULAR_BATCH,
     DEFAULT_TXT_CHUNK,
+    PARALLEL_CSV,
+    PARALLEL_MIN_BYTES,
+    PARALLEL_TXT,
+    PARALLEL_WORKERS,
+    TABULAR_ENGINE,
     TARGET_WORD_DISPLAY,
+    TXT_DENY_WORDS,
+    TXT_MMAP,
+    TXT_MMAP_CHUNK,
+    TXT_TARGET_WORDS,
     ValidationResult,
+    Violation,
     normalize_text,
 )
+from .matcher import Match, MultiPatternMatcher
+from .parallel import (
+    RANGES_PER_WORKER,
+    cancelled,
+    in_job_process,
+    run_ranges,
+    split_ranges,
+)
+from .streams import ChunkReader
 
 
 def normalize_row(row: Mapping[str, Any]) -> dict[str, str]:
     return {k: ("" if v is None else str(v)) for k, v in row.items()}
 
 
+def iter_records(
+    rows: Iterable[Sequence[Any]],
+) -> Generator[dict[str, str], None, None]:
+    it = iter(rows)
+    header = next(it, None)
+    if header is None:
+        return
+
+    header = ["" if h is None else str(h) for h in header]
+    width = len(header)
+
+    # Mirrors csv.DictReader: blank rows are skipped, short rows are padded
+    # with "" and surplus cells are kept under the ``None`` key.
+    for row in it:
+        if not row:
+            continue
+        record = normalize_row(dict(zip(header, row, strict=False)))
+        if len(row) < width:
+            for key in header[len(row) :]:
+                record[key] = ""
+        elif len(row) > width:
+            record[None] = str(list(row[width:]))
+        yield record
+
+
 def validate_tabular_data(
     rows: Iterable[Mapping[str, str]],
     target_word: str,
@@ -64,57 +115,676 @@ def validate_tabular_data(
     )
 
 
+# Cells of one column are joined with a separator that cannot occur in the
+# target word, so a single casefold + substring search covers the whole block.
+_COLUMN_SEP = "\x00"
+
+
+def _join_column(cells: Sequence[Any]) -> str:
+    try:
+        return _COLUMN_SEP.join(cells)
+    except TypeError:
+        return _COLUMN_SEP.join("" if v is None else str(v) for v in cells)
+
+
+def _header_columns(header: Sequence[Any]) -> tuple[int, list[int], int | None]:
+    names = ["" if h is None else str(h) for h in header]
+    # Like a dict record, a duplicated header name keeps only its last column.
+    columns = sorted({name: idx for idx, name in enumerate(names)}.values())
+    normalized_headers = {normalize_text(names[idx]): idx for idx in columns}
+    company_idx = normalized_headers.get(normalize_text(COMPANY_NAME_COL))
+    return len(names), columns, company_idx
+
+
+def _scan_column_block(
+    batch: Sequence[Sequence[Any]],
+    target_word: str,
+    *,
+    width: int,
+    columns: Sequence[int],
+    company_idx: int,
+    found_in_company: bool,
+) -> tuple[bool, bool]:
+    # Returns (found outside the company column, found in the company column).
+    block = list(zip_longest(*batch, fillvalue=""))
+    surplus = range(width, len(block))
+    for idx in (*columns, *surplus):
+        if idx >= len(block):
+            continue
+        if idx == company_idx and found_in_company:
+            continue
+        if target_word in _join_column(block[idx]).casefold():
+            if idx != company_idx:
+                return True, found_in_company
+            found_in_company = True
+    return False, found_in_company
+
+
+def _outside_company_result() -> ValidationResult:
+    return ValidationResult(
+        False,
+        f"Word {TARGET_WORD_DISPLAY} found outside column '{COMPANY_NAME_COL}' — file is invalid",
+    )
+
+
+def _company_result(has_data_rows: bool, found_in_company: bool) -> ValidationResult:
+    if not has_data_rows:
+        return ValidationResult(False, "No data rows")
+
+    if found_in_company:
+        return ValidationResult(
+            True, f"Word {TARGET_WORD_DISPLAY} found in column '{COMPANY_NAME_COL}'"
+        )
+
+    return ValidationResult(
+        False, f"Word {TARGET_WORD_DISPLAY} not found in column '{COMPANY_NAME_COL}'"
+    )
+
+
+def _columnar_target(target_word: str) -> bool:
+    return _COLUMN_SEP not in target_word and target_word == target_word.strip()
+
+
+def validate_tabular_columns(
+    rows: Iterable[Sequence[Any]],
+    target_word: str,
+    *,
+    batch_size: int = DEFAULT_TABULAR_BATCH,
+) -> ValidationResult:
+    if not target_word:
+        return ValidationResult(False, f"Target word {TARGET_WORD_DISPLAY} is empty")
+    if not _columnar_target(target_word):
+        return validate_tabular_data(iter_records(rows), target_word)
+
+    it = iter(rows)
+    header = next(it, None)
+    if header is None:
+        return ValidationResult(False, "No data rows")
+
+    width, columns, company_idx = _header_columns(header)
+    data_rows = filter(None, it)
+    found_in_company = False
+    has_data_rows = False
+
+    while batch := list(islice(data_rows, batch_size)):
+        if not has_data_rows:
+            has_data_rows = True
+            if company_idx is None:
+                return ValidationResult(False, f"Missing column '{COMPANY_NAME_COL}'")
+
+        outside, found_in_company = _scan_column_block(
+            batch,
+            target_word,
+            width=width,
+            columns=columns,
+            company_idx=company_idx,
+            found_in_company=found_in_company,
+        )
+        if outside:
+            return _outside_company_result()
+
+    return _company_result(has_data_rows, found_in_company)
+
+
+# Characters of a violating cell kept around the target word.
+SNIPPET_CHARS = 120
+
+
+def _snippet(text: str, target_word: str) -> str:
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    # casefold() may change lengths, so the position is approximate for
+    # exotic text; the window is still clamped to the cell.
+    pos = max(text.casefold().find(target_word), 0)
+    start = max(pos - (SNIPPET_CHARS - len(target_word)) // 2, 0)
+    start = min(start, len(text) - SNIPPET_CHARS)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + SNIPPET_CHARS < len(text) else ""
+    return f"{prefix}{text[start : start + SNIPPET_CHARS]}{suffix}"
+
+
+def report_tabular_violations(
+    rows: Iterable[Sequence[Any]],
+    target_word: str,
+    *,
+    max_violations: int,
+    batch_size: int = DEFAULT_TABULAR_BATCH,
+) -> ValidationResult:
+    # Full report mode: same verdict and reason as validate_tabular_data,
+    # but the whole file is read and every cell outside the company column
+    # holding the target word is counted, the first max_violations listed.
+    # Blocks the column scan finds clean are not looked at row by row.
+    if not target_word:
+        return ValidationResult(False, f"Target word {TARGET_WORD_DISPLAY} is empty")
+
+    it = iter(rows)
+    header = next(it, None)
+    if header is None:
+        return ValidationResult(False, "No data rows")
+
+    width, columns, company_idx = _header_columns(header)
+    names = ["" if h is None else str(h) for h in header]
+    columnar = _columnar_target(target_word)
+    # Numbered before blank rows are dropped, so numbers match the file.
+    numbered = ((number, row) for number, row in enumerate(it, start=2) if row)
+    violations: list[Violation] = []
+    count = 0
+    found_in_company = False
+    has_data_rows = False
+
+    while batch := list(islice(numbered, batch_size)):
+        if not has_data_rows:
+            has_data_rows = True
+            if company_idx is None:
+                return ValidationResult(False, f"Missing column '{COMPANY_NAME_COL}'")
+
+        if columnar:
+            outside, found_in_company = _scan_column_block(
+                [row for _, row in batch],
+                target_word,
+                width=width,
+                columns=columns,
+                company_idx=company_idx,
+                found_in_company=found_in_company,
+            )
+            if not outside:
+                continue
+
+        for number, row in batch:
+            for idx in (*columns, *range(width, len(row))):
+                if idx >= len(row):
+                    continue
+                text = "" if row[idx] is None else str(row[idx])
+                if target_word not in normalize_text(text):
+                    continue
+                if idx == company_idx:
+                    found_in_company = True
+                    continue
+                count += 1
+                if len(violations) < max_violations:
+                    column = names[idx] if idx < width else None
+                    violations.append(
+                        Violation(number, column, _snippet(text, target_word))
+                    )
+
+    if count:
+        result = _outside_company_result()
+    else:
+        result = _company_result(has_data_rows, found_in_company)
+    result.violation_count = count
+    result.violations = violations
+    return result
+
+
+# Windows a parallel TXT worker scans between cancellation checks, and the
+# read size of a parallel CSV worker.
+PARALLEL_POLL_WINDOWS = 16
+CSV_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def _scan_txt_range(
+    start: int,
+    end: int,
+    filepath: str,
+    patterns: Sequence[str],
+    stop_on: frozenset[str],
+    chunk_size: int,
+) -> dict[str, int]:
+    # Runs in a parallel scan worker; checks for cancellation every
+    # PARALLEL_POLL_WINDOWS windows.
+    found: dict[str, int] = {}
+    step = chunk_size * PARALLEL_POLL_WINDOWS
+    with (
+        open(filepath, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for lo in range(start, end, step):
+            if cancelled():
+                break
+            matcher = MultiPatternMatcher(p for p in patterns if p not in found)
+            for pattern, offset in matcher.scan_bytes(
+                mm, chunk_size=chunk_size, start=lo, end=min(lo + step, end)
+            ):
+                found[pattern] = offset
+            if not stop_on.isdisjoint(found) or len(found) == len(patterns):
+                break
+    return found
+
+
+def _line_start(f: BinaryIO, pos: int) -> int:
+    # Offset of the first line starting at or after ``pos``: a byte range
+    # owns the rows that begin inside it.
+    if pos == 0:
+        return 0
+    f.seek(pos - 1)
+    if f.read(1) != b"\n":
+        f.readline()
+    return f.tell()
+
+
+def _scan_csv_range(
+    start: int,
+    end: int,
+    filepath: str,
+    encoding: str,
+    target_word: str,
+    width: int,
+    columns: Sequence[int],
+    company_idx: int,
+    batch_size: int,
+) -> tuple[bool, bool, bool]:
+    # Runs in a parallel scan worker. Returns (found outside the company
+    # column, found in the company column, has data rows).
+    outside = found_in_company = has_data_rows = False
+    with open(filepath, "rb") as f:
+        begin, finish = _line_start(f, start), _line_start(f, end)
+        f.seek(begin)
+        left = finish - begin
+        pending = b""
+        while left > 0 and not cancelled():
+            block = f.read(min(CSV_BLOCK_BYTES, left))
+            left -= len(block)
+            data = pending + block
+            cut = data.rfind(b"\n") + 1 if left > 0 else len(data)
+            pending = data[cut:]
+            text = data[:cut].decode(encoding, errors="ignore")
+            rows = filter(None, csv.reader(io.StringIO(text, newline="")))
+            while batch := list(islice(rows, batch_size)):
+                has_data_rows = True
+                outside, found_in_company = _scan_column_block(
+                    batch,
+                    target_word,
+                    width=width,
+                    columns=columns,
+                    company_idx=company_idx,
+                    found_in_company=found_in_company,
+                )
+                if outside:
+                    return outside, found_in_company, has_data_rows
+    return outside, found_in_company, has_data_rows
+
+
+def _describe(matches: Mapping[str, int], words: Mapping[str, str]) -> str:
+    return ", ".join(f"'{words[p]}' (byte {o})" for p, o in matches.items())
+
+
+# Encodings in which every byte below 0x80 is the ASCII character itself and
+# never part of a multi-byte sequence, so ASCII words can be found in raw bytes.
+_ASCII_COMPATIBLE = frozenset({"ascii", "utf-8", "utf-8-sig", "iso8859-1", "cp1252"})
+
+
 class TxtFileHandler(BaseFileHandler):
+    target_words: ClassVar[tuple[str, ...]] = TXT_TARGET_WORDS
+    deny_words: ClassVar[tuple[str, ...]] = TXT_DENY_WORDS
+    use_mmap: ClassVar[bool] = TXT_MMAP
+    parallel: ClassVar[bool] = PARALLEL_TXT
+    parallel_workers: ClassVar[int] = PARALLEL_WORKERS
+    parallel_min_bytes: ClassVar[int] = PARALLEL_MIN_BYTES
+
+    supports_streaming: ClassVar[bool] = True
+
+    @staticmethod
+    def _decode(
+        f: BinaryIO, *, chunk_size: int, encoding: str
+    ) -> Generator[tuple[int, str], None, None]:
+        # Yields (byte offset, text) pairs; the offset accounts for a
+        # multi-byte character split across reads and held by the decoder.
+        # A utf-8-sig BOM is decoded as U+FEFF rather than dropped, so the
+        # offsets still count its three bytes, as the mmap scan does.
+        if codecs.lookup(encoding).name == "utf-8-sig":
+            encoding = "utf-8"
+        decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        offset = 0
+        while chunk := f.read(chunk_size):
+            pending = len(decoder.getstate()[0])
+            yield offset - pending, decoder.decode(chunk)
+            offset += len(chunk)
+        pending = len(decoder.getstate()[0])
+        if text := decoder.decode(b"", final=True):
+            yield offset - pending, text
+
     @classmethod
     def _read(
         cls, filepath: str, *, chunk_size: int, encoding: str
-    ) -> Generator[str, None, None]:
-        with open(filepath, encoding=encoding, errors="ignore") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
+    ) -> Generator[tuple[int, str], None, None]:
+        with open(filepath, "rb") as f:
+            yield from cls._decode(f, chunk_size=chunk_size, encoding=encoding)
+
+    @classmethod
+    def _words(cls) -> tuple[dict[str, str], dict[str, str]]:
+        # casefolded pattern -> word as configured, for targets and deny-list
+        targets = {w.casefold(): w for w in cls.target_words if w}
+        denied = {w.casefold(): w for w in cls.deny_words if w}
+        return targets, denied
+
+    @classmethod
+    def _verdict(
+        cls,
+        scan: Generator[Match, None, None],
+        targets: Mapping[str, str],
+        denied: Mapping[str, str],
+    ) -> ValidationResult:
+        words = {**targets, **denied}
+        found: dict[str, int] = {}
+
+        with closing(scan) as matches:
+            for pattern, offset in matches:
+                if pattern in denied:
+                    return ValidationResult(
+                        False,
+                        f"Denied word {_describe({pattern: offset}, words)} found in text — file is invalid",
+                        {pattern: offset},
+                    )
+                found[pattern] = offset
+                # Without a deny-list the first target settles the verdict.
+                if not denied:
                     break
-                yield chunk
+
+        if found:
+            label = "Word" if len(found) == 1 else "Words"
+            return ValidationResult(
+                True, f"{label} {_describe(found, words)} found in text", found
+            )
+        if len(targets) == 1:
+            return ValidationResult(
+                False, f"Word {TARGET_WORD_DISPLAY} not found in text"
+            )
+        expected = ", ".join(f"'{w}'" for w in targets.values())
+        return ValidationResult(False, f"None of the words {expected} found in text")
 
     @classmethod
+    def _scan_mmap(
+        cls, filepath: str, matcher: MultiPatternMatcher, *, chunk_size: int
+    ) -> Generator[Match, None, None]:
+        with open(filepath, "rb") as f:
+            # mmap refuses empty files.
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                yield from matcher.scan_bytes(mm, chunk_size=chunk_size)
+
+    @classmethod
+    def _scan_text(
+        cls,
+        filepath: str,
+        matcher: MultiPatternMatcher,
+        *,
+        chunk_size: int,
+        encoding: str,
+    ) -> Generator[Match, None, None]:
+        with closing(
+            cls._read(filepath, chunk_size=chunk_size, encoding=encoding)
+        ) as chunks:
+            yield from matcher.scan(chunks, encoding=encoding)
+
+    @classmethod
+    def _scan_parallel(
+        cls,
+        filepath: str,
+        matcher: MultiPatternMatcher,
+        *,
+        stop_on: frozenset[str],
+        chunk_size: int,
+        workers: int,
+    ) -> Generator[Match, None, None]:
+        size = os.path.getsize(filepath)
+        results = run_ranges(
+            _scan_txt_range,
+            split_ranges(0, size, workers * RANGES_PER_WORKER),
+            workers=workers,
+            decisive=lambda found: not stop_on.isdisjoint(found),
+            args=(filepath, matcher.patterns, stop_on, chunk_size),
+        )
+        first: dict[str, int] = {}
+        for found in results:
+            for pattern, offset in found.items():
+                first[pattern] = min(offset, first.get(pattern, offset))
+        yield from sorted(
+            (Match(p, o) for p, o in first.items()), key=lambda m: m.offset
+        )
+
+    @classmethod
+    @instrumented
     def validate(cls, filepath: str, **kwargs: Any) -> ValidationResult:
         chunk_size = int(kwargs.get("chunk_size", DEFAULT_TXT_CHUNK))
+        mmap_chunk_size = int(kwargs.get("mmap_chunk_size", TXT_MMAP_CHUNK))
         encoding = str(kwargs.get("encoding", "utf-8"))
+        use_mmap = bool(kwargs.get("mmap", cls.use_mmap))
+        parallel = bool(kwargs.get("parallel", cls.parallel))
+        workers = int(kwargs.get("workers", cls.parallel_workers))
+        min_bytes = int(kwargs.get("parallel_min_bytes", cls.parallel_min_bytes))
 
-        target_word = cls.target_word_lower()
-        if not target_word:
+        if not cls.target_word_lower():
             return ValidationResult(
                 False, f"Target word {TARGET_WORD_DISPLAY} is empty"
             )
 
-        tail = ""
-        overlap = max(len(target_word) - 1, 0)
+        targets, denied = cls._words()
+        matcher = MultiPatternMatcher({**targets, **denied})
 
-        for chunk in cls._read(filepath, chunk_size=chunk_size, encoding=encoding):
-            s = (tail + chunk).casefold()
-            if target_word in s:
-                return ValidationResult(
-                    True, f"Word {TARGET_WORD_DISPLAY} found in text"
-                )
-            tail = s[-overlap:] if overlap else ""
+        ascii_file = codecs.lookup(encoding).name in _ASCII_COMPATIBLE
+        if not (use_mmap and ascii_file and matcher.ascii_only):
+            scan = cls._scan_text(
+                filepath, matcher, chunk_size=chunk_size, encoding=encoding
+            )
+        elif (
+            parallel
+            and workers > 1
+            and not in_job_process()
+            and os.path.getsize(filepath) >= min_bytes
+        ):
+            # The scan is decided by any deny word, or without a deny-list
+            # by any target word.
+            scan = cls._scan_parallel(
+                filepath,
+                matcher,
+                stop_on=frozenset(denied or targets),
+                chunk_size=mmap_chunk_size,
+                workers=workers,
+            )
+        else:
+            scan = cls._scan_mmap(filepath, matcher, chunk_size=mmap_chunk_size)
 
-        return ValidationResult(False, f"Word {TARGET_WORD_DISPLAY} not found in text")
+        return cls._verdict(scan, targets, denied)
 
+    @classmethod
+    @instrumented
+    def validate_stream(
+        cls, chunks: Iterable[bytes], **kwargs: Any
+    ) -> ValidationResult:
+        chunk_size = int(kwargs.get("chunk_size", DEFAULT_TXT_CHUNK))
+        encoding = str(kwargs.get("encoding", "utf-8"))
+
+        if not cls.target_word_lower():
+            return ValidationResult(
+                False, f"Target word {TARGET_WORD_DISPLAY} is empty"
+            )
+
+        targets, denied = cls._words()
+        matcher = MultiPatternMatcher({**targets, **denied})
+        texts = cls._decode(
+            ChunkReader(chunks), chunk_size=chunk_size, encoding=encoding
+        )
+        return cls._verdict(matcher.scan(texts, encoding=encoding), targets, denied)
+
+
+class TabularFileHandler(BaseFileHandler):
+    engine: ClassVar[str] = TABULAR_ENGINE
+
+    supports_report: ClassVar[bool] = True
+
+    @classmethod
+    def _validate_rows(
+        cls, rows: Iterable[Sequence[Any]], **kwargs: Any
+    ) -> ValidationResult:
+        if not metrics.enabled:
+            return cls._check_rows(rows, **kwargs)
+        # Time spent pulling rows is reading and parsing; the rest of the
+        # handler's run time is the check itself.
+        timed = metrics.TimedIterator(rows)
+        result = cls._check_rows(timed, **kwargs)
+        result.stats.update(rows=timed.count, parse_seconds=timed.seconds)
+        return result
+
+    @classmethod
+    def _check_rows(
+        cls, rows: Iterable[Sequence[Any]], **kwargs: Any
+    ) -> ValidationResult:
+        engine = str(kwargs.get("engine", cls.engine))
+        max_violations = int(kwargs.get("max_violations", 0))
+        batch_size = int(kwargs.get("batch_size", DEFAULT_TABULAR_BATCH))
+        target_word = cls.target_word_lower()
+
+        if max_violations > 0:
+            return report_tabular_violations(
+                rows, target_word, max_violations=max_violations, batch_size=batch_size
+            )
+        if engine == "columns":
+            return validate_tabular_columns(rows, target_word, batch_size=batch_size)
+        if engine == "rows":
+            return validate_tabular_data(iter_records(rows), target_word)
+        raise ValueError(f"Unknown tabular engine {engine!r}")
+
+
+class CsvFileHandler(TabularFileHandler):
+    # Splitting on line ends assumes no quoted field contains a newline,
+    # which is why parallel CSV scanning is opt-in.
+    parallel: ClassVar[bool] = PARALLEL_CSV
+    supports_streaming: ClassVar[bool] = True
+    parallel_workers: ClassVar[int] = PARALLEL_WORKERS
+    parallel_min_bytes: ClassVar[int] = PARALLEL_MIN_BYTES
+
+    @classmethod
+    def _read(cls, filepath: str, *, encoding: str) -> Generator[list[str], None, None]:
+        with open(filepath, newline="", encoding=encoding, errors="ignore") as f:
+            yield from csv.reader(f)
+
+    @classmethod
+    def _validate_parallel(
+        cls, filepath: str, *, encoding: str, workers: int, batch_size: int
+    ) -> ValidationResult | None:
+        with open(filepath, "rb") as f:
+            header_line = f.readline()
+            header_end = f.tell()
+            size = os.fstat(f.fileno()).st_size
+
+        header = next(csv.reader([header_line.decode(encoding, errors="ignore")]), None)
+        if not header:
+            return None
+        width, columns, company_idx = _header_columns(header)
+        if company_idx is None:
+            return None
+
+        results = run_ranges(
+            _scan_csv_range,
+            split_ranges(header_end, size, workers * RANGES_PER_WORKER),
+            workers=workers,
+            decisive=lambda result: result[0],
+            args=(
+                filepath,
+                encoding,
+                cls.target_word_lower(),
+                width,
+                columns,
+                company_idx,
+                batch_size,
+            ),
+        )
+        if any(outside for outside, _, _ in results):
+            return _outside_company_result()
+        return _company_result(
+            any(has_rows for _, _, has_rows in results),
+            any(found for _, found, _ in results),
+        )
 
-class CsvFileHandler(BaseFileHandler):
     @classmethod
+    @instrumented
     def validate(cls, filepath: str, **kwargs: Any) -> ValidationResult:
         encoding = str(kwargs.get("encoding", "utf-8-sig"))
+        workers = int(kwargs.get("workers", cls.parallel_workers))
+        min_bytes = int(kwargs.get("parallel_min_bytes", cls.parallel_min_bytes))
+        target_word = cls.target_word_lower()
 
-        with open(filepath, newline="", encoding=encoding, errors="ignore") as f:
-            reader = csv.DictReader(f)
-            rows = [normalize_row(row) for row in reader]
-        return validate_tabular_data(rows, cls.target_word_lower())
+        # Parallel ranges cannot number rows, so a full report reads in order.
+        if (
+            bool(kwargs.get("parallel", cls.parallel))
+            and not int(kwargs.get("max_violations", 0))
+            and workers > 1
+            and not in_job_process()
+            and target_word
+            and _columnar_target(target_word)
+            and codecs.lookup(encoding).name in _ASCII_COMPATIBLE
+            and os.path.getsize(filepath) >= min_bytes
+        ):
+            batch_size = int(kwargs.get("batch_size", DEFAULT_TABULAR_BATCH))
+            result = cls._validate_parallel(
+                filepath, encoding=encoding, workers=workers, batch_size=batch_size
+            )
+            if result is not None:
+                return result
 
+        with closing(cls._read(filepath, encoding=encoding)) as rows:
+            return cls._validate_rows(rows, **kwargs)
 
-class XlsxFileHandler(BaseFileHandler):
     @classmethod
+    @instrumented
+    def validate_stream(
+        cls, chunks: Iterable[bytes], **kwargs: Any
+    ) -> ValidationResult:
+        encoding = str(kwargs.get("encoding", "utf-8-sig"))
+
+        buffer = io.BufferedReader(ChunkReader(chunks))
+        with io.TextIOWrapper(
+            buffer, encoding=encoding, errors="ignore", newline=""
+        ) as f:
+            return cls._validate_rows(csv.reader(f), **kwargs)
+
+
+class XlsxFileHandler(TabularFileHandler):
+    @staticmethod
+    def _header(cells: Sequence[Any]) -> list[str]:
+        # Same column naming as pandas.read_excel: blank headers become
+        # "Unnamed: <idx>" and duplicates get a ".<n>" suffix.
+        header: list[str] = []
+        seen: dict[str, int] = {}
+        for idx, cell in enumerate(cells):
+            name = f"Unnamed: {idx}" if cell is None else str(cell)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            header.append(name)
+        return header
+
+    @classmethod
+    def _read(
+        cls, filepath: str, *, sheet: int = 0
+    ) -> Generator[Sequence[Any], None, None]:
+        # Imported here: openpyxl takes ~300 ms to import and only XLSX
+        # uploads need it.
+        from openpyxl import load_workbook
+
+        wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+        try:
+            rows = wb.worksheets[sheet].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            yield cls._header(header)
+            # Empty rows come through as () so they keep their row number;
+            # like csv.reader's [] they are skipped as blank.
+            for row in rows:
+                yield row if any(v is not None for v in row) else ()
+        finally:
+            wb.close()
+
+    @classmethod
+    @instrumented
     def validate(cls, filepath: str, **kwargs: Any) -> ValidationResult:
-        df = pd.read_excel(filepath, dtype=str).fillna("")
-        rows = [normalize_row(rec) for rec in df.to_dict(orient="records")]
-        return validate_tabular_data(rows, cls.target_word_lower())
+        sheet = int(kwargs.get("sheet", 0))
+
+        with closing(cls._read(filepath, sheet=sheet)) as rows:
+            return cls._validate_rows(rows, **kwargs)
@@ -0,0 +1,111 @@
+import codecs
+import mmap
+from collections.abc import Iterable, Iterator
+from typing import AnyStr, NamedTuple
+
+
+class Match(NamedTuple):
+    pattern: str
+    offset: int
+
+
+def _without_bom(encoding: str) -> str:
+    # utf-8-sig writes a BOM in front of everything it encodes, which would
+    # add 3 to every length measured with it.
+    return "utf-8" if codecs.lookup(encoding).name == "utf-8-sig" else encoding
+
+
+def _byte_offset(window: str, folded: str, index: int, encoding: str) -> int:
+    # casefold() can expand characters ("ß" -> "ss"), so an index into the
+    # folded text only equals the index into the original when lengths agree.
+    if len(folded) != len(window):
+        folded_len = 0
+        for pos, ch in enumerate(window):
+            if folded_len >= index:
+                index = pos
+                break
+            folded_len += len(ch.casefold())
+        else:
+            index = len(window)
+    return len(window[:index].encode(encoding, errors="ignore"))
+
+
+def _first_hits(
+    text: AnyStr, remaining: list[AnyStr]
+) -> Iterator[tuple[int, list[AnyStr]]]:
+    # One find per remaining pattern: CPython's fastsearch skips through the
+    # text far quicker than a regex alternation tries every position, even
+    # with several patterns. Yields (position, patterns first found there)
+    # in text order and removes those patterns from ``remaining``.
+    hits: dict[int, list[AnyStr]] = {}
+    for pattern in remaining:
+        if (pos := text.find(pattern)) >= 0:
+            hits.setdefault(pos, []).append(pattern)
+    for pos in sorted(hits):
+        for pattern in hits[pos]:
+            remaining.remove(pattern)
+        yield pos, hits[pos]
+
+
+class MultiPatternMatcher:
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = tuple(dict.fromkeys(p.casefold() for p in patterns if p))
+        self.overlap = max(map(len, self.patterns), default=1) - 1
+
+    @property
+    def ascii_only(self) -> bool:
+        return all(p.isascii() for p in self.patterns)
+
+    def scan(
+        self, chunks: Iterable[tuple[int, str]], *, encoding: str = "utf-8"
+    ) -> Iterator[Match]:
+        # Only the first occurrence of each pattern is reported; found patterns
+        # are dropped from the search so a frequent word does not slow down
+        # the scan for the others.
+        remaining = list(self.patterns)
+        tail, tail_bytes = "", 0
+        encoding = _without_bom(encoding)
+
+        for start, chunk in chunks:
+            if not remaining:
+                return
+            window = tail + chunk
+            window_start = start - tail_bytes
+            folded = window.casefold()
+
+            for pos, found in _first_hits(folded, remaining):
+                offset = window_start + _byte_offset(window, folded, pos, encoding)
+                for pattern in found:
+                    yield Match(pattern, offset)
+
+            tail = window[-self.overlap :] if self.overlap else ""
+            tail_bytes = len(tail.encode(encoding, errors="ignore"))
+
+    def scan_bytes(
+        self,
+        data: bytes | mmap.mmap,
+        *,
+        chunk_size: int,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[Match]:
+        # Byte-level variant of scan() for ASCII patterns over ASCII-compatible
+        # data such as an mmap of a UTF-8 file. bytes.lower() only folds A-Z;
+        # the one thing it misses is a non-ASCII character whose casefold is
+        # ASCII (e.g. the Kelvin sign), which scan() would match.
+        #
+        # Only [start, end) is scanned for match starts; the last window reads
+        # past ``end`` so a match straddling it is still found.
+        remaining = [p.encode("ascii") for p in self.patterns]
+        stop = len(data) if end is None else min(end, len(data))
+        for lo in range(start, stop, chunk_size):
+            if not remaining:
+                return
+            hi = lo + chunk_size
+            if hi >= stop:
+                hi = stop + self.overlap
+            window_start = max(lo - self.overlap, start)
+            window = data[window_start:hi].lower()
+            for pos, found in _first_hits(window, remaining):
+                for pattern in found:
+                    yield Match(pattern.decode("ascii"), window_start + pos)
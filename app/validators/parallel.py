@@ -0,0 +1,148 @@
+import multiprocessing as mp
+import queue
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, TypeVar
+
+from .constants import PARALLEL_WORKERS
+
+R = TypeVar("R")
+
+# Ranges per worker: smaller ranges let an early decisive hit cancel more of
+# the remaining work and even out workers that finish at different speeds.
+RANGES_PER_WORKER = 4
+# Scans that may share the pool at once; each has its own cancel flag.
+MAX_SCANS = 32
+
+# One pool for the whole process, so concurrent validations share
+# PARALLEL_WORKERS processes instead of starting a pool each. Its workers
+# come from a fork server: forking this process, which runs request and
+# validation threads, could copy a lock some other thread holds. Other
+# process pools of the app start their workers the same way.
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+mp_context = mp.get_context(
+    "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+)
+_flags = mp_context.RawArray("b", MAX_SCANS)
+_free_slots: queue.SimpleQueue[int] = queue.SimpleQueue()
+for _slot in range(MAX_SCANS):
+    _free_slots.put(_slot)
+
+# Set in each pool worker: the flags, and the slot of the range it runs.
+_worker_flags: Any = None
+_worker_slot = 0
+
+_in_job_process = False
+
+
+def _init_worker(flags: Any) -> None:
+    global _worker_flags
+    _worker_flags = flags
+
+
+def _run_range(slot: int, fn: Callable[..., R], *args: Any) -> R:
+    global _worker_slot
+    _worker_slot = slot
+    return fn(*args)
+
+
+def cancelled() -> bool:
+    return _worker_flags is not None and bool(_worker_flags[_worker_slot])
+
+
+def mark_job_process() -> None:
+    # Initializer of the validation process pool. Jobs there scan on their
+    # own: a scan pool in every job process would multiply the processes.
+    global _in_job_process
+    _in_job_process = True
+
+
+def in_job_process() -> bool:
+    return _in_job_process
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PARALLEL_WORKERS,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(_flags,),
+            )
+        return _pool
+
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def split_ranges(start: int, end: int, parts: int) -> list[tuple[int, int]]:
+    step = max(-(-(end - start) // max(parts, 1)), 1)
+    return [(lo, min(lo + step, end)) for lo in range(start, end, step)]
+
+
+def _free_when_done(futures: Iterable[Future], slot: int) -> None:
+    # A cancelled range may still be running; its slot is reused only after
+    # it stops, so it cannot miss the cancel flag.
+    futures = list(futures)
+    pending = len(futures)
+    lock = threading.Lock()
+
+    def done(_: Future) -> None:
+        nonlocal pending
+        with lock:
+            pending -= 1
+            last = pending == 0
+        if last:
+            _free_slots.put(slot)
+
+    if not futures:
+        _free_slots.put(slot)
+    for future in futures:
+        future.add_done_callback(done)
+
+
+def run_ranges(
+    fn: Callable[..., R],
+    ranges: Sequence[tuple[int, int]],
+    *,
+    workers: int,
+    decisive: Callable[[R], bool],
+    args: Sequence[Any] = (),
+) -> list[R]:
+    # fn(start, end, *args) runs in a pool worker and should poll
+    # cancelled() between blocks; once any result is decisive, queued ranges
+    # are dropped and running ones stop at their next poll. At most
+    # ``workers`` ranges of one call run at a time.
+    slot = _free_slots.get()
+    _flags[slot] = 0
+    pool = _get_pool()
+    todo = iter(ranges)
+    running: set[Future] = set()
+    results: list[R] = []
+    try:
+        while True:
+            for lo, hi in islice(todo, max(workers - len(running), 0)):
+                running.add(pool.submit(_run_range, slot, fn, lo, hi, *args))
+            if not running:
+                break
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            finished = [future.result() for future in done]
+            results.extend(finished)
+            if any(map(decisive, finished)):
+                break
+    finally:
+        _flags[slot] = 1
+        for future in running:
+            future.cancel()
+        _free_when_done(running, slot)
+    return results
@@ -0,0 +1,83 @@
+import threading
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from importlib.metadata import entry_points
+
+from .base import BaseFileHandler
+
+# Third-party packages add formats by declaring, in their pyproject.toml:
+#
+#   [project.entry-points."file_validator.handlers"]
+#   ".parquet" = "my_package.handlers:ParquetFileHandler"
+ENTRY_POINT_GROUP = "file_validator.handlers"
+
+
+def normalize_extension(extension: str) -> str:
+    extension = extension.lower()
+    return extension if extension.startswith(".") else f".{extension}"
+
+
+class HandlerRegistry(Mapping[str, type[BaseFileHandler]]):
+    # Maps file extensions to handler classes given as "module:attr" paths.
+    # A handler module is imported the first time its extension is looked
+    # up, so importing the app (or alembic) does not pay for openpyxl and
+    # friends. Membership tests and iteration never import handlers.
+    def __init__(
+        self, handlers: Mapping[str, str], *, group: str | None = ENTRY_POINT_GROUP
+    ) -> None:
+        self._paths = {normalize_extension(ext): path for ext, path in handlers.items()}
+        self._loaded: dict[str, type[BaseFileHandler]] = {}
+        self._group = group
+        self._lock = threading.Lock()
+
+    def _discover(self) -> None:
+        # Entry points are read once, on first use; built-in handlers win
+        # over plugins claiming the same extension.
+        if self._group is None:
+            return
+        with self._lock:
+            if self._group is None:
+                return
+            for ep in entry_points(group=self._group):
+                self._paths.setdefault(normalize_extension(ep.name), ep.value)
+            self._group = None
+
+    def register(self, extension: str, handler: type[BaseFileHandler] | str) -> None:
+        extension = normalize_extension(extension)
+        self._loaded.pop(extension, None)
+        if isinstance(handler, str):
+            self._paths[extension] = handler
+        else:
+            self._paths[extension] = f"{handler.__module__}:{handler.__qualname__}"
+            self._loaded[extension] = handler
+
+    def unregister(self, extension: str) -> None:
+        extension = normalize_extension(extension)
+        self._paths.pop(extension, None)
+        self._loaded.pop(extension, None)
+
+    def __getitem__(self, extension: str) -> type[BaseFileHandler]:
+        self._discover()
+        extension = normalize_extension(extension)
+        handler = self._loaded.get(extension)
+        if handler is None:
+            module, _, attr = self._paths[extension].partition(":")
+            handler = getattr(import_module(module), attr)
+            if not (isinstance(handler, type) and issubclass(handler, BaseFileHandler)):
+                raise TypeError(f"{self._paths[extension]} is not a file handler")
+            self._loaded[extension] = handler
+        return handler
+
+    def __contains__(self, extension: object) -> bool:
+        self._discover()
+        return (
+            isinstance(extension, str) and normalize_extension(extension) in self._paths
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._paths))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._paths)
@@ -0,0 +1,25 @@
+import io
+from collections.abc import Iterable
+
+
+class ChunkReader(io.RawIOBase):
+    # Read-only binary file over an iterable of byte chunks, so handlers can
+    # consume a request body with the same code that reads files. A read
+    # returns as soon as one chunk is available instead of filling the buffer.
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
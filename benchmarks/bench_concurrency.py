@@ -0,0 +1,156 @@
+"""Requests/sec of the API under many concurrent clients.
+
+Starts uvicorn against a throw-away SQLite database once per configuration
+and hammers one endpoint with concurrent keep-alive clients:
+
+    python -m benchmarks.bench_concurrency --threadpool 40 200 --concurrency 400
+
+Every THREADPOOL_SIZE is run with the sync engine and with DB_ASYNC=true
+(needs the "async" extra); --db-async picks one. Other settings, like the
+SQLite tuning flags, can be added with --env.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def seed(db_url: str, files: int) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.db.database import Base
+    from app.db.models import Comment, FileUpload, User
+
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        user = User(email="bench@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        for i in range(files):
+            f = FileUpload(
+                filename=f"f{i}.txt",
+                file_type=".txt",
+                valid=True,
+                reason="ok",
+                uploader_id=user.id,
+            )
+            f.comments.append(Comment(text="hi", user_id=user.id))
+            db.add(f)
+        db.commit()
+    engine.dispose()
+
+
+async def hammer(
+    url: str, concurrency: int, duration: float
+) -> tuple[int, int, list[float]]:
+    latencies: list[float] = []
+    done = errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+        async def worker() -> None:
+            nonlocal done, errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    resp = await client.get(url)
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                if resp.status_code != 200:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+                done += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return done, errors, latencies
+
+
+def run_config(env: dict[str, str], args: argparse.Namespace) -> None:
+    port = free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "critical",
+        ],
+        env={**os.environ, **env},
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        for _ in range(100):
+            try:
+                httpx.get(f"{base}/docs", timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        done, errors, latencies = asyncio.run(
+            hammer(base + args.path, args.concurrency, args.duration)
+        )
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else float("nan")
+    label = " ".join(
+        f"{k}={v}" for k, v in env.items() if k != "SQLALCHEMY_DATABASE_URL"
+    )
+    print(f"{label:<40} {done / args.duration:>10.1f} {p95 * 1000:>12.1f} {errors:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threadpool", type=int, nargs="+", default=[40, 200])
+    parser.add_argument(
+        "--db-async", nargs="+", choices=["false", "true"], default=["false", "true"]
+    )
+    parser.add_argument("--env", nargs="*", default=[], help="extra KEY=VALUE pairs")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--path", default="/files?limit=50")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        seed(db_url, args.files)
+        extra = dict(pair.split("=", 1) for pair in args.env)
+        print(f"{'configuration':<40} {'req/s':>10} {'p95, ms':>12} {'errors':>8}")
+        for size in args.threadpool:
+            for db_async in args.db_async:
+                env = {
+                    "SQLALCHEMY_DATABASE_URL": db_url,
+                    "THREADPOOL_SIZE": str(size),
+                    "DB_ASYNC": db_async,
+                    **extra,
+                }
+                run_config(env, args)
+
+
+if __name__ == "__main__":
+    main()
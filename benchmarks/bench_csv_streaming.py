@@ -0,0 +1,94 @@
+"""Peak RSS and time-to-verdict of the CSV handler, eager vs streaming.
+
+Run from the project root:
+
+    python -m benchmarks.bench_csv_streaming --rows 2000000
+
+Every measurement runs in a fresh process so ``ru_maxrss`` is not polluted
+by the previous run.
+"""
+
+import argparse
+import csv
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+
+
+def write_csv(path: Path, rows: int, bad_row: int | None) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["User", COMPANY_NAME_COL, "Age", "Comment"])
+        for i in range(rows):
+            user = TARGET_WORD if i == bad_row else f"user{i}"
+            company = f"{TARGET_WORD} LLC" if i == 0 else f"Company {i % 97}"
+            writer.writerow([user, company, str(i % 90), "lorem ipsum dolor sit amet"])
+
+
+def eager_validate(path: str):
+    from app.validators.handlers import (
+        CsvFileHandler,
+        normalize_row,
+        validate_tabular_data,
+    )
+
+    with open(path, newline="", encoding="utf-8-sig", errors="ignore") as f:
+        rows = [normalize_row(row) for row in csv.DictReader(f)]
+    return validate_tabular_data(rows, CsvFileHandler.target_word_lower())
+
+
+def streaming_validate(path: str):
+    from app.validators.handlers import CsvFileHandler
+
+    return CsvFileHandler.validate(path)
+
+
+MODES = {"eager": eager_validate, "streaming": streaming_validate}
+
+
+def _measure(mode: str, path: str, out: mp.Queue) -> None:
+    import app.validators.handlers  # noqa: F401  keep import cost out of timing
+
+    start = time.perf_counter()
+    result = MODES[mode](path)
+    elapsed = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    out.put((elapsed, peak_kib, result.valid))
+
+
+def measure(mode: str, path: str) -> tuple[float, int, bool]:
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(mode, path, out))
+    proc.start()
+    res = out.get()
+    proc.join()
+    return res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    scenarios = {"invalid at row 3": 2, "valid (full scan)": None}
+    with tempfile.TemporaryDirectory() as tmp:
+        for title, bad_row in scenarios.items():
+            path = Path(tmp) / "bench.csv"
+            write_csv(path, args.rows, bad_row)
+            size_mib = path.stat().st_size / 2**20
+            print(f"\n{title}: {args.rows} rows, {size_mib:.1f} MiB")
+            print(f"{'mode':<10} {'time, s':>10} {'peak RSS, MiB':>15} {'valid':>6}")
+            for mode in MODES:
+                elapsed, peak_kib, valid = measure(mode, str(path))
+                print(
+                    f"{mode:<10} {elapsed:>10.3f} {peak_kib / 1024:>15.1f} {valid!s:>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Cold-start import time of the application.
+
+Run from the project root:
+
+    python -m benchmarks.bench_import_time --runs 5 --top 10
+
+Each run is a fresh ``python -X importtime -c "import <module>"`` process, so
+nothing is cached in ``sys.modules``. Reports the median cumulative import
+time of the module and of the slowest modules it pulls in, and whether
+known heavy dependencies were imported at all.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+HEAVY = ("openpyxl", "pandas", "app.validators.handlers")
+
+
+def import_times(module: str) -> dict[str, int]:
+    # -X importtime writes "import time: self [us] | cumulative | name" lines
+    # to stderr; nested imports are indented.
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    samples: dict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        for name, us in import_times(args.module).items():
+            samples[name].append(us)
+
+    median = {name: statistics.median(us) for name, us in samples.items()}
+    print(f"{args.module}: {median[args.module] / 1000:.0f} ms (median of {args.runs})")
+    print()
+    print(f"{'module':<45} {'cumulative, ms':>15}")
+    for name, us in sorted(median.items(), key=lambda kv: -kv[1])[1 : args.top + 1]:
+        print(f"{name:<45} {us / 1000:>15.1f}")
+    print()
+    for name in HEAVY:
+        loaded = f"{median[name] / 1000:.1f} ms" if name in median else "not imported"
+        print(f"{name:<45} {loaded:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Latency and throughput of the list endpoints over large tables.
+
+Run from the project root:
+
+    python -m benchmarks.bench_list_endpoints --rows 1000 10000 100000
+
+For each size a fresh SQLite file database gets that many files (spread
+over 20 uploaders), plus one file with that many comments. The endpoints
+are called in-process through the ASGI app, so the numbers include query,
+serialization and framework overhead but no network. Reported per
+endpoint: median latency of the first page and rows/s when walking every
+page with the cursor. "bulk comments" asks for the comments of --bulk-files
+files in one request.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.security import get_db, get_session_factory
+from app.db.database import Base
+from app.db.models import Comment, FileUpload, User
+from app.main import app
+
+USERS = 20
+
+
+def seed(url: str, rows: int, bulk_files: int) -> tuple[sessionmaker, int]:
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    start = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"email": f"user{i}@example.com", "password_hash": "x"}
+                for i in range(USERS)
+            ],
+        )
+        conn.execute(
+            insert(FileUpload),
+            [
+                {
+                    "filename": f"file{i}.csv",
+                    "file_type": ".csv",
+                    "valid": i % 3 != 0,
+                    "reason": "Target word found in the company column",
+                    "created_at": start + timedelta(milliseconds=i),
+                    "uploader_id": i % USERS + 1,
+                }
+                for i in range(rows)
+            ],
+        )
+        # The hot file gets every comment but one per file for the first
+        # bulk_files files, so the bulk request has something to group.
+        comments = [
+            {
+                "file_id": 1,
+                "user_id": i % USERS + 1,
+                "created_at": start + timedelta(milliseconds=i),
+            }
+            for i in range(rows)
+        ]
+        comments.extend(
+            {"file_id": f, "user_id": f % USERS + 1, "created_at": start}
+            for f in range(2, min(bulk_files, rows) + 1)
+        )
+        for c in comments:
+            c["text"] = "Looks good, the company column matches."
+            c["updated_at"] = c["created_at"]
+        conn.execute(insert(Comment), comments)
+    return sessionmaker(bind=engine), 1
+
+
+def first_page(client: TestClient, url: str, params: dict, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        resp = client.get(url, params=params)
+        times.append(time.perf_counter() - started)
+        resp.raise_for_status()
+    return statistics.median(times)
+
+
+def walk(client: TestClient, url: str, params: dict, key: str) -> tuple[int, float]:
+    rows = 0
+    cursor = None
+    started = time.perf_counter()
+    while True:
+        resp = client.get(
+            url, params={**params, **({"cursor": cursor} if cursor else {})}
+        )
+        resp.raise_for_status()
+        page = resp.json()
+        rows += len(page[key])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return rows, time.perf_counter() - started
+
+
+def overrides_for(factory: sessionmaker) -> dict:
+    # FastAPI would take a default argument for a query parameter, so the
+    # factory is bound by these closures instead.
+    def override():
+        with factory() as db:
+            yield db
+
+    return {get_db: override, get_session_factory: lambda: factory}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=200, help="page size")
+    parser.add_argument("--bulk-files", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<16} {'rows':>8} {'first page, ms':>15} {'walk, rows/s':>13}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            factory, hot = seed(
+                f"sqlite:///{Path(tmp) / 'bench.db'}", rows, args.bulk_files
+            )
+
+            app.dependency_overrides.update(overrides_for(factory))
+            try:
+                with TestClient(app) as client:
+                    cases = [
+                        ("files", "/files", {"limit": args.limit}, "items"),
+                        (
+                            "file comments",
+                            f"/comments/file/{hot}",
+                            {"limit": args.limit},
+                            "items",
+                        ),
+                    ]
+                    for name, url, params, key in cases:
+                        latency = first_page(client, url, params, args.repeat)
+                        walked, seconds = walk(client, url, params, key)
+                        print(
+                            f"{name:<16} {rows:>8} {latency * 1000:>15.2f} "
+                            f"{walked / seconds:>13,.0f}"
+                        )
+                    ids = list(range(1, min(args.bulk_files, rows) + 1))
+                    latency = first_page(
+                        client,
+                        "/comments",
+                        {"file_id": ids, "limit": args.limit},
+                        args.repeat,
+                    )
+                    print(
+                        f"{'bulk comments':<16} {rows:>8} {latency * 1000:>15.2f} {'-':>13}"
+                    )
+            finally:
+                app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Wall time of sequential vs parallel TXT/CSV scanning.
+
+Run from the project root:
+
+    python -m benchmarks.bench_parallel_scan --size-mib 1024 --workers 1 2 4 8
+
+Workers = 1 is the sequential path. Two scenarios per file type: no match
+anywhere (every range is scanned) and a decisive hit at 10% of the file
+(the remaining ranges are cancelled).
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+from app.validators import parallel
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+from app.validators.handlers import CsvFileHandler, TxtFileHandler
+
+from .bench_txt_matcher import write_text
+
+
+def write_txt(path: Path, size_mib: int, hit_at: float | None) -> None:
+    write_text(path, size_mib)
+    if hit_at is not None:
+        with path.open("r+b") as f:
+            f.seek(int(path.stat().st_size * hit_at))
+            f.write(f" {TARGET_WORD} ".encode())
+
+
+def write_csv(path: Path, size_mib: int, hit_at: float | None) -> None:
+    row = ["user", "Company", "42", "lorem ipsum dolor sit amet"]
+    rows = size_mib * 2**20 // len(",".join(row))
+    bad_row = None if hit_at is None else int(rows * hit_at)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["User", COMPANY_NAME_COL, "Age", "Comment"])
+        for i in range(rows):
+            writer.writerow([TARGET_WORD, *row[1:]] if i == bad_row else row)
+
+
+HANDLERS = {
+    "txt": (write_txt, TxtFileHandler, {"parallel": True}),
+    # The parallel CSV path always uses the columnar engine.
+    "csv": (write_csv, CsvFileHandler, {"parallel": True, "engine": "columns"}),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mib", type=int, default=512)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--types", nargs="+", choices=HANDLERS, default=list(HANDLERS))
+    args = parser.parse_args()
+    # Scans share one pool; size it for the largest run.
+    parallel.PARALLEL_WORKERS = max(args.workers)
+
+    scenarios = {"no match": None, "hit at 10%": 0.1}
+    print(f"{'type':<5} {'scenario':<12} {'workers':>8} {'time, s':>9} {'valid':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in args.types:
+            write, handler, options = HANDLERS[kind]
+            for title, hit_at in scenarios.items():
+                path = Path(tmp) / f"bench.{kind}"
+                write(path, args.size_mib, hit_at)
+                path.read_bytes()
+                for workers in args.workers:
+                    start = time.perf_counter()
+                    res = handler.validate(
+                        str(path), workers=workers, parallel_min_bytes=0, **options
+                    )
+                    elapsed = time.perf_counter() - start
+                    print(
+                        f"{kind:<5} {title:<12} {workers:>8} {elapsed:>9.2f} "
+                        f"{res.valid!s:>6}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
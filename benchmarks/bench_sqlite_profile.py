@@ -0,0 +1,139 @@
+"""Writer/reader throughput of a SQLite file database, tuned vs untuned.
+
+Run from the project root:
+
+    python -m benchmarks.bench_sqlite_profile --writers 8 --readers 8
+
+Each profile runs in a fresh process (the pragmas and pool size are read
+from ``Settings`` at import time) against its own database file. Writers
+insert comments one transaction at a time, readers run the ``GET /files``
+listing query; "locked" counts operations that failed with "database is
+locked".
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROFILES = {
+    "untuned": {"SQLITE_TUNING": "false"},
+    "tuned": {"SQLITE_TUNING": "true"},
+}
+
+
+def _run(env: dict[str, str], args: argparse.Namespace, out: mp.Queue) -> None:
+    os.environ.update(env)
+
+    from sqlalchemy import select
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.orm import joinedload, undefer
+
+    from app.db.database import Base, SessionLocal, engine
+    from app.db.models import Comment, FileUpload, User
+
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        user = User(email="bench@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        db.add_all(
+            FileUpload(
+                filename=f"f{i}.txt",
+                file_type=".txt",
+                valid=True,
+                reason="ok",
+                uploader_id=user.id,
+            )
+            for i in range(args.files)
+        )
+        db.commit()
+        user_id = user.id
+
+    listing = (
+        select(FileUpload)
+        .options(joinedload(FileUpload.uploader), undefer(FileUpload.comment_count))
+        .order_by(FileUpload.created_at.desc(), FileUpload.id.desc())
+        .limit(50)
+    )
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def record(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def writer(n: int) -> None:
+        i = 0
+        while time.perf_counter() < deadline:
+            i += 1
+            try:
+                with SessionLocal() as db:
+                    db.add(
+                        Comment(
+                            text=f"w{n}-{i}",
+                            file_id=i % args.files + 1,
+                            user_id=user_id,
+                        )
+                    )
+                    db.commit()
+            except OperationalError:
+                record("locked")
+                continue
+            record("writes")
+
+    def reader() -> None:
+        while time.perf_counter() < deadline:
+            try:
+                with SessionLocal() as db:
+                    db.execute(listing).unique().scalars().all()
+            except OperationalError:
+                record("locked")
+                continue
+            record("reads")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+    out.put(counts)
+
+
+def measure(env: dict[str, str], args: argparse.Namespace) -> dict[str, int]:
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_run, args=(env, args, out))
+    proc.start()
+    res = out.get()
+    proc.join()
+    return res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--files", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'writes/s':>10} {'reads/s':>10} {'locked':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, env in PROFILES.items():
+            db_url = f"sqlite:///{Path(tmp) / f'{name}.db'}"
+            counts = measure({"SQLALCHEMY_DATABASE_URL": db_url, **env}, args)
+            print(
+                f"{name:<10} {counts['writes'] / args.duration:>10.1f} "
+                f"{counts['reads'] / args.duration:>10.1f} {counts['locked']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Validation benchmark suite with a JSON report for regression tracking.
+
+Run from the project root:
+
+    python -m benchmarks.bench_suite --output bench.json
+    python -m benchmarks.bench_suite --output new.json --compare bench.json
+
+Generates TXT, CSV and XLSX files (see ``benchmarks.generators``) for each
+target-word position, runs the registered handler for each file type over
+them and records wall time, peak RSS and throughput. Every run happens in a
+fresh spawned process, so peak RSS is not inherited from earlier runs; the
+interpreter's own baseline (``idle_rss_mib``) is reported alongside.
+
+With ``--compare`` the report is checked against an earlier one and the
+script exits with status 1 if any case got slower, or used more memory, by
+more than ``--threshold``.
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .generators import POSITIONS, TABULAR_ONLY, write_csv, write_txt, write_xlsx
+
+FILE_TYPES = ("txt", "csv", "xlsx")
+
+
+def _run(path: str | None, out: mp.Queue) -> None:
+    from app.validators.file_validator import FileValidator
+
+    if path is None:
+        out.put((0.0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, None))
+        return
+    # Looking the handler up imports its module, before the clock starts.
+    handler = FileValidator.file_handlers[Path(path).suffix]
+    start = time.perf_counter()
+    result = handler.validate(path)
+    elapsed = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    out.put((elapsed, peak_kib, result.valid))
+
+
+def run_isolated(path: str | None) -> tuple[float, float, bool | None]:
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    proc = ctx.Process(target=_run, args=(path, out))
+    proc.start()
+    elapsed, peak_kib, valid = out.get()
+    proc.join()
+    return elapsed, peak_kib / 1024, valid
+
+
+def generate(kind: str, path: Path, position: str, args: argparse.Namespace) -> int:
+    # Returns the number of data rows (0 for TXT).
+    if kind == "txt":
+        write_txt(path, args.txt_mib, position)
+        return 0
+    if kind == "csv":
+        write_csv(path, args.rows, args.columns, position)
+        return args.rows
+    write_xlsx(path, args.xlsx_rows, args.columns, position)
+    return args.xlsx_rows
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    _, idle_rss_mib, _ = run_isolated(None)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in args.types:
+            for position in args.positions:
+                if kind == "txt" and position in TABULAR_ONLY:
+                    continue
+                path = Path(tmp) / f"{position}.{kind}"
+                rows = generate(kind, path, position, args)
+                size = path.stat().st_size
+                runs = [run_isolated(str(path)) for _ in range(args.repeat)]
+                seconds = min(r[0] for r in runs)
+                case = {
+                    "case": f"{kind}/{position}",
+                    "file_type": kind,
+                    "position": position,
+                    "bytes": size,
+                    "rows": rows,
+                    "seconds": seconds,
+                    "peak_rss_mib": max(r[1] for r in runs),
+                    "mib_per_sec": size / 2**20 / seconds if seconds else None,
+                    "rows_per_sec": rows / seconds if rows and seconds else None,
+                    "valid": runs[0][2],
+                }
+                results.append(case)
+                print_case(case)
+                path.unlink()
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "idle_rss_mib": idle_rss_mib,
+            "params": {
+                "txt_mib": args.txt_mib,
+                "rows": args.rows,
+                "xlsx_rows": args.xlsx_rows,
+                "columns": args.columns,
+                "repeat": args.repeat,
+            },
+        },
+        "results": results,
+    }
+
+
+def print_case(case: dict[str, Any]) -> None:
+    rows_per_sec = case["rows_per_sec"]
+    print(
+        f"{case['case']:<14} {case['seconds']:>9.3f} {case['peak_rss_mib']:>10.1f} "
+        f"{case['mib_per_sec']:>8.1f} "
+        f"{'-' if rows_per_sec is None else f'{rows_per_sec:,.0f}':>12} "
+        f"{case['valid']!s:>6}"
+    )
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    # Cases are matched by name; ones missing on either side are skipped.
+    # Different generator parameters make the comparison meaningless.
+    if report["meta"]["params"] != baseline["meta"]["params"]:
+        print("\nParameters differ from the baseline, nothing compared")
+        return []
+    before = {case["case"]: case for case in baseline["results"]}
+    regressions = []
+    print(
+        f"\n{'case':<14} {'time':>8} {'peak RSS':>9}  vs {baseline['meta']['revision']}"
+    )
+    for case in report["results"]:
+        old = before.get(case["case"])
+        if old is None:
+            continue
+        time_ratio = case["seconds"] / old["seconds"] - 1
+        rss_ratio = case["peak_rss_mib"] / old["peak_rss_mib"] - 1
+        print(f"{case['case']:<14} {time_ratio:>+8.1%} {rss_ratio:>+9.1%}")
+        if time_ratio > threshold:
+            regressions.append(f"{case['case']}: {time_ratio:+.1%} time")
+        if rss_ratio > threshold:
+            regressions.append(f"{case['case']}: {rss_ratio:+.1%} peak RSS")
+        if case["valid"] != old["valid"]:
+            regressions.append(f"{case['case']}: verdict changed to {case['valid']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--types", nargs="+", choices=FILE_TYPES, default=list(FILE_TYPES)
+    )
+    parser.add_argument(
+        "--positions", nargs="+", choices=POSITIONS, default=list(POSITIONS)
+    )
+    parser.add_argument("--txt-mib", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=200_000, help="CSV data rows")
+    parser.add_argument("--xlsx-rows", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per case, best time wins"
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="baseline JSON report")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<14} {'time, s':>9} {'peak, MiB':>10} {'MiB/s':>8} "
+        f"{'rows/s':>12} {'valid':>6}"
+    )
+    report = run_suite(args)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Throughput of the per-row and column-block tabular validation engines.
+
+Run from the project root:
+
+    python -m benchmarks.bench_tabular_engines --rows 10000 100000 --cols 4 16 64
+
+Rows are generated in memory up front so the numbers reflect the engines
+only, not CSV/XLSX parsing. Every file is valid, i.e. fully scanned.
+"""
+
+import argparse
+import time
+
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+from app.validators.handlers import (
+    iter_records,
+    validate_tabular_columns,
+    validate_tabular_data,
+)
+
+
+def make_rows(rows: int, cols: int) -> list[list[str]]:
+    header = [COMPANY_NAME_COL, *(f"Column {i}" for i in range(1, cols))]
+    filler = [f"some value {i}" for i in range(1, cols)]
+    data = [[f"Company {i % 97}", *filler] for i in range(rows - 1)]
+    data.append([f"{TARGET_WORD} LLC", *filler])
+    return [header, *data]
+
+
+ENGINES = {
+    "rows": lambda rows, word: validate_tabular_data(iter_records(rows), word),
+    "columns": validate_tabular_columns,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cols", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    word = TARGET_WORD.casefold()
+    print(
+        f"{'rows':>9} {'cols':>5} {'rows, rows/s':>14} {'columns, rows/s':>16} {'speedup':>8}"
+    )
+    for n_rows in args.rows:
+        for n_cols in args.cols:
+            rows = make_rows(n_rows, n_cols)
+            rates = {}
+            for name, engine in ENGINES.items():
+                best = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    result = engine(rows, word)
+                    best = min(best, time.perf_counter() - start)
+                assert result.valid, result.reason
+                rates[name] = n_rows / best
+            speedup = rates["columns"] / rates["rows"]
+            print(
+                f"{n_rows:>9} {n_cols:>5} {rates['rows']:>14,.0f} "
+                f"{rates['columns']:>16,.0f} {speedup:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Throughput of TXT scanning: the old single-word loop vs the multi-pattern matcher.
+
+Run from the project root:
+
+    python -m benchmarks.bench_txt_matcher --size-mib 256 --patterns 1 4 16
+
+No pattern occurs in the generated file, so every run scans all of it. For N
+words the legacy loop has to run once per word; the matcher reads, decodes
+and casefolds the file once and searches it for all N. The mmap column is the
+byte-level scan used for ASCII words over ASCII-compatible files.
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from app.validators.constants import DEFAULT_TXT_CHUNK, TXT_MMAP_CHUNK
+from app.validators.handlers import TxtFileHandler
+from app.validators.matcher import MultiPatternMatcher
+
+
+def write_text(
+    path: Path, size_mib: int, alphabet: str = string.ascii_lowercase
+) -> None:
+    rng = random.Random(0)
+    words = ["".join(rng.choices(alphabet, k=rng.randint(2, 9))) for _ in range(5000)]
+    line = " ".join(rng.choices(words, k=16_000)) + "\n"
+    block = line.encode() * max(1, 2**20 // len(line))
+    with path.open("wb") as f:
+        written = 0
+        while written < size_mib * 2**20:
+            f.write(block)
+            written += len(block)
+
+
+def legacy_scan(path: str, word: str) -> bool:
+    # The single-word loop TxtFileHandler.validate used before the matcher.
+    tail = ""
+    overlap = len(word) - 1
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        while chunk := f.read(DEFAULT_TXT_CHUNK):
+            s = (tail + chunk).casefold()
+            if word in s:
+                return True
+            tail = s[-overlap:]
+    return False
+
+
+def matcher_scan(path: str, words: list[str]) -> bool:
+    chunks = TxtFileHandler._read(path, chunk_size=DEFAULT_TXT_CHUNK, encoding="utf-8")
+    return any(True for _ in MultiPatternMatcher(words).scan(chunks))
+
+
+def mmap_scan(path: str, words: list[str]) -> bool:
+    matcher = MultiPatternMatcher(words)
+    scan = TxtFileHandler._scan_mmap(path, matcher, chunk_size=TXT_MMAP_CHUNK)
+    return any(True for _ in scan)
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        assert not fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mib", type=int, default=128)
+    parser.add_argument("--patterns", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    words = [
+        "".join(rng.choices(string.ascii_uppercase, k=10))
+        for _ in range(max(args.patterns))
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.txt"
+        write_text(path, args.size_mib)
+        mib = path.stat().st_size / 2**20
+
+        legacy = best_of(args.repeat, legacy_scan, str(path), words[0].casefold())
+        print(f"{'words':>5} {'legacy x N':>12} {'matcher':>10} {'mmap':>10}  speedup")
+        for n in args.patterns:
+            text = best_of(args.repeat, matcher_scan, str(path), words[:n])
+            raw = best_of(args.repeat, mmap_scan, str(path), words[:n])
+            print(
+                f"{n:>5} {mib / (legacy * n):>12.1f} {mib / text:>10.1f} "
+                f"{mib / raw:>10.1f}  {legacy * n / text:>6.2f}x"
+            )
+        print("(MB/s; speedup is the matcher against N legacy passes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Throughput of TXT scanning: decoded text reads vs the mmap byte-level scanner.
+
+Run from the project root:
+
+    python -m benchmarks.bench_txt_mmap --size-mib 256 --mmap-chunk 65536 1048576
+
+No pattern occurs in the generated file, so every run scans all of it. The
+file is read once up front, so both modes work from the page cache. "mixed"
+text has Polish and Cyrillic letters, which the text path has to decode and
+casefold the slow way.
+"""
+
+import argparse
+import string
+import tempfile
+from pathlib import Path
+
+from app.validators.constants import DEFAULT_TXT_CHUNK
+from app.validators.handlers import TxtFileHandler
+from app.validators.matcher import MultiPatternMatcher
+
+from .bench_txt_matcher import best_of, write_text
+
+ALPHABETS = {
+    "ascii": string.ascii_lowercase,
+    "mixed": string.ascii_lowercase + "ąćęłńóśźżжфдя",
+}
+
+
+def text_scan(path: str, words: list[str]) -> bool:
+    chunks = TxtFileHandler._read(path, chunk_size=DEFAULT_TXT_CHUNK, encoding="utf-8")
+    return any(True for _ in MultiPatternMatcher(words).scan(chunks))
+
+
+def mmap_scan(path: str, words: list[str], chunk_size: int) -> bool:
+    matcher = MultiPatternMatcher(words)
+    matches = TxtFileHandler._scan_mmap(path, matcher, chunk_size=chunk_size)
+    return any(True for _ in matches)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mib", type=int, default=128)
+    parser.add_argument("--patterns", type=int, nargs="+", default=[1, 4])
+    parser.add_argument(
+        "--mmap-chunk", type=int, nargs="+", default=[65_536, 1_048_576, 8_388_608]
+    )
+    parser.add_argument("--text", nargs="+", choices=ALPHABETS, default=list(ALPHABETS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    words = [f"Missing{i:03d}Word" for i in range(max(args.patterns))]
+    print(f"{'text':<6} {'mode':<26} {'words':>6} {'MB/s':>8}")
+    for text in args.text:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.txt"
+            write_text(path, args.size_mib, ALPHABETS[text])
+            path.read_bytes()
+            mib = path.stat().st_size / 2**20
+
+            for n in args.patterns:
+                elapsed = best_of(args.repeat, text_scan, str(path), words[:n])
+                label = f"text, {DEFAULT_TXT_CHUNK} B reads"
+                print(f"{text:<6} {label:<26} {n:>6} {mib / elapsed:>8.1f}")
+                for chunk in args.mmap_chunk:
+                    elapsed = best_of(
+                        args.repeat, mmap_scan, str(path), words[:n], chunk
+                    )
+                    label = f"mmap, {chunk} B windows"
+                    print(f"{text:<6} {label:<26} {n:>6} {mib / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
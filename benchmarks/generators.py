@@ -0,0 +1,77 @@
+"""Synthetic TXT, CSV and XLSX files for the benchmarks.
+
+Every generator is deterministic, so two runs with the same parameters
+produce byte-identical files. ``position`` places the target word:
+
+- ``first``: in the first row (TXT: at the start of the file)
+- ``last``: in the last row (TXT: at the end of the file)
+- ``absent``: nowhere
+- ``outside``: in a non-company column of the middle row (tabular only)
+
+For tabular files ``first``/``last`` put it in the company column, so the
+file is valid; ``absent`` and ``outside`` are invalid.
+"""
+
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal
+
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+
+from .bench_txt_matcher import write_text
+
+Position = Literal["first", "last", "absent", "outside"]
+POSITIONS: tuple[Position, ...] = ("first", "last", "absent", "outside")
+TABULAR_ONLY: frozenset[Position] = frozenset({"outside"})
+
+
+def write_txt(path: Path, size_mib: int, position: Position) -> None:
+    if position in TABULAR_ONLY:
+        raise ValueError(f"Position {position!r} needs a tabular file")
+    write_text(path, size_mib)
+    if position == "absent":
+        return
+    marker = f" {TARGET_WORD} ".encode()
+    with path.open("r+b") as f:
+        if position == "last":
+            f.seek(-len(marker), 2)
+        f.write(marker)
+
+
+def header(columns: int) -> list[str]:
+    if columns < 2:
+        raise ValueError("Tabular files need at least two columns")
+    return ["User", COMPANY_NAME_COL, *(f"Field {i}" for i in range(2, columns))]
+
+
+def tabular_rows(rows: int, columns: int, position: Position) -> Iterator[list[str]]:
+    hit = {"first": 0, "last": rows - 1, "outside": rows // 2}.get(position)
+    for i in range(rows):
+        row = [f"user{i}", f"Company {i % 97}"]
+        row.extend(f"value {i % (j + 13)}" for j in range(2, columns))
+        if i == hit:
+            if position == "outside":
+                row[0] = TARGET_WORD
+            else:
+                row[1] = f"{TARGET_WORD} LLC"
+        yield row
+
+
+def write_csv(path: Path, rows: int, columns: int, position: Position) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header(columns))
+        writer.writerows(tabular_rows(rows, columns, position))
+
+
+def write_xlsx(path: Path, rows: int, columns: int, position: Position) -> None:
+    from openpyxl import Workbook
+
+    # write_only streams rows to disk instead of building the sheet in memory.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(header(columns))
+    for row in tabular_rows(rows, columns, position):
+        ws.append(row)
+    wb.save(path)
@@ -6,7 +6,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.core.security import get_db as app_get_db, pwd_context
+from app.core.security import (
+    get_db as app_get_db,
+    get_session_factory as app_get_session_factory,
+    pwd_context,
+)
 from app.db.database import Base
 from app.db.models import User
 from app.main import app
@@ -30,11 +34,15 @@ def test_engine():
 
 
 @pytest.fixture
-def db_session(test_engine):
-    session_local = sessionmaker(
+def session_factory(test_engine):
+    return sessionmaker(
         bind=test_engine, autoflush=False, autocommit=False, future=True
     )
-    session = session_local()
+
+
+@pytest.fixture
+def db_session(session_factory):
+    session = session_factory()
     try:
         yield session
     finally:
@@ -42,7 +50,7 @@ def db_session(test_engine):
 
 
 @pytest.fixture
-def client(db_session):
+def client(db_session, session_factory):
     def _get_db_override():
         try:
             yield db_session
@@ -50,6 +58,7 @@ def client(db_session):
             pass
 
     app.dependency_overrides[app_get_db] = _get_db_override
+    app.dependency_overrides[app_get_session_factory] = lambda: session_factory
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
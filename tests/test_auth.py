@@ -19,3 +19,55 @@ def test_login_invalid_credentials(client, create_user):
 
     resp = client.post("/auth/login", json={"email": email, "password": "wrong"})
     assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def login(client, email, password):
+    resp = client.post("/auth/login", json={"email": email, "password": password})
+    assert resp.status_code == status.HTTP_200_OK
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_token_carries_user_id(client, create_user):
+    from jose import jwt
+
+    from app.core.security import ALGORITHM, SECRET_KEY
+
+    user = create_user("uid_claim@example.com", "secret123")
+    headers = login(client, user.email, "secret123")
+    token = headers["Authorization"].split()[1]
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert payload["uid"] == user.id
+    assert payload["sub"] == user.email
+
+
+def test_authenticated_user_is_cached_per_token(client, create_user):
+    from app.core.security import token_cache
+
+    create_user("cached@example.com", "secret123")
+    headers = login(client, "cached@example.com", "secret123")
+    token_cache.clear()
+
+    for _ in range(3):
+        resp = client.post(
+            "/comments/file/999999", json={"text": "hi"}, headers=headers
+        )
+        assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert (token_cache.hits, token_cache.misses) == (2, 1)
+    assert token_cache.hit_rate == 2 / 3
+
+
+def test_deleted_user_is_evicted_from_token_cache(client, create_user, db_session):
+    from app.core.security import token_cache
+
+    user = create_user("deleted@example.com", "secret123")
+    headers = login(client, user.email, "secret123")
+    resp = client.post("/comments/file/999999", json={"text": "hi"}, headers=headers)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert len(token_cache) >= 1
+
+    db_session.delete(user)
+    db_session.commit()
+
+    resp = client.post("/comments/file/999999", json={"text": "hi"}, headers=headers)
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
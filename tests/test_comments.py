@@ -38,9 +38,101 @@ def test_create_and_get_comments(client, create_user):
 
     r = client.get(f"/comments/file/{file_id}")
     assert r.status_code == status.HTTP_200_OK
-    lst = r.json()
-    assert len(lst) == 1
-    assert lst[0]["text"] == "first!"
+    page = r.json()
+    assert len(page["items"]) == 1
+    assert page["items"][0]["text"] == "first!"
+    assert page["authors"] == [{"id": user.id, "email": user.email}]
+    assert page["next_cursor"] is None
+
+
+def test_comment_listings_match_the_schema(client, create_user, db_session):
+    from sqlalchemy import select
+
+    from app.db.models import Comment
+    from app.main import app
+    from app.schemas.comment import CommentItem, CommentPage, CommentsByFile
+    from app.schemas.user import UserPublic
+
+    user = create_user("c5@example.com", "pass")
+    file_id = upload_dummy_file(client, user, app)
+    client.post(f"/comments/file/{file_id}", json={"text": "schema"})
+    r = client.post(f"/comments/file/{file_id}", json={"text": "again"})
+    client.patch(f"/comments/{r.json()['id']}", json={"text": "edited"})
+
+    db_session.expire_all()
+    comments = db_session.execute(
+        select(Comment).where(Comment.file_id == file_id).order_by(Comment.id)
+    ).scalars()
+    expected = CommentPage(
+        items=[CommentItem.model_validate(c) for c in comments],
+        authors=[UserPublic.model_validate(user)],
+    ).model_dump(mode="json")
+
+    page = client.get(f"/comments/file/{file_id}").json()
+    assert page == expected
+    bulk = client.get("/comments", params={"file_id": file_id}).json()
+    assert CommentsByFile.model_validate(bulk).model_dump(mode="json") == bulk
+    assert bulk["files"][0]["comments"] == expected["items"]
+    assert bulk["authors"] == expected["authors"]
+
+
+def test_write_responses_match_later_reads(client, create_user):
+    from app.main import app
+
+    user = create_user("c10@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    content = BytesIO(b"Abyrvalg inside")
+    created = client.post(
+        "/files/upload", files={"file": ("a.txt", content, "text/plain")}
+    ).json()
+    listed = client.get("/files").json()["items"]
+    assert [f["created_at"] for f in listed if f["id"] == created["id"]] == [
+        created["created_at"]
+    ]
+
+    comment = client.post(
+        f"/comments/file/{created['id']}", json={"text": "first!"}
+    ).json()
+    (item,) = client.get(f"/comments/file/{created['id']}").json()["items"]
+    assert item["created_at"] == comment["created_at"]
+    assert item["updated_at"] == comment["updated_at"]
+
+
+def test_comments_cursor_pagination(client, create_user):
+    from app.main import app
+
+    author = create_user("c3@example.com", "pass")
+    other = create_user("c4@example.com", "pass")
+    file_id = upload_dummy_file(client, author, app)
+    for i in range(5):
+        user = author if i % 2 == 0 else other
+        app.dependency_overrides[app_get_current_user] = auth_override(user)
+        r = client.post(f"/comments/file/{file_id}", json={"text": str(i)})
+        assert r.status_code == status.HTTP_201_CREATED
+
+    texts, cursor = [], None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        page = client.get(f"/comments/file/{file_id}", params=params).json()
+        assert len(page["items"]) <= 2
+        # Each author is listed once per page and referenced by user_id.
+        assert sorted(a["id"] for a in page["authors"]) == sorted(
+            {c["user_id"] for c in page["items"]}
+        )
+        texts.extend(c["text"] for c in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert texts == ["0", "1", "2", "3", "4"]
+
+    empty = upload_dummy_file(client, author, app)
+    r = client.get(f"/comments/file/{empty}")
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json() == {"items": [], "authors": [], "next_cursor": None}
+    r = client.get("/comments/file/999999")
+    assert r.status_code == status.HTTP_404_NOT_FOUND
+    r = client.get(f"/comments/file/{file_id}", params={"cursor": "garbage"})
+    assert r.status_code == status.HTTP_400_BAD_REQUEST
 
 
 def test_update_comment_permissions(client, create_user):
@@ -63,3 +155,58 @@ def test_update_comment_permissions(client, create_user):
     r = client.patch(f"/comments/{comment_id}", json={"text": "updated"})
     assert r.status_code == status.HTTP_200_OK
     assert r.json()["text"] == "updated"
+
+
+def test_get_comments_by_file(client, create_user, monkeypatch):
+    from app.api import comments as comments_api
+    from app.main import app
+
+    user = create_user("c2@example.com", "pass")
+    first = upload_dummy_file(client, user, app)
+    second = upload_dummy_file(client, user, app)
+    quiet = upload_dummy_file(client, user, app)
+    for i in range(3):
+        for file_id in (first, second):
+            r = client.post(
+                f"/comments/file/{file_id}", json={"text": f"{file_id}-{i}"}
+            )
+            assert r.status_code == status.HTTP_201_CREATED
+
+    r = client.get(
+        "/comments",
+        params={"file_id": [second, first, quiet, 999999], "limit": 2},
+    )
+    assert r.status_code == status.HTTP_200_OK, r.text
+    files = r.json()["files"]
+    assert [f["file_id"] for f in files] == [first, second, quiet]
+    assert [c["text"] for c in files[0]["comments"]] == [f"{first}-0", f"{first}-1"]
+    assert r.json()["authors"] == [{"id": user.id, "email": user.email}]
+    assert files[2] == {"file_id": quiet, "comments": [], "next_cursor": None}
+
+    # A cursor continues its own file; the others start from the beginning.
+    r = client.get(
+        "/comments",
+        params={"file_id": [first, second], "cursor": files[0]["next_cursor"]},
+    )
+    files = r.json()["files"]
+    assert [c["text"] for c in files[0]["comments"]] == [f"{first}-2"]
+    assert files[0]["next_cursor"] is None
+    assert len(files[1]["comments"]) == 3
+
+    since = files[1]["comments"][1]["created_at"]
+    r = client.get("/comments", params={"since": since})
+    by_file = {f["file_id"]: f["comments"] for f in r.json()["files"]}
+    assert set(by_file) <= {first, second}
+    assert [c["text"] for c in by_file[second]] == [f"{second}-1", f"{second}-2"]
+
+    # A window with more than MAX_BULK_FILES files is refused, not truncated.
+    monkeypatch.setattr(comments_api, "MAX_BULK_FILES", len(by_file))
+    r = client.get("/comments", params={"since": since})
+    assert r.status_code == status.HTTP_200_OK
+    monkeypatch.setattr(comments_api, "MAX_BULK_FILES", len(by_file) - 1)
+    r = client.get("/comments", params={"since": since})
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    assert client.get("/comments").status_code == status.HTTP_400_BAD_REQUEST
+    r = client.get("/comments", params={"file_id": first, "cursor": "x:y"})
+    assert r.status_code == status.HTTP_400_BAD_REQUEST
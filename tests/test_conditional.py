@@ -0,0 +1,96 @@
+from io import BytesIO
+
+import pytest
+from fastapi import status
+from sqlalchemy import event
+
+from app.core.conditional import etag_matches
+from app.core.security import get_current_user as app_get_current_user
+
+
+@pytest.mark.parametrize(
+    ("header", "matches"),
+    [
+        (None, False),
+        ('W/"1.2"', True),
+        ('"1.2"', True),
+        ('"0.1", W/"1.2"', True),
+        ("*", True),
+        ('W/"1.3"', False),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert etag_matches(header, 'W/"1.2"') is matches
+
+
+def revalidate(client, url):
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["Cache-Control"] == "no-cache"
+    etag = first.headers["ETag"]
+    again = client.get(url, headers={"If-None-Match": etag})
+    return etag, again
+
+
+def test_listings_answer_304_until_data_changes(client, create_user, test_engine):
+    from app.main import app
+
+    user = create_user("etag@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = lambda: user
+    file_id = client.post(
+        "/files/upload",
+        files={"file": ("e.txt", BytesIO(b"Quantori etag"), "text/plain")},
+    ).json()["id"]
+    comments_url = f"/comments/file/{file_id}"
+
+    seen: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        seen.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        files_etag, resp = revalidate(client, "/files")
+        seen.clear()
+        resp = client.get("/files", headers={"If-None-Match": files_etag})
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+    assert resp.headers["ETag"] == files_etag
+    assert resp.content == b""
+    # Only the revision lookup, not the listing query.
+    assert len(seen) == 1 and "revisions" in seen[0]
+
+    comments_etag, resp = revalidate(client, comments_url)
+    assert resp.status_code == status.HTTP_304_NOT_MODIFIED
+
+    comment_id = client.post(comments_url, json={"text": "new"}).json()["id"]
+    for url, etag in (("/files", files_etag), (comments_url, comments_etag)):
+        resp = client.get(url, headers={"If-None-Match": etag})
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.headers["ETag"] != etag
+
+    comments_etag, _ = revalidate(client, comments_url)
+    client.patch(f"/comments/{comment_id}", json={"text": "edited"})
+    resp = client.get(comments_url, headers={"If-None-Match": comments_etag})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["items"][0]["text"] == "edited"
+
+
+def test_background_result_changes_files_etag(client, create_user, db_session):
+    from app.db.models import FileStatus, FileUpload
+
+    user = create_user("etag2@example.com", "pass")
+    rec = FileUpload(
+        filename="p.txt",
+        file_type=".txt",
+        status=FileStatus.PENDING.value,
+        uploader_id=user.id,
+    )
+    db_session.add(rec)
+    db_session.commit()
+    etag = client.get("/files").headers["ETag"]
+
+    rec.status = FileStatus.DONE.value
+    db_session.commit()
+    assert client.get("/files", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,170 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import get_async_db
+from app.db import database
+from app.db.database import pool_options, to_async_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("sqlite:///./app.db", "sqlite+aiosqlite:///./app.db"),
+        ("sqlite+pysqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+        ("postgresql://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+        ("postgresql+psycopg2://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+        ("mysql+aiomysql://u:p@db/app", "mysql+aiomysql://u:p@db/app"),
+    ],
+)
+def test_to_async_url(url, expected):
+    assert to_async_url(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_requires_async_mode(monkeypatch):
+    monkeypatch.setattr(database, "AsyncSessionLocal", None)
+    with pytest.raises(RuntimeError, match="DB_ASYNC"):
+        await anext(get_async_db())
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_yields_async_session(monkeypatch):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(to_async_url("sqlite://"))
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(engine))
+    try:
+        gen = get_async_db()
+        db = await anext(gen)
+        assert (await db.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+        await gen.aclose()
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    # The API with DB_ASYNC=true: routes get an AsyncSession-backed runner on
+    # an aiosqlite file database; background jobs keep the sync engine.
+    pytest.importorskip("aiosqlite")
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import NullPool
+
+    from app.db.database import Base
+    from app.main import app
+
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(sync_engine)
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    async_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def _get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    app.dependency_overrides[security.get_sync_runner] = security.get_async_runner
+    app.dependency_overrides[get_async_db] = _get_async_db
+    app.dependency_overrides[security.get_session_factory] = lambda: sessionmaker(
+        sync_engine
+    )
+    try:
+        with TestClient(app) as client:
+            yield client, sync_engine
+    finally:
+        app.dependency_overrides.clear()
+        sync_engine.dispose()
+
+
+def test_routes_in_async_mode(async_client):
+    from io import BytesIO
+
+    from sqlalchemy.orm import Session
+
+    from app.db.models import User
+
+    client, sync_engine = async_client
+    with Session(sync_engine) as db:
+        hashed = security.pwd_context.hash("secret123")
+        db.add(User(email="async@example.com", password_hash=hashed))
+        db.commit()
+    security.token_cache.clear()
+
+    resp = client.post(
+        "/auth/login", json={"email": "async@example.com", "password": "secret123"}
+    )
+    assert resp.status_code == 200
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    for _ in range(2):
+        resp = client.post(
+            "/files/upload",
+            files={"file": ("a.txt", BytesIO(b"Abyrvalg"), "text/plain")},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+    file_id = resp.json()["id"]
+    assert resp.json()["uploader"]["email"] == "async@example.com"
+
+    resp = client.post(
+        f"/comments/file/{file_id}", json={"text": "first"}, headers=headers
+    )
+    assert resp.status_code == 201
+    comment_id = resp.json()["id"]
+    resp = client.patch(
+        f"/comments/{comment_id}", json={"text": "edited"}, headers=headers
+    )
+    assert resp.json()["text"] == "edited"
+    assert (
+        client.post(
+            "/comments/file/999999", json={"text": "x"}, headers=headers
+        ).status_code
+        == 404
+    )
+
+    comments = client.get(f"/comments/file/{file_id}").json()
+    assert [c["text"] for c in comments["items"]] == ["edited"]
+    assert client.get("/comments", params={"file_id": file_id}).status_code == 200
+    assert client.get(f"/files/{file_id}/status").json()["status"] == "done"
+    assert client.get(f"/files/{file_id}/violations").json()["items"] == []
+    assert len(client.get("/files").json()["items"]) == 2
+
+
+def test_pool_options(monkeypatch):
+    monkeypatch.setattr(database, "POOL_SIZE", 64)
+    assert pool_options("sqlite:///./app.db")["pool_size"] == 64
+    assert pool_options("postgresql://u:p@db/app")["pool_size"] == 64
+    assert pool_options("sqlite://") == {}
+    assert pool_options("sqlite:///:memory:") == {}
+
+
+def _pragmas(url: str) -> tuple[str, int, int]:
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return (
+                conn.execute(text("PRAGMA journal_mode")).scalar(),
+                conn.execute(text("PRAGMA synchronous")).scalar(),
+                conn.execute(text("PRAGMA busy_timeout")).scalar(),
+            )
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_tuning_pragmas_applied_on_connect(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_tuning", True)
+    monkeypatch.setattr(settings, "sqlite_busy_timeout_ms", 1234)
+    # synchronous=NORMAL is reported as 1.
+    assert _pragmas(f"sqlite:///{tmp_path / 'tuned.db'}") == ("wal", 1, 1234)
+
+
+def test_sqlite_tuning_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "sqlite_tuning", False)
+    journal_mode, synchronous, _ = _pragmas(f"sqlite:///{tmp_path / 'plain.db'}")
+    # SQLite defaults: rollback journal, synchronous=FULL.
+    assert (journal_mode, synchronous) == ("delete", 2)
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import status
+from pydantic import BaseModel
+
+from app.api.events import _stream
+from app.core.events import EPOCH, EventBroker, TooManySubscribersError, event_broker
+from app.core.security import get_current_user as app_get_current_user
+
+
+class Payload(BaseModel):
+    n: int
+
+
+def make_broker(**options) -> EventBroker:
+    params = {"buffer_size": 4, "history_size": 8, "max_subscribers": 2} | options
+    broker = EventBroker(**params)
+    broker.bind(asyncio.get_running_loop())
+    return broker
+
+
+async def drain(subscription) -> list[tuple[int, str, str]]:
+    events = []
+    while not subscription.queue.empty():
+        event = await subscription.get()
+        events.append((event.id, event.type, event.data))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_fan_out_from_threads_in_order():
+    broker = make_broker()
+    first, second = broker.subscribe(), broker.subscribe()
+
+    thread = threading.Thread(target=broker.publish, args=("a.made", Payload(n=1)))
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0)
+    broker.publish("b.made", Payload(n=2))
+
+    expected = [(1, "a.made", '{"n":1}'), (2, "b.made", '{"n":2}')]
+    assert await drain(first) == expected
+    assert await drain(second) == expected
+    with pytest.raises(TooManySubscribersError):
+        broker.subscribe()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync():
+    broker = make_broker()
+    subscription = broker.subscribe()
+    for n in range(6):
+        broker.publish("x", Payload(n=n))
+    assert await drain(subscription) == [(5, "resync", "{}"), (6, "x", '{"n":5}')]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_missed_events():
+    broker = make_broker(history_size=3, max_subscribers=10)
+    for n in range(5):
+        broker.publish("x", Payload(n=n))
+
+    assert [e[0] for e in await drain(broker.subscribe(3))] == [4, 5]
+    assert await drain(broker.subscribe(5)) == []
+    # Id 1 fell out of the history, -1 is another epoch.
+    assert await drain(broker.subscribe(1)) == [(5, "resync", "{}")]
+    assert await drain(broker.subscribe(-1)) == [(5, "resync", "{}")]
+
+
+@pytest.mark.asyncio
+async def test_stream_encodes_events_and_ends_on_close(monkeypatch):
+    broker = make_broker()
+    monkeypatch.setattr("app.api.events.event_broker", broker)
+    monkeypatch.setattr("app.api.events.HEARTBEAT_SECONDS", 0.01)
+    subscription = broker.subscribe()
+    stream = _stream(subscription)
+
+    assert await anext(stream) == "retry: 3000\n\n"
+    assert await anext(stream) == ": ping\n\n"
+    broker.publish("file.created", Payload(n=7))
+    assert (
+        await anext(stream)
+        == f'id: {EPOCH}.1\nevent: file.created\ndata: {{"n":7}}\n\n'
+    )
+    broker.close()
+    assert [chunk async for chunk in stream] == []
+    assert len(broker) == 0
+
+
+def test_writes_publish_events(client, create_user, db_session):
+    from app.main import app
+
+    user = create_user("events@example.com", "pass")
+    email = user.email
+    app.dependency_overrides[app_get_current_user] = lambda: user
+    subscription = client.portal.call(event_broker.subscribe)
+
+    async def next_event():
+        event = await asyncio.wait_for(subscription.get(), 5)
+        return event.type, event.data
+
+    try:
+        resp = client.post(
+            "/files/upload/stream", params={"filename": "e.txt"}, content=b"Quantori"
+        )
+        file_id = resp.json()["id"]
+        kind, data = client.portal.call(next_event)
+        assert kind == "file.created"
+        assert f'"id":{file_id}' in data and email in data
+
+        resp = client.post(f"/comments/file/{file_id}", json={"text": "hi"})
+        assert resp.status_code == status.HTTP_201_CREATED
+        assert client.portal.call(next_event)[0] == "comment.created"
+
+        db_session.refresh(user)
+        client.patch(f"/comments/{resp.json()['id']}", json={"text": "edited"})
+        kind, data = client.portal.call(next_event)
+        assert kind == "comment.updated" and '"text":"edited"' in data
+
+        db_session.refresh(user)
+        resp = client.post(
+            "/files/upload",
+            params={"async": "true"},
+            files={"file": ("bg.txt", b"Quantori later", "text/plain")},
+        )
+        assert resp.status_code == status.HTTP_202_ACCEPTED
+        assert client.portal.call(next_event)[0] == "file.created"
+        kind, data = client.portal.call(next_event)
+        assert kind == "file.validated" and '"status":"done"' in data
+    finally:
+        event_broker.unsubscribe(subscription)
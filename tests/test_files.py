@@ -1,6 +1,12 @@
+import asyncio
 import csv
+import json
+import os
+import time
+import zipfile
 from io import BytesIO
 
+import pytest
 from fastapi import status
 
 from app.core.security import get_current_user as app_get_current_user
@@ -34,7 +40,7 @@ def test_upload_txt_valid(client, create_user):
 
     resp = client.get("/files")
     assert resp.status_code == status.HTTP_200_OK
-    items = resp.json()
+    items = resp.json()["items"]
     assert len(items) >= 1
     assert any(i["filename"] == "note.txt" for i in items)
 
@@ -77,3 +83,533 @@ def test_upload_csv_invalid_outside_company(client, create_user, tmp_path):
     assert resp.status_code == status.HTTP_201_CREATED
     data = resp.json()
     assert data["valid"] is False
+
+
+def test_upload_rejected_when_validation_pool_is_full(client, create_user, monkeypatch):
+    import threading
+
+    from app.api import files as files_api
+    from app.core.workers import ValidationPool
+    from app.main import app
+
+    user = create_user("u4@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    pool = ValidationPool(kind="thread", max_workers=1, queue_size=0, timeout=5)
+    monkeypatch.setattr(files_api, "validation_pool", pool)
+    release = threading.Event()
+    pool.submit(release.wait)
+    try:
+        resp = client.post(
+            "/files/upload",
+            files={"file": ("a.txt", BytesIO(b"Quantori: pool is full"), "text/plain")},
+        )
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert resp.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert resp.headers["Retry-After"] == "1"
+
+
+def test_upload_validation_timeout(client, create_user, monkeypatch):
+    import threading
+
+    from app.api import files as files_api
+    from app.core.workers import ValidationPool
+    from app.main import app
+    from app.validators.file_validator import FileValidator
+
+    user = create_user("u5@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    release = threading.Event()
+    finished = threading.Event()
+    paths = []
+
+    def slow(path):
+        paths.append(path)
+        release.wait(5)
+        finished.set()
+
+    pool = ValidationPool(kind="thread", max_workers=1, queue_size=0, timeout=0.05)
+    monkeypatch.setattr(files_api, "validation_pool", pool)
+    monkeypatch.setattr(FileValidator, "validate_file", staticmethod(slow))
+    try:
+        resp = client.post(
+            "/files/upload",
+            files={"file": ("a.txt", BytesIO(b"Quantori: timeout"), "text/plain")},
+        )
+        assert pool.in_flight == 1
+        # The job is still running and keeps its file until it ends.
+        assert os.path.exists(paths[0])
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert resp.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert finished.wait(5)
+    deadline = time.monotonic() + 5
+    while os.path.exists(paths[0]) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not os.path.exists(paths[0])
+
+
+def test_upload_async_mode_returns_pending_job(client, create_user):
+    user = create_user("u6@example.com", "pass")
+    from app.main import app
+
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    resp = client.post(
+        "/files/upload",
+        params={"async": "true"},
+        files={"file": ("note.txt", BytesIO(b"say Quantori"), "text/plain")},
+    )
+    assert resp.status_code == status.HTTP_202_ACCEPTED, resp.text
+    data = resp.json()
+    assert data["status"] == "pending"
+    assert data["valid"] is False
+
+    resp = client.get(f"/files/{data['id']}/status", params={"wait": 10})
+    assert resp.status_code == status.HTTP_200_OK
+    job = resp.json()
+    assert job["status"] == "done"
+    assert job["valid"] is True
+    assert "found in text" in job["reason"]
+
+
+def test_upload_report_lists_every_violation(client, create_user):
+    from app.main import app
+
+    user = create_user("u27@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    content = (
+        b"User,Company Name,Note\n"
+        b"Quantori,Acme,\n"
+        b"Ivan,Quantori LLC,\n"
+        b"Oleg,Acme,see Quantori\n"
+        b"Quantori,Acme,Quantori\n"
+    )
+
+    # The verdict of an earlier plain upload is cached; a report still reads
+    # the file to find the rows.
+    plain = client.post(
+        "/files/upload", files={"file": ("plain.csv", BytesIO(content), "text/csv")}
+    )
+    assert plain.json()["violation_count"] is None
+    resp = client.post(
+        "/files/upload",
+        params={"report": "true"},
+        files={"file": ("report.csv", BytesIO(content), "text/csv")},
+    )
+    assert resp.status_code == status.HTTP_201_CREATED, resp.text
+    data = resp.json()
+    assert data["valid"] is False
+    assert data["reason"] == plain.json()["reason"]
+    assert data["violation_count"] == 4
+
+    violations, cursor = [], None
+    while True:
+        page = client.get(
+            f"/files/{data['id']}/violations",
+            params={"limit": 3, **({"cursor": cursor} if cursor else {})},
+        ).json()
+        violations += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert [(v["row"], v["column"]) for v in violations] == [
+        (2, "User"),
+        (4, "Note"),
+        (5, "User"),
+        (5, "Note"),
+    ]
+    assert violations[1]["snippet"] == "see Quantori"
+
+    # Background jobs store the report when they finish.
+    resp = client.post(
+        "/files/upload",
+        params={"report": "true", "async": "true"},
+        files={"file": ("later.csv", BytesIO(content + b"x,y,Quantori\n"), "text/csv")},
+    )
+    assert resp.status_code == status.HTTP_202_ACCEPTED, resp.text
+    file_id = resp.json()["id"]
+    job = client.get(f"/files/{file_id}/status", params={"wait": 10}).json()
+    assert job["violation_count"] == 5
+    page = client.get(f"/files/{file_id}/violations", params={"limit": 10}).json()
+    assert page["items"][-1] == {"row": 6, "column": "Note", "snippet": "Quantori"}
+
+    empty = client.get(f"/files/{plain.json()['id']}/violations").json()
+    assert empty == {"items": [], "next_cursor": None}
+    resp = client.get("/files/999999/violations")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_pending_jobs_lost_to_a_restart_are_failed(client, create_user, db_session):
+    from datetime import UTC, datetime
+
+    from app.api.files import INTERRUPTED_REASON, fail_stale_jobs
+    from app.db.models import FileUpload
+
+    user = create_user("u28@example.com", "pass")
+    long_ago = datetime(2020, 1, 1)
+    now = datetime.now(UTC).replace(tzinfo=None)
+
+    def pending(name, created_at):
+        rec = FileUpload(
+            filename=name,
+            file_type=".txt",
+            status="pending",
+            uploader_id=user.id,
+            created_at=created_at,
+        )
+        db_session.add(rec)
+        db_session.commit()
+        return rec.id
+
+    # Startup sweep.
+    swept = pending("swept.txt", long_ago)
+    assert fail_stale_jobs(db_session) == 1
+    job = client.get(f"/files/{swept}/status").json()
+    assert (job["status"], job["reason"]) == ("failed", INTERRUPTED_REASON)
+
+    # Lost after startup: caught when its status is read. Rows younger than
+    # the cut-off may belong to a job in another process.
+    polled = pending("polled.txt", long_ago)
+    fresh = pending("fresh.txt", now)
+    assert client.get(f"/files/{polled}/status").json()["status"] == "failed"
+    assert client.get(f"/files/{fresh}/status").json()["status"] == "pending"
+
+
+def test_status_of_unknown_file(client):
+    resp = client.get("/files/999999/status")
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_reupload_is_served_from_validation_cache(client, create_user, monkeypatch):
+    from app.main import app
+    from app.validators.cache import validation_cache
+    from app.validators.file_validator import FileValidator
+
+    user = create_user("u7@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    content = b"cached Quantori content"
+
+    first = client.post(
+        "/files/upload", files={"file": ("a.txt", BytesIO(content), "text/plain")}
+    )
+    assert first.status_code == status.HTTP_201_CREATED
+
+    def fail(path):
+        raise AssertionError("validation must be skipped on a cache hit")
+
+    def put(db, key, result):
+        raise AssertionError("a cache hit must not be stored again")
+
+    monkeypatch.setattr(FileValidator, "validate_file", staticmethod(fail))
+    monkeypatch.setattr(validation_cache, "put", put)
+    for clear_memory in (False, True):
+        if clear_memory:
+            validation_cache.clear()
+        resp = client.post(
+            "/files/upload", files={"file": ("b.txt", BytesIO(content), "text/plain")}
+        )
+        assert resp.status_code == status.HTTP_201_CREATED, resp.text
+        assert resp.json()["valid"] == first.json()["valid"]
+        assert resp.json()["reason"] == first.json()["reason"]
+
+
+def test_list_files_keyset_pagination_and_filters(client, create_user):
+    from app.main import app
+
+    user = create_user("u8@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    uploaded = []
+    for i, body in enumerate([b"Quantori one", b"nothing here", b"Quantori three"]):
+        resp = client.post(
+            "/files/upload",
+            files={"file": (f"page{i}.txt", BytesIO(body), "text/plain")},
+        )
+        assert resp.status_code == status.HTTP_201_CREATED
+        uploaded.append(resp.json()["id"])
+    client.post(f"/comments/file/{uploaded[0]}", json={"text": "hi"})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"uploader_id": user.id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/files", params=params).json()
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [i["id"] for i in seen] == uploaded[::-1]
+    assert [i["comment_count"] for i in seen] == [0, 0, 1]
+    assert all("comments" not in i for i in seen)
+
+    page = client.get("/files", params={"uploader_id": user.id, "valid": False})
+    assert [i["filename"] for i in page.json()["items"]] == ["page1.txt"]
+
+    page = client.get("/files", params={"uploader_id": user.id, "file_type": ".CSV"})
+    assert page.json()["items"] == []
+
+
+def test_list_files_matches_the_schema(client, create_user, db_session):
+    from sqlalchemy import select
+    from sqlalchemy.orm import undefer
+
+    from app.db.models import FileUpload
+    from app.main import app
+    from app.schemas.file import FileListItem
+
+    user = create_user("u26@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    file_id = client.post(
+        "/files/upload",
+        files={"file": ("schema.txt", BytesIO(b"Quantori schema"), "text/plain")},
+    ).json()["id"]
+    client.post(f"/comments/file/{file_id}", json={"text": "hi"})
+
+    # The listing builds its JSON without pydantic; it must be what the
+    # response model would have produced from the ORM object.
+    resp = client.get("/files", params={"uploader_id": user.id})
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.headers["etag"]
+    db_session.expire_all()
+    rec = db_session.execute(
+        select(FileUpload)
+        .options(undefer(FileUpload.comment_count))
+        .where(FileUpload.id == file_id)
+    ).scalar_one()
+    expected = FileListItem.model_validate(rec).model_dump(mode="json")
+    assert resp.json()["items"] == [expected]
+
+
+def test_list_files_rejects_invalid_cursor(client):
+    resp = client.get("/files", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_stream_upload_txt(client, create_user):
+    from app.main import app
+
+    user = create_user("u20@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    resp = client.post(
+        "/files/upload/stream",
+        params={"filename": "streamed.txt"},
+        content=b"streamed hello Quantori",
+    )
+    assert resp.status_code == status.HTTP_201_CREATED, resp.text
+    data = resp.json()
+    assert data["valid"] is True
+    assert data["filename"] == "streamed.txt"
+    assert data["uploader"]["email"] == user.email
+
+
+def test_stream_upload_csv_in_chunks(client, create_user):
+    from app.main import app
+
+    user = create_user("u21@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    def body():
+        yield b"User,Company Name,Age\r\n"
+        yield b"Quantori,Acme,30\r\n"
+        for i in range(1000):
+            yield f"user{i},Company {i},{i % 90}\r\n".encode()
+
+    resp = client.post(
+        "/files/upload/stream", params={"filename": "chunks.csv"}, content=body()
+    )
+    assert resp.status_code == status.HTTP_201_CREATED, resp.text
+    data = resp.json()
+    assert data["valid"] is False
+    assert "outside column" in data["reason"]
+
+
+def test_stream_upload_rejects_unstreamable_type(client, create_user):
+    from app.main import app
+
+    user = create_user("u22@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+
+    resp = client.post(
+        "/files/upload/stream", params={"filename": "book.xlsx"}, content=b"PK"
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_upload_size_limit(client, create_user, monkeypatch):
+    from app.api import files as files_api
+    from app.main import app
+
+    user = create_user("u23@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    monkeypatch.setattr(files_api, "MAX_UPLOAD_BYTES", 16)
+    content = b"Quantori is a bit too long for the limit"
+
+    resp = client.post(
+        "/files/upload/stream", params={"filename": "big.txt"}, content=content
+    )
+    assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    # Without Content-Length the limit is enforced while reading the body.
+    resp = client.post(
+        "/files/upload/stream",
+        params={"filename": "big.txt"},
+        content=iter([content[:10], content[10:]]),
+    )
+    assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    resp = client.post(
+        "/files/upload",
+        files={"file": ("big.txt", BytesIO(content), "text/plain")},
+    )
+    assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_multipart_upload_is_read_in_one_pass(client, create_user, monkeypatch):
+    from app.api import files as files_api
+    from app.core import upload
+    from app.main import app
+
+    user = create_user("c14@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    monkeypatch.setattr(upload, "FLUSH_BYTES", 8)
+    content = "Quantori " * 64
+
+    resp = client.post(
+        "/files/upload",
+        files={"file": ("one.txt", BytesIO(content.encode()), "text/plain")},
+    )
+    assert resp.status_code == status.HTTP_201_CREATED, resp.text
+    assert resp.json()["filename"] == "one.txt"
+
+    # The limit is checked while the body is parsed, not after spooling it.
+    monkeypatch.setattr(files_api, "MAX_UPLOAD_BYTES", 100)
+    body = b"".join(
+        [
+            b"--b\r\n",
+            b'Content-Disposition: form-data; name="file"; filename="big.txt"\r\n\r\n',
+            content.encode(),
+            b"\r\n--b--\r\n",
+        ]
+    )
+    read = []
+
+    async def chunks():
+        for at in range(0, len(body), 32):
+            read.append(at)
+            yield body[at : at + 32]
+
+    with pytest.raises(upload.UploadTooLargeError):
+        asyncio.run(
+            upload.receive_upload(
+                "multipart/form-data; boundary=b", chunks(), field="file", max_bytes=100
+            )
+        )
+    assert len(read) < len(body) // 32
+
+    resp = client.post(
+        "/files/upload",
+        files={"file": ("big.txt", BytesIO(body), "text/plain")},
+    )
+    assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    resp = client.post(
+        "/files/upload", content=b"x", headers={"content-type": "text/plain"}
+    )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def _zip(members):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buf.getvalue()
+
+
+def test_batch_upload_with_zip(client, create_user):
+    from app.main import app
+
+    user = create_user("u24@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    archive = _zip(
+        {
+            "docs/inside.txt": b"zipped Quantori",
+            "docs/bad.csv": b"User,Company Name\nQuantori,Acme\n",
+            "docs/readme.pdf": b"%PDF",
+            "docs/": b"",
+        }
+    )
+
+    resp = client.post(
+        "/files/upload/batch",
+        files=[
+            ("files", ("one.txt", BytesIO(b"batch Quantori"), "text/plain")),
+            ("files", ("same.txt", BytesIO(b"batch Quantori"), "text/plain")),
+            ("files", ("pack.zip", BytesIO(archive), "application/zip")),
+            ("files", ("broken.zip", BytesIO(b"not a zip"), "application/zip")),
+        ],
+    )
+    assert resp.status_code == status.HTTP_200_OK, resp.text
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    *lines, summary = (json.loads(line) for line in resp.text.splitlines())
+
+    by_name = {line["filename"]: line for line in lines}
+    assert sorted(line["index"] for line in lines) == list(range(6))
+    assert by_name["one.txt"]["valid"] is True
+    assert by_name["same.txt"]["valid"] is True
+    assert by_name["pack.zip/docs/inside.txt"]["valid"] is True
+    assert by_name["pack.zip/docs/bad.csv"]["valid"] is False
+    assert by_name["pack.zip/docs/readme.pdf"]["error"] == "Unsupported file type"
+    assert by_name["broken.zip"]["error"] == "Not a valid ZIP archive"
+
+    assert summary["created"] == 4
+    assert summary["failed"] == 2
+    ids = summary["ids"]
+    assert ids[4] is None and ids[5] is None
+    listed = {i["id"]: i for i in client.get("/files").json()["items"]}
+    assert listed[ids[2]]["filename"] == "pack.zip/docs/inside.txt"
+    assert listed[ids[3]]["valid"] is False
+
+
+def test_batch_upload_limits(client, create_user, monkeypatch):
+    from app.api import files as files_api
+    from app.core.config import settings
+    from app.main import app
+
+    user = create_user("u25@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = auth_override(user)
+    monkeypatch.setattr(settings, "batch_max_files", 2)
+    archive = _zip({f"{i}.txt": b"Quantori" for i in range(3)})
+
+    resp = client.post(
+        "/files/upload/batch",
+        files=[("files", ("pack.zip", BytesIO(archive), "application/zip"))],
+    )
+    assert resp.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    monkeypatch.setattr(files_api, "MAX_UPLOAD_BYTES", 16)
+    resp = client.post(
+        "/files/upload/batch",
+        files=[
+            ("files", ("big.txt", BytesIO(b"Quantori, but too long"), "text/plain")),
+            ("files", ("ok.txt", BytesIO(b"Quantori"), "text/plain")),
+        ],
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    *lines, summary = (json.loads(line) for line in resp.text.splitlines())
+    lines.sort(key=lambda entry: entry["index"])
+    assert [line["error"] for line in lines] == [
+        "File is larger than 16 bytes",
+        None,
+    ]
+    assert summary["created"] == 1
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from app.validators import registry as registry_module
+from app.validators.base import BaseFileHandler
+from app.validators.constants import ValidationResult
+from app.validators.file_validator import FileValidator
+from app.validators.registry import HandlerRegistry
+
+
+class UpperFileHandler(BaseFileHandler):
+    @classmethod
+    def validate(cls, filepath, **kwargs):
+        return ValidationResult(valid=True, reason="upper")
+
+
+NOT_A_HANDLER = object()
+
+
+def test_app_import_does_not_load_handlers():
+    code = (
+        "import sys, app.main\n"
+        "print(sorted(m for m in ('openpyxl', 'app.validators.handlers') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_registry_loads_handler_on_lookup():
+    registry = HandlerRegistry({"TXT": f"{__name__}:UpperFileHandler"}, group=None)
+    assert ".txt" in registry
+    assert "txt" in registry
+    assert ".csv" not in registry
+    assert list(registry) == [".txt"]
+    assert registry[".TXT"] is UpperFileHandler
+    assert registry.get(".csv") is None
+
+
+def test_registry_rejects_non_handler():
+    registry = HandlerRegistry({".bad": f"{__name__}:NOT_A_HANDLER"}, group=None)
+    with pytest.raises(TypeError):
+        registry[".bad"]
+
+
+def test_registry_entry_points(monkeypatch):
+    def fake_entry_points(group):
+        assert group == "plugins"
+        return [
+            EntryPoint("upper", f"{__name__}:UpperFileHandler", group),
+            EntryPoint(".txt", f"{__name__}:UpperFileHandler", group),
+        ]
+
+    monkeypatch.setattr(registry_module, "entry_points", fake_entry_points)
+    registry = HandlerRegistry(
+        {".txt": "app.validators.handlers:TxtFileHandler"}, group="plugins"
+    )
+    assert registry[".upper"] is UpperFileHandler
+    assert registry[".txt"] is not UpperFileHandler
+
+
+def test_validate_file_uses_registered_handler(tmp_path):
+    p = tmp_path / "a.upper"
+    p.write_text("anything")
+    assert FileValidator.validate_file(str(p)).reason == "Unsupported file type"
+
+    FileValidator.file_handlers.register(".upper", UpperFileHandler)
+    try:
+        assert FileValidator.validate_file(str(p)).reason == "upper"
+    finally:
+        FileValidator.file_handlers.unregister(".upper")
+
+
+def test_streaming_handler_needs_validate_stream():
+    with pytest.raises(TypeError):
+
+        class HalfStreamingHandler(UpperFileHandler):
+            supports_streaming = True
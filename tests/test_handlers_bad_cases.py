@@ -93,3 +93,68 @@ def test_txt_streaming_overlap_at_chunk_boundary(tmp_path):
     res = handlers.TxtFileHandler.validate(str(p), chunk_size=8, encoding="utf-8")
     assert res.valid is True
     assert "found in text" in res.reason
+
+
+def test_csv_stops_reading_at_first_violation(tmp_path, monkeypatch):
+    word = TARGET_WORD
+    rows = [{"User": word, "Company Name": "Acme", "Age": "30"}]
+    rows += [{"User": f"u{i}", "Company Name": "Other", "Age": "1"} for i in range(500)]
+    p = write_csv(tmp_path, rows=rows)
+
+    from app.validators import handlers
+
+    seen = []
+    original = handlers.normalize_row
+
+    def counting_normalize_row(row):
+        seen.append(row)
+        return original(row)
+
+    monkeypatch.setattr(handlers, "normalize_row", counting_normalize_row)
+    res = FileValidator.validate_file(p)
+    assert res.valid is False
+    assert "outside column" in res.reason
+    assert len(seen) == 1
+
+
+def test_csv_short_and_blank_rows(tmp_path):
+    p = tmp_path / "ragged.csv"
+    p.write_text(
+        f"User,Company Name,Age\n\nIvan,{TARGET_WORD} LLC\nOleg\n", encoding="utf-8"
+    )
+    res = FileValidator.validate_file(str(p))
+    assert res.valid is True
+
+
+def test_xlsx_word_in_unnamed_column_is_invalid(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["User", "Company Name", None])
+    ws.append(["Ivan", f"{TARGET_WORD} LLC", None])
+    ws.append([None, None, None])
+    ws.append(["Oleg", "Other", f"x {TARGET_WORD} y"])
+    p = tmp_path / "unnamed.xlsx"
+    wb.save(p)
+
+    res = FileValidator.validate_file(str(p))
+    assert res.valid is False
+    assert "outside column" in res.reason
+
+
+def test_xlsx_reads_only_first_sheet(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["User", "Company Name", "Age"])
+    ws.append(["Ivan", f"{TARGET_WORD} LLC", 30])
+    other = wb.create_sheet("Other")
+    other.append(["User", "Company Name"])
+    other.append([TARGET_WORD, "Acme"])
+    p = tmp_path / "sheets.xlsx"
+    wb.save(p)
+
+    res = FileValidator.validate_file(str(p))
+    assert res.valid is True
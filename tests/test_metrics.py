@@ -0,0 +1,118 @@
+from io import BytesIO
+
+import pytest
+from fastapi import status
+
+from app.core import metrics
+from app.core.metrics import Counter, Histogram, MetricsRegistry, TimedIterator
+from app.core.security import get_current_user as app_get_current_user
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+from app.validators.handlers import CsvFileHandler
+
+
+@pytest.fixture
+def metrics_on(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", True)
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    hist = registry.register(Histogram("t_seconds", "Timing.", ("stage",), (0.1, 1)))
+    counter = registry.register(Counter("t_total", "Count.", ("kind",)))
+    hist.observe(0.05, stage="a")
+    hist.observe(0.5, stage="a")
+    hist.observe(5, stage="a")
+    counter.inc(3, kind='say "hi"')
+
+    assert registry.render().splitlines() == [
+        "# HELP t_seconds Timing.",
+        "# TYPE t_seconds histogram",
+        't_seconds_bucket{stage="a",le="0.1"} 1',
+        't_seconds_bucket{stage="a",le="1.0"} 2',
+        't_seconds_bucket{stage="a",le="+Inf"} 3',
+        't_seconds_sum{stage="a"} 5.55',
+        't_seconds_count{stage="a"} 3',
+        "# HELP t_total Count.",
+        "# TYPE t_total counter",
+        't_total{kind="say \\"hi\\""} 3',
+    ]
+    with pytest.raises(ValueError):
+        registry.register(Counter("t_total", "Again."))
+
+
+def test_timed_iterator_counts_items():
+    timed = TimedIterator(iter("abc"))
+    assert list(timed) == ["a", "b", "c"]
+    assert timed.count == 3
+    assert timed.seconds >= 0
+
+
+def test_handler_stats_only_when_enabled(tmp_path, monkeypatch):
+    p = tmp_path / "a.csv"
+    p.write_text(f"User,{COMPANY_NAME_COL}\nu,{TARGET_WORD}\nv,Acme\n")
+    assert CsvFileHandler.validate(str(p)).stats == {}
+
+    monkeypatch.setattr(metrics, "enabled", True)
+    stats = CsvFileHandler.validate(str(p)).stats
+    assert stats["rows"] == 3
+    assert 0 <= stats["parse_seconds"] <= stats["seconds"]
+
+
+def test_metrics_endpoint_disabled(client):
+    assert client.get("/metrics").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_upload_records_stage_metrics(client, create_user, monkeypatch, metrics_on):
+    from app.api import files as files_api
+    from app.core.workers import ValidationPool
+    from app.main import app
+
+    user = create_user("metrics@example.com", "pass")
+    app.dependency_overrides[app_get_current_user] = lambda: user
+    pool = ValidationPool(kind="thread", max_workers=1, queue_size=0, timeout=5)
+    monkeypatch.setattr(files_api, "validation_pool", pool)
+    uploads = metrics.UPLOADS.value(file_type="csv", valid="true")
+    body = f"User,{COMPANY_NAME_COL}\nmetrics,{TARGET_WORD} LLC\n".encode()
+    try:
+        resp = client.post(
+            "/files/upload", files={"file": ("m.csv", BytesIO(body), "text/csv")}
+        )
+    finally:
+        pool.shutdown()
+    assert resp.status_code == status.HTTP_201_CREATED, resp.text
+
+    resp = client.get("/metrics")
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    for stage in ("receive", "copy", "cache", "pool", "validate", "parse", "db_insert"):
+        assert metrics.STAGE_SECONDS.count(stage=stage, file_type="csv") >= 1, stage
+        assert f'stage="{stage}",file_type="csv",le="+Inf"' in resp.text
+    assert metrics.UPLOADS.value(file_type="csv", valid="true") == uploads + 1
+    assert 'file_validator_rows_total{file_type="csv"}' in resp.text
+    assert 'file_validator_upload_bytes_total{file_type="csv"}' in resp.text
+
+
+def test_token_cache_lookups_are_exported(client, create_user, metrics_on):
+    from app.core.security import token_cache
+
+    create_user("metrics-auth@example.com", "secret123")
+    resp = client.post(
+        "/auth/login",
+        json={"email": "metrics-auth@example.com", "password": "secret123"},
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    token_cache.clear()
+    hits = metrics.AUTH_CACHE_HITS.value()
+    misses = metrics.AUTH_CACHE_MISSES.value()
+
+    for _ in range(3):
+        resp = client.post(
+            "/comments/file/999999", json={"text": "hi"}, headers=headers
+        )
+        assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+    assert metrics.AUTH_CACHE_HITS.value() == hits + 2
+    assert metrics.AUTH_CACHE_MISSES.value() == misses + 1
+    text = client.get("/metrics").text
+    assert f"file_validator_auth_cache_hits_total {hits + 2}" in text
+    assert f"file_validator_auth_cache_misses_total {misses + 1}" in text
@@ -0,0 +1,148 @@
+import csv
+import time
+
+import pytest
+
+from app.validators import parallel
+from app.validators.constants import COMPANY_NAME_COL, TARGET_WORD
+from app.validators.handlers import CsvFileHandler, TxtFileHandler
+from app.validators.parallel import run_ranges, split_ranges
+
+PARALLEL = {"parallel": True, "workers": 2, "parallel_min_bytes": 0}
+
+
+def _quick_or_wait_for_cancel(start: int, end: int) -> bool:
+    if start == 0:
+        return True
+    deadline = time.monotonic() + 10
+    while not parallel.cancelled() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize(("start", "end", "parts"), [(0, 10, 3), (5, 6, 4), (0, 0, 2)])
+def test_split_ranges_cover_the_span(start, end, parts):
+    ranges = split_ranges(start, end, parts)
+    assert len(ranges) <= parts
+    assert [lo for lo, _ in ranges] == sorted(lo for lo, _ in ranges)
+    covered = [i for lo, hi in ranges for i in range(lo, hi)]
+    assert covered == list(range(start, end))
+
+
+def test_decisive_result_cancels_running_ranges():
+    began = time.monotonic()
+    results = run_ranges(
+        _quick_or_wait_for_cancel,
+        split_ranges(0, 8, 8),
+        workers=2,
+        decisive=bool,
+    )
+    assert results == [True]
+    assert time.monotonic() - began < 5
+
+
+def write_txt(tmp_path, text: str) -> str:
+    p = tmp_path / "big.txt"
+    p.write_text(text, encoding="utf-8")
+    return str(p)
+
+
+@pytest.mark.parametrize("position", [0, 499, 5000, 9990])
+def test_txt_parallel_matches_sequential(tmp_path, position):
+    filler = "lorem ipsum " * 1000
+    path = write_txt(tmp_path, filler[:position] + TARGET_WORD + filler[position:])
+    sequential = TxtFileHandler.validate(path, workers=1, mmap_chunk_size=64)
+    in_parallel = TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL)
+    assert sequential.valid is in_parallel.valid is True
+    assert (
+        in_parallel.matches == sequential.matches == {TARGET_WORD.casefold(): position}
+    )
+
+
+def test_txt_parallel_deny_word(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "deny_words", ("Secret",))
+    filler = "lorem ipsum " * 1000
+    path = write_txt(tmp_path, TARGET_WORD + filler + "SECRET" + filler)
+    res = TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL)
+    assert res.valid is False
+    assert res.matches == {"secret": len(TARGET_WORD) + len(filler)}
+
+
+def test_txt_parallel_no_match(tmp_path):
+    path = write_txt(tmp_path, "lorem ipsum " * 1000)
+    res = TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL)
+    assert res.valid is False
+    assert "not found" in res.reason
+
+
+def test_txt_parallel_is_opt_in(tmp_path, monkeypatch):
+    from app.validators import handlers
+
+    def refuse(*args, **kwargs):
+        raise AssertionError("scanned in parallel")
+
+    monkeypatch.setattr(handlers, "run_ranges", refuse)
+    path = write_txt(tmp_path, "lorem ipsum " * 1000 + TARGET_WORD)
+    assert TxtFileHandler.validate(path, workers=2, parallel_min_bytes=0).valid
+    # Jobs of a process validation pool never start scan workers of their own.
+    monkeypatch.setattr(parallel, "_in_job_process", True)
+    assert TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL).valid
+
+
+def test_scans_share_one_pool(tmp_path):
+    path = write_txt(tmp_path, "lorem ipsum " * 1000)
+    TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL)
+    pool = parallel._get_pool()
+    TxtFileHandler.validate(path, mmap_chunk_size=64, **PARALLEL)
+    assert parallel._get_pool() is pool
+    assert parallel._free_slots.qsize() == parallel.MAX_SCANS
+
+
+def test_validation_process_pool_does_not_fork():
+    from app.core.workers import ValidationPool
+
+    pool = ValidationPool(kind="process", max_workers=1, queue_size=0, timeout=30)
+    try:
+        future = pool.submit(parallel.in_job_process)
+        assert future.result(timeout=30) is True
+        assert pool._executor._mp_context.get_start_method() != "fork"
+    finally:
+        pool.shutdown()
+
+
+def write_rows(tmp_path, rows, header=("User", COMPANY_NAME_COL, "Age")) -> str:
+    p = tmp_path / "big.csv"
+    with p.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(p)
+
+
+def filler_rows(n: int) -> list[list[str]]:
+    return [[f"user{i}", f"Company {i % 7}", str(i % 90)] for i in range(n)]
+
+
+@pytest.mark.parametrize(
+    ("row", "valid", "reason"),
+    [
+        (["u", f"{TARGET_WORD} LLC", "1"], True, "found in column"),
+        (["u", "Acme", f"{TARGET_WORD}"], False, "outside column"),
+        (["u", "Acme", "1"], False, "not found in column"),
+    ],
+)
+def test_csv_parallel_matches_sequential(tmp_path, row, valid, reason):
+    rows = filler_rows(2000)
+    rows.insert(1500, row)
+    path = write_rows(tmp_path, rows)
+    sequential = CsvFileHandler.validate(path, parallel=False)
+    in_parallel = CsvFileHandler.validate(path, batch_size=64, **PARALLEL)
+    assert sequential == in_parallel
+    assert in_parallel.valid is valid
+    assert reason in in_parallel.reason
+
+
+def test_csv_parallel_falls_back_without_company_column(tmp_path):
+    path = write_rows(tmp_path, filler_rows(100), header=("User", "Company", "Age"))
+    res = CsvFileHandler.validate(path, **PARALLEL)
+    assert "Missing column" in res.reason
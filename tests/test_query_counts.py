@@ -0,0 +1,132 @@
+from io import BytesIO
+
+import pytest
+from fastapi import status
+from sqlalchemy import event
+
+from app.core.security import get_current_user as app_get_current_user
+from app.validators.cache import validation_cache
+
+
+@pytest.fixture
+def statements(test_engine, monkeypatch):
+    # SQL statement verbs sent to the database; the validation cache is off
+    # so uploads only touch the files table. Each successful write also bumps
+    # its listing revision (one UPDATE on the revisions table).
+    monkeypatch.setattr(validation_cache, "enabled", False)
+    seen: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement.split(None, 1)[0].upper())
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+def act_as(db_session, user):
+    # A request session starts with the authenticated user loaded, as
+    # get_current_user leaves it; the shared test session has expired it.
+    from app.main import app
+
+    db_session.refresh(user)
+    app.dependency_overrides[app_get_current_user] = lambda: user
+
+
+def test_upload_statements(client, create_user, db_session, statements):
+    user = create_user("q1@example.com", "pass")
+    email = user.email
+    act_as(db_session, user)
+    statements.clear()
+    resp = client.post(
+        "/files/upload",
+        files={"file": ("q.txt", BytesIO(b"Quantori counts"), "text/plain")},
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert resp.json()["uploader"]["email"] == email
+    assert resp.json()["comments"] == []
+    assert statements == ["INSERT", "UPDATE"]
+
+    act_as(db_session, user)
+    statements.clear()
+    resp = client.post(
+        "/files/upload/stream", params={"filename": "q.txt"}, content=b"Quantori"
+    )
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert statements == ["INSERT", "UPDATE"]
+
+
+def test_comment_write_statements(client, create_user, db_session, statements):
+    owner = create_user("q2@example.com", "pass")
+    other = create_user("q3@example.com", "pass")
+    email = owner.email
+    act_as(db_session, owner)
+    file_id = client.post(
+        "/files/upload/stream", params={"filename": "c.txt"}, content=b"Quantori"
+    ).json()["id"]
+
+    act_as(db_session, owner)
+    statements.clear()
+    resp = client.post(f"/comments/file/{file_id}", json={"text": "first"})
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert resp.json()["author"]["email"] == email
+    assert statements == ["INSERT", "UPDATE"]
+    comment_id = resp.json()["id"]
+
+    act_as(db_session, owner)
+    statements.clear()
+    resp = client.patch(f"/comments/{comment_id}", json={"text": "edited"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["text"] == "edited"
+    assert resp.json()["author"]["email"] == email
+    assert statements == ["UPDATE", "UPDATE"]
+
+    # Failure paths may look the row up once more.
+    act_as(db_session, other)
+    statements.clear()
+    resp = client.patch(f"/comments/{comment_id}", json={"text": "hacked"})
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+    assert statements == ["UPDATE", "UPDATE", "SELECT"]
+
+    statements.clear()
+    resp = client.post("/comments/file/999999", json={"text": "orphan"})
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
+    assert statements == ["INSERT"]
+
+
+def test_batch_upload_statements(client, create_user, db_session, statements):
+    user = create_user("q5@example.com", "pass")
+    act_as(db_session, user)
+    statements.clear()
+    resp = client.post(
+        "/files/upload/batch",
+        files=[
+            ("files", (f"{i}.txt", BytesIO(b"Quantori %d" % i), "text/plain"))
+            for i in range(5)
+        ],
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.text.splitlines()[-1].startswith('{"ids"')
+    # One transaction and one revision bump for the whole batch. SQLite has
+    # no ordered RETURNING, so the ORM inserts the rows one by one.
+    assert statements == ["INSERT"] * 5 + ["UPDATE"]
+
+
+def test_bulk_comments_statements(client, create_user, db_session, statements):
+    user = create_user("q6@example.com", "pass")
+    act_as(db_session, user)
+    file_ids = []
+    for i in range(3):
+        resp = client.post(
+            "/files/upload",
+            files={"file": (f"{i}.txt", BytesIO(b"Quantori"), "text/plain")},
+        )
+        file_ids.append(resp.json()["id"])
+        act_as(db_session, user)
+        client.post(f"/comments/file/{file_ids[-1]}", json={"text": "hi"})
+    statements.clear()
+    resp = client.get("/comments", params={"file_id": file_ids})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [len(f["comments"]) for f in resp.json()["files"]] == [1, 1, 1]
+    # The revisions for the ETag, then every file's comments and authors.
+    assert statements == ["SELECT", "SELECT"]
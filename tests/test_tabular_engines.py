@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from app.validators.constants import TARGET_WORD, Violation
+from app.validators.handlers import (
+    CsvFileHandler,
+    XlsxFileHandler,
+    iter_records,
+    report_tabular_violations,
+    validate_tabular_columns,
+    validate_tabular_data,
+)
+
+WORD = TARGET_WORD.casefold()
+
+CASES = {
+    "valid": [
+        ["User", "Company Name"],
+        ["Ivan", f"  {TARGET_WORD} LLC "],
+        ["Oleg", "Other"],
+    ],
+    "outside": [["User", "Company Name"], ["Ivan", "Acme"], [TARGET_WORD, "Acme"]],
+    "not_found": [["User", "Company Name"], ["Ivan", "Acme"]],
+    "missing_column": [["User", "Age"], ["Ivan", "1"]],
+    "header_only": [["User", "Company Name"]],
+    "empty": [],
+    "blank_rows": [["User", "Company Name"], [], ["Ivan", TARGET_WORD], []],
+    "surplus_cells": [["User", "Company Name"], ["Ivan", TARGET_WORD, TARGET_WORD]],
+    "short_rows": [
+        ["User", "Age", "Company Name"],
+        ["Ivan"],
+        ["Oleg", "1", TARGET_WORD],
+    ],
+    "duplicate_header": [
+        ["Company Name", "User", "Company Name"],
+        [TARGET_WORD, "Ivan", "Acme"],
+    ],
+    "non_str_cells": [["User", "Company Name", 5], [None, TARGET_WORD, 3.5]],
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+@pytest.mark.parametrize("batch_size", [1, 2, 4096])
+def test_columns_engine_matches_rows_engine(name, batch_size):
+    rows = CASES[name]
+    expected = validate_tabular_data(iter_records(rows), WORD)
+    actual = validate_tabular_columns(rows, WORD, batch_size=batch_size)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("name", CASES)
+@pytest.mark.parametrize("batch_size", [1, 2, 4096])
+def test_report_mode_keeps_the_verdict(name, batch_size):
+    rows = CASES[name]
+    expected = validate_tabular_data(iter_records(rows), WORD)
+    actual = report_tabular_violations(
+        rows, WORD, max_violations=10, batch_size=batch_size
+    )
+    assert (actual.valid, actual.reason) == (expected.valid, expected.reason)
+
+
+@pytest.mark.parametrize("batch_size", [1, 4096])
+def test_report_mode_lists_violations_up_to_the_cap(batch_size):
+    rows = [
+        ["User", "Company Name", "Note"],
+        [TARGET_WORD, f"{TARGET_WORD} LLC", ""],
+        [],
+        ["Ivan", "Acme", f"ask {TARGET_WORD}"],
+        ["Oleg", "Acme", "", f"{TARGET_WORD}!"],
+        [TARGET_WORD, "Acme", TARGET_WORD],
+    ]
+    result = report_tabular_violations(
+        rows, WORD, max_violations=3, batch_size=batch_size
+    )
+    assert result.valid is False
+    assert result.violation_count == 5
+    assert result.violations == [
+        Violation(2, "User", TARGET_WORD),
+        Violation(4, "Note", f"ask {TARGET_WORD}"),
+        Violation(5, None, f"{TARGET_WORD}!"),
+    ]
+
+
+def test_report_mode_numbers_xlsx_rows_as_in_the_sheet(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["User", "Company Name"])
+    ws.append(["Ivan", "Acme"])
+    ws.append([None, None])
+    ws.append(["x" * 300 + TARGET_WORD, "Acme"])
+    p = tmp_path / "report.xlsx"
+    wb.save(p)
+
+    result = XlsxFileHandler.validate(str(p), max_violations=10)
+    assert result.violation_count == 1
+    (violation,) = result.violations
+    assert violation.row == 4
+    assert violation.snippet.startswith("…") and violation.snippet.endswith(TARGET_WORD)
+    assert len(violation.snippet) == 121
+
+
+@pytest.mark.parametrize(
+    ("filename", "handler"),
+    [
+        ("valid.csv", CsvFileHandler),
+        ("invalid.csv", CsvFileHandler),
+        ("valid.xlsx", XlsxFileHandler),
+        ("invalid.xlsx", XlsxFileHandler),
+    ],
+)
+def test_engine_is_selectable_per_call(uploads_dir, filename, handler):
+    path = os.path.join(uploads_dir, filename)
+    assert handler.validate(path, engine="columns") == handler.validate(
+        path, engine="rows"
+    )
+
+
+def test_unknown_engine_is_rejected(uploads_dir):
+    with pytest.raises(ValueError, match="Unknown tabular engine"):
+        CsvFileHandler.validate(os.path.join(uploads_dir, "valid.csv"), engine="nope")
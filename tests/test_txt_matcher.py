@@ -0,0 +1,162 @@
+import pytest
+
+from app.validators.constants import TARGET_WORD
+from app.validators.handlers import TxtFileHandler
+from app.validators.matcher import Match, MultiPatternMatcher
+
+
+def chunked(text: str, size: int) -> list[tuple[int, str]]:
+    chunks, offset = [], 0
+    for i in range(0, len(text), size):
+        part = text[i : i + size]
+        chunks.append((offset, part))
+        offset += len(part.encode())
+    return chunks
+
+
+def test_matcher_reports_first_offset_of_each_pattern():
+    text = "xx Beta alpha ALPHA gamma"
+    matcher = MultiPatternMatcher(["alpha", "beta", "delta"])
+    assert list(matcher.scan(chunked(text, 1000))) == [
+        Match("beta", 3),
+        Match("alpha", 8),
+    ]
+
+
+def test_matcher_reports_overlapping_patterns():
+    matcher = MultiPatternMatcher(["abc", "ab", "bcd"])
+    assert sorted(matcher.scan([(0, "xabcd")])) == [
+        Match("ab", 1),
+        Match("abc", 1),
+        Match("bcd", 2),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 64])
+def test_matcher_finds_patterns_across_chunk_boundaries(size):
+    text = "żółw " * 3 + "Needle and HAYSTACK"
+    matcher = MultiPatternMatcher(["needle", "haystack"])
+    offsets = {m.pattern: m.offset for m in matcher.scan(chunked(text, size))}
+    raw = text.encode()
+    assert offsets == {
+        "needle": raw.index(b"Needle"),
+        "haystack": raw.index(b"HAYSTACK"),
+    }
+
+
+def test_matcher_offsets_survive_casefold_expansion():
+    text = "Straße then target"
+    matcher = MultiPatternMatcher(["strasse", "target"])
+    assert dict(matcher.scan([(0, text)])) == {
+        "strasse": 0,
+        "target": text.encode().index(b"target"),
+    }
+
+
+@pytest.mark.parametrize("size", [1, 3, 64])
+def test_scan_bytes_finds_patterns_across_windows(size):
+    data = "żółw Needle and HAYSTACK".encode()
+    matcher = MultiPatternMatcher(["needle", "haystack"])
+    assert dict(matcher.scan_bytes(data, chunk_size=size)) == {
+        "needle": data.index(b"Needle"),
+        "haystack": data.index(b"HAYSTACK"),
+    }
+
+
+def test_txt_mmap_handles_empty_file(tmp_path):
+    p = tmp_path / "empty.txt"
+    p.write_bytes(b"")
+    res = TxtFileHandler.validate(str(p), mmap=True)
+    assert res.valid is False
+
+
+def test_txt_non_ascii_target_uses_text_path(tmp_path, monkeypatch):
+    def no_mmap(*args, **kwargs):
+        raise AssertionError("mmap scan used for a non-ASCII word")
+
+    monkeypatch.setattr(TxtFileHandler, "_scan_mmap", no_mmap)
+    monkeypatch.setattr(TxtFileHandler, "target_words", ("Żółw",))
+    p = tmp_path / "turtle.txt"
+    p.write_text("a ŻÓŁW here", encoding="utf-8")
+    res = TxtFileHandler.validate(str(p), mmap=True)
+    assert res.matches == {"żółw": 2}
+
+
+def test_txt_mmap_and_text_paths_agree(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "target_words", (TARGET_WORD, "Acme"))
+    monkeypatch.setattr(TxtFileHandler, "deny_words", ("Secret",))
+    p = tmp_path / "agree.txt"
+    p.write_text(f"żółw ACME, {TARGET_WORD.upper()} und Straße", encoding="utf-8")
+    by_mmap = TxtFileHandler.validate(str(p), mmap=True, mmap_chunk_size=5)
+    by_text = TxtFileHandler.validate(str(p), mmap=False, chunk_size=5)
+    assert by_mmap == by_text
+    assert by_mmap.valid is True
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_txt_bom_offsets_count_from_file_start(tmp_path, size):
+    p = tmp_path / "bom.txt"
+    p.write_text(f"żółw {TARGET_WORD}", encoding="utf-8-sig")
+    raw = p.read_bytes()
+    expected = {TARGET_WORD.casefold(): raw.index(TARGET_WORD.encode())}
+
+    by_text = TxtFileHandler.validate(
+        str(p), mmap=False, chunk_size=size, encoding="utf-8-sig"
+    )
+    assert by_text.matches == expected
+    by_mmap = TxtFileHandler.validate(
+        str(p), mmap=True, mmap_chunk_size=size, encoding="utf-8-sig"
+    )
+    assert by_mmap.matches == expected
+    matcher = MultiPatternMatcher([TARGET_WORD])
+    assert dict(matcher.scan([(3, raw[3:].decode())], encoding="utf-8-sig")) == expected
+
+
+def test_txt_extra_target_words(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "target_words", (TARGET_WORD, "Acme"))
+    p = tmp_path / "extra.txt"
+    p.write_text("hello from acme", encoding="utf-8")
+    res = TxtFileHandler.validate(str(p), chunk_size=4)
+    assert res.valid is True
+    assert res.matches == {"acme": 11}
+    assert "'Acme' (byte 11)" in res.reason
+
+
+def test_txt_deny_word_invalidates_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "deny_words", ("Secret",))
+    p = tmp_path / "denied.txt"
+    p.write_text(f"{TARGET_WORD} first, then a SECRET", encoding="utf-8")
+    res = TxtFileHandler.validate(str(p), chunk_size=7)
+    assert res.valid is False
+    assert "Denied word 'Secret'" in res.reason
+    assert res.matches == {"secret": p.read_bytes().index(b"SECRET")}
+
+
+def test_txt_deny_list_reports_every_target(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "target_words", (TARGET_WORD, "Acme"))
+    monkeypatch.setattr(TxtFileHandler, "deny_words", ("Secret",))
+    p = tmp_path / "both.txt"
+    p.write_text(f"acme and {TARGET_WORD}", encoding="utf-8")
+    res = TxtFileHandler.validate(str(p))
+    assert res.valid is True
+    assert res.matches == {"acme": 0, TARGET_WORD.casefold(): 9}
+
+
+def test_txt_none_of_the_targets(tmp_path, monkeypatch):
+    monkeypatch.setattr(TxtFileHandler, "target_words", (TARGET_WORD, "Acme"))
+    p = tmp_path / "none.txt"
+    p.write_text("nothing here", encoding="utf-8")
+    res = TxtFileHandler.validate(str(p))
+    assert res.valid is False
+    assert res.reason.startswith("None of the words")
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_txt_stream_matches_file_validation(tmp_path, size):
+    data = ("añb " * 50 + TARGET_WORD + " tail").encode()
+    p = tmp_path / "s.txt"
+    p.write_bytes(data)
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    streamed = TxtFileHandler.validate_stream(chunks)
+    assert streamed.valid is True
+    assert streamed.matches == TxtFileHandler.validate(str(p)).matches
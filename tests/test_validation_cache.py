@@ -0,0 +1,76 @@
+import hashlib
+from io import BytesIO
+
+from app.validators import cache as cache_module
+from app.validators.cache import ValidationCache, cache_key, copy_and_hash
+from app.validators.constants import ValidationResult
+
+
+def test_copy_and_hash_copies_content():
+    src = BytesIO(b"x" * 10_000)
+    dst = BytesIO()
+    digest = copy_and_hash(src, dst, chunk_size=4096)
+    assert dst.getvalue() == b"x" * 10_000
+    assert digest == hashlib.sha256(b"x" * 10_000).hexdigest()
+
+
+def test_lru_evicts_least_recently_used(db_session):
+    cache = ValidationCache(max_entries=2)
+    a, b, c = (cache_key(h, ".txt") for h in ("lru-a", "lru-b", "lru-c"))
+    cache._remember(a, ValidationResult(True, "a"))
+    cache._remember(b, ValidationResult(True, "b"))
+    assert cache._lookup(a) is not None
+    cache._remember(c, ValidationResult(True, "c"))
+    assert len(cache) == 2
+    assert cache._lookup(b) is None
+    assert cache._lookup(a) is not None
+
+
+def test_persistent_entries_survive_memory_clear(db_session):
+    cache = ValidationCache(max_entries=10)
+    key = cache_key("persisted", ".csv")
+    cache.put(db_session, key, ValidationResult(False, "nope"))
+    cache.put(db_session, key, ValidationResult(False, "nope"))
+    db_session.commit()
+
+    cache.clear()
+    assert cache.get(db_session, key) == ValidationResult(False, "nope")
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cached_results_keep_their_matches(db_session):
+    cache = ValidationCache(max_entries=10)
+    key = cache_key("matches", ".txt")
+    result = ValidationResult(True, "ok", {"Kyiv": 2, "Lviv": 1})
+    cache.put(db_session, key, result)
+    db_session.commit()
+
+    assert cache.get(db_session, key) == result
+    cache.clear()
+    assert cache.get(db_session, key) == result
+
+
+def test_settings_change_invalidates_entries(db_session, monkeypatch):
+    cache = ValidationCache(max_entries=10)
+    key = cache_key("settings", ".csv")
+    cache.put(db_session, key, ValidationResult(True, "ok"))
+    db_session.commit()
+
+    monkeypatch.setattr(cache_module, "TARGET_WORD", "AnotherWord")
+    assert cache.get(db_session, cache_key("settings", ".csv")) is None
+    assert cache.misses == 1
+
+
+def test_disabled_cache_never_hits(db_session):
+    cache = ValidationCache(max_entries=10, enabled=False)
+    key = cache_key("disabled", ".txt")
+    cache.put(db_session, key, ValidationResult(True, "ok"))
+    assert cache.get(db_session, key) is None
+
+
+def test_key_depends_on_txt_word_lists(monkeypatch):
+    base = cache_key("words", ".txt")
+    monkeypatch.setattr(cache_module, "TXT_DENY_WORDS", ("secret",))
+    denied = cache_key("words", ".txt")
+    assert denied.target_word != base.target_word
+    assert denied.target_word.startswith(base.target_word)